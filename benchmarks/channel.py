@@ -0,0 +1,366 @@
+
+# End-to-end throughput / latency benchmark: drives a Channel against a local
+# stub server at a fixed offered load, for every query type, event loop
+# integration and API mode, and writes the results as JSON.
+#
+#   python benchmarks/channel.py --qps 2000 --duration 2 -o before.json
+#   python benchmarks/compare.py before.json after.json
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import platform
+import select
+import selectors
+import socket
+import subprocess
+import sys
+import time
+
+import pycares
+from pycares.stats import ChannelStats, LatencyHistogram
+from pycares.testing import StubServer, Zone, dns
+
+
+_clock = time.perf_counter
+_cpu_clock = getattr(time, 'thread_time', time.process_time)
+
+ZONE = 'bench.test'
+
+RECORDS = {
+    'A': [(dns.TYPE_A, '192.0.2.%d' % i) for i in range(1, 5)],
+    'AAAA': [(dns.TYPE_AAAA, '2001:db8::%d' % i) for i in range(1, 5)],
+    'CNAME': [(dns.TYPE_CNAME, 'target.' + ZONE)],
+    'MX': [(dns.TYPE_MX, (10 * i, 'mx%d.%s' % (i, ZONE))) for i in range(1, 3)],
+    'NAPTR': [(dns.TYPE_NAPTR, (100, 10, 'S', 'SIP+D2U', '', '_sip._udp.' + ZONE))],
+    'NS': [(dns.TYPE_NS, 'ns%d.%s' % (i, ZONE)) for i in range(1, 3)],
+    'PTR': [(dns.TYPE_PTR, 'host.' + ZONE)],
+    'SOA': [(dns.TYPE_SOA, ('ns1.' + ZONE, 'hostmaster.' + ZONE, 1, 3600, 600, 86400, 300))],
+    'SRV': [(dns.TYPE_SRV, (10, 5, 5060, 'sip%d.%s' % (i, ZONE))) for i in range(1, 3)],
+    'TXT': [(dns.TYPE_TXT, 'v=spf1 include:_spf.%s ~all' % ZONE)],
+}
+
+TYPES = sorted(RECORDS)
+LOOPS = ('select', 'selectors', 'asyncio')
+MODES = ('query', 'search', 'gethostbyname', 'stats')
+
+
+def make_zone():
+    zone = Zone()
+    for name, records in RECORDS.items():
+        for rtype, value in records:
+            zone.add('%s.%s' % (name.lower(), ZONE), rtype, value)
+    zone.add('target.' + ZONE, dns.TYPE_A, '192.0.2.100')
+    return zone
+
+
+def supported(mode, qtype):
+    return mode != 'gethostbyname' or qtype in ('A', 'AAAA')
+
+
+def rss():
+    # Current resident set size in bytes, peak RSS where /proc is not available.
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+
+class Load:
+    # Open loop load generator: query i is submitted at start + i / qps, whether
+    # or not earlier queries have completed.
+
+    def __init__(self, mode, qtype, qps, duration):
+        self.mode = mode
+        self.qtype = qtype
+        self.name = '%s.%s' % (qtype.lower(), ZONE)
+        self.interval = 1.0 / qps
+        self.total = max(1, int(qps * duration))
+        self.sent = 0
+        self.completed = 0
+        self.errors = {}
+        self.histogram = LatencyHistogram()
+        self.started = None
+        self.channel = None
+
+    def channel_options(self):
+        options = {'timeout': 1.0, 'tries': 2}
+        if self.mode == 'gethostbyname':
+            options['lookups'] = 'b'
+        elif self.mode == 'stats':
+            options['stats'] = ChannelStats()
+        return options
+
+    @property
+    def finished(self):
+        return self.completed == self.total
+
+    def start(self, channel):
+        self.channel = channel
+        self.started = _clock()
+
+    def _submit(self):
+        callback = functools.partial(self._done, _clock())
+        if self.mode == 'gethostbyname':
+            family = socket.AF_INET if self.qtype == 'A' else socket.AF_INET6
+            self.channel.gethostbyname(self.name, family, callback)
+        else:
+            query_type = getattr(pycares, 'QUERY_TYPE_' + self.qtype)
+            if self.mode == 'search':
+                self.channel.search(self.name, query_type, callback)
+            else:
+                self.channel.query(self.name, query_type, callback)
+        self.sent += 1
+
+    def _done(self, started, result, error):
+        self.histogram.record(_clock() - started)
+        self.completed += 1
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def pump(self):
+        # Submit every query which is due and return the delay until the next
+        # one, or None once all of them were submitted.
+        if self.sent == self.total:
+            return None
+        elapsed = _clock() - self.started
+        due = min(self.total, int(elapsed / self.interval) + 1)
+        while self.sent < due:
+            self._submit()
+        if self.sent == self.total:
+            return None
+        return max(0.0, self.sent * self.interval - elapsed)
+
+
+def _min_timeout(*timeouts):
+    timeouts = [t for t in timeouts if t is not None]
+    return min(timeouts) if timeouts else None
+
+
+def run_select(load, options):
+    channel = pycares.Channel(**options)
+    load.start(channel)
+    while not load.finished:
+        delay = load.pump()
+        read_fds, write_fds = channel.getsock()
+        if not read_fds and not write_fds:
+            time.sleep(delay if delay is not None else 0.001)
+            continue
+        timeout = _min_timeout(channel.timeout(), delay)
+        rlist, wlist, _ = select.select(read_fds, write_fds, [], timeout)
+        if not rlist and not wlist:
+            channel.process_fd(pycares.ARES_SOCKET_BAD, pycares.ARES_SOCKET_BAD)
+            continue
+        for fd in rlist:
+            channel.process_fd(fd, pycares.ARES_SOCKET_BAD)
+        for fd in wlist:
+            channel.process_fd(pycares.ARES_SOCKET_BAD, fd)
+
+
+def run_selectors(load, options):
+    selector = selectors.DefaultSelector()
+    fds = set()
+
+    def sock_state_cb(fd, readable, writable):
+        if readable or writable:
+            events = (selectors.EVENT_READ if readable else 0) | (selectors.EVENT_WRITE if writable else 0)
+            if fd in fds:
+                selector.modify(fd, events)
+            else:
+                selector.register(fd, events)
+                fds.add(fd)
+        elif fd in fds:
+            fds.remove(fd)
+            selector.unregister(fd)
+
+    channel = pycares.Channel(sock_state_cb=sock_state_cb, **options)
+    load.start(channel)
+    while not load.finished:
+        delay = load.pump()
+        if not fds:
+            time.sleep(delay if delay is not None else 0.001)
+            continue
+        events = selector.select(channel.timeout(delay))
+        if not events:
+            channel.process_fd(pycares.ARES_SOCKET_BAD, pycares.ARES_SOCKET_BAD)
+            continue
+        for key, event in events:
+            read_fd = key.fd if event & selectors.EVENT_READ else pycares.ARES_SOCKET_BAD
+            write_fd = key.fd if event & selectors.EVENT_WRITE else pycares.ARES_SOCKET_BAD
+            channel.process_fd(read_fd, write_fd)
+    selector.close()
+
+
+def run_asyncio(load, options):
+    loop = asyncio.new_event_loop()
+    done = loop.create_future()
+    fds = set()
+    timer = None
+
+    def check():
+        nonlocal timer
+        if load.finished:
+            if not done.done():
+                done.set_result(None)
+            return
+        if timer is not None:
+            timer.cancel()
+        timer = loop.call_later(channel.timeout(1.0), on_timeout) if fds else None
+
+    def on_timeout():
+        nonlocal timer
+        timer = None
+        channel.process_fd(pycares.ARES_SOCKET_BAD, pycares.ARES_SOCKET_BAD)
+        check()
+
+    def on_readable(fd):
+        channel.process_fd(fd, pycares.ARES_SOCKET_BAD)
+        check()
+
+    def on_writable(fd):
+        channel.process_fd(pycares.ARES_SOCKET_BAD, fd)
+        check()
+
+    def sock_state_cb(fd, readable, writable):
+        if readable:
+            loop.add_reader(fd, on_readable, fd)
+        else:
+            loop.remove_reader(fd)
+        if writable:
+            loop.add_writer(fd, on_writable, fd)
+        else:
+            loop.remove_writer(fd)
+        if readable or writable:
+            fds.add(fd)
+        else:
+            fds.discard(fd)
+
+    def pump():
+        delay = load.pump()
+        if delay is not None:
+            loop.call_later(delay, pump)
+        check()
+
+    channel = pycares.Channel(sock_state_cb=sock_state_cb, **options)
+    load.start(channel)
+    loop.call_soon(pump)
+    try:
+        loop.run_until_complete(done)
+    finally:
+        for fd in fds:
+            loop.remove_reader(fd)
+            loop.remove_writer(fd)
+        loop.close()
+
+
+RUNNERS = {
+    'select': run_select,
+    'selectors': run_selectors,
+    'asyncio': run_asyncio,
+}
+
+
+def run_case(server, loop, mode, qtype, qps, duration):
+    load = Load(mode, qtype, qps, duration)
+    options = load.channel_options()
+    options.update(server.channel_options)
+    cpu = _cpu_clock()
+    start = _clock()
+    RUNNERS[loop](load, options)
+    elapsed = _clock() - start
+    cpu = _cpu_clock() - cpu
+    histogram = load.histogram
+    return {
+        'loop': loop,
+        'mode': mode,
+        'type': qtype,
+        'offered_qps': qps,
+        'queries': load.completed,
+        'errors': {pycares.errno.errorcode.get(k, str(k)): v for k, v in load.errors.items()},
+        'elapsed': elapsed,
+        'qps': load.completed / elapsed,
+        'p50': histogram.percentile(50),
+        'p99': histogram.percentile(99),
+        'max': (histogram.max or 0) / 1000000.0,
+        'cpu_per_query': cpu / load.completed,
+        'rss': rss(),
+    }
+
+
+def git_revision():
+    try:
+        out = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                      cwd=os.path.dirname(os.path.abspath(__file__)),
+                                      stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.decode('ascii').strip()
+
+
+def metadata(args):
+    return {
+        'pycares': pycares.__version__,
+        'c-ares': pycares.ARES_VERSION,
+        'revision': git_revision(),
+        'python': '%s %s' % (platform.python_implementation(), platform.python_version()),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'offered_qps': args.qps,
+        'duration': args.duration,
+    }
+
+
+def _list(choices):
+    def parse(value):
+        values = [v.strip() for v in value.split(',') if v.strip()]
+        for v in values:
+            if v not in choices:
+                raise argparse.ArgumentTypeError('invalid choice: %r (choose from %s)' % (v, ', '.join(choices)))
+        return values
+    return parse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='pycares end-to-end throughput and latency benchmark')
+    parser.add_argument('--qps', type=float, default=1000.0, help='offered load, in queries per second')
+    parser.add_argument('--duration', type=float, default=1.0, help='seconds of load per case')
+    parser.add_argument('--loops', type=_list(LOOPS), default=list(LOOPS), help='comma separated event loops')
+    parser.add_argument('--modes', type=_list(MODES), default=list(MODES), help='comma separated API modes')
+    parser.add_argument('--types', type=_list(TYPES), default=TYPES, help='comma separated query types')
+    parser.add_argument('-o', '--output', help='write the JSON results to this file instead of stdout')
+    parser.add_argument('-q', '--quiet', action='store_true', help='do not print progress')
+    args = parser.parse_args(argv)
+
+    results = []
+    with StubServer(make_zone()) as server:
+        for loop in args.loops:
+            for mode in args.modes:
+                for qtype in args.types:
+                    if not supported(mode, qtype):
+                        continue
+                    result = run_case(server, loop, mode, qtype, args.qps, args.duration)
+                    results.append(result)
+                    if not args.quiet:
+                        print('%-9s %-13s %-5s %8.0f qps  p50 %7.3f ms  p99 %7.3f ms  cpu %6.1f us/q  errors %d' % (
+                            loop, mode, qtype, result['qps'], result['p50'] * 1000, result['p99'] * 1000,
+                            result['cpu_per_query'] * 1000000, sum(result['errors'].values())), file=sys.stderr)
+
+    data = json.dumps({'meta': metadata(args), 'results': results}, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(data + '\n')
+    else:
+        print(data)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+
+# Compare two result files written by the benchmarks in this directory.
+#
+#   python benchmarks/compare.py before.json after.json --threshold 10
+
+import argparse
+import json
+import sys
+
+
+# metric -> True if higher is better
+METRICS = {
+    'qps': True,
+    'p50': False,
+    'p99': False,
+    'cpu_per_query': False,
+    'rss': False,
+    'mean': False,
+    'median': False,
+    'c_parse': False,
+    'build': False,
+}
+
+KEY_FIELDS = ('benchmark', 'loop', 'mode', 'type', 'records')
+
+
+def load(path):
+    with open(path) as f:
+        data = json.load(f)
+    results = {}
+    for result in data['results']:
+        key = tuple(result.get(k) for k in KEY_FIELDS)
+        results[key] = result
+    return data.get('meta', {}), results
+
+
+def _format_key(key):
+    return ' '.join(str(k) for k in key if k is not None)
+
+
+def compare(before, after, threshold):
+    regressions = []
+    rows = []
+    for key in sorted(set(before) & set(after), key=_format_key):
+        for metric, higher_is_better in sorted(METRICS.items()):
+            old = before[key].get(metric)
+            new = after[key].get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100.0
+            worse = -change if higher_is_better else change
+            flag = ''
+            if worse > threshold:
+                flag = 'REGRESSION'
+                regressions.append((key, metric))
+            elif -worse > threshold:
+                flag = 'improvement'
+            rows.append((_format_key(key), metric, old, new, change, flag))
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='compare pycares benchmark results')
+    parser.add_argument('before')
+    parser.add_argument('after')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='percentage change reported as a regression or improvement')
+    args = parser.parse_args(argv)
+
+    before_meta, before = load(args.before)
+    after_meta, after = load(args.after)
+    print('before: %s (%s)' % (before_meta.get('revision'), before_meta.get('pycares')))
+    print('after:  %s (%s)' % (after_meta.get('revision'), after_meta.get('pycares')))
+
+    rows, regressions = compare(before, after, args.threshold)
+    for name, metric, old, new, change, flag in rows:
+        print('%-40s %-14s %14.6g %14.6g %+8.1f%% %s' % (name, metric, old, new, change, flag))
+    for key in sorted(set(before) ^ set(after), key=_format_key):
+        print('%-40s only in %s' % (_format_key(key), 'before' if key in before else 'after'))
+
+    if regressions:
+        print('%d regression(s) above %.1f%%' % (len(regressions), args.threshold))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+
+# Import time benchmark: imports pycares (and optionally its submodules) in
+# fresh interpreters with -X importtime (Python 3.7+) and reports the time
+# spent, including every module imported along the way.
+#
+#   python benchmarks/import_time.py -o before.json
+#   python benchmarks/compare.py before.json after.json
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import pycares
+
+
+MODULES = ('pycares', 'pycares.stats', 'pycares.capture', 'pycares.testing')
+
+
+def import_times(code):
+    # Return {module: (self, cumulative)} microseconds for running code in a
+    # fresh interpreter.
+    env = dict(os.environ)
+    env.pop('PYTHONPROFILEIMPORTTIME', None)
+    p = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                       stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, check=True, universal_newlines=True)
+    times = {}
+    for line in p.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # the header line
+        times[fields[2].strip()] = (self_us, cumulative_us)
+    return times
+
+
+def measure(module, repeat, startup):
+    # The first run warms up the bytecode caches and is discarded. Modules
+    # imported by the interpreter on startup are left out of the top list.
+    code = 'import %s' % module
+    import_times(code)
+    runs = [import_times(code) for _ in range(repeat)]
+    totals = [run[module][1] / 1e6 for run in runs]
+    top = sorted(((cumulative, name) for name, (_, cumulative) in runs[-1].items()
+                  if name != module and name not in startup), reverse=True)
+    return totals, [(name, cumulative / 1e6) for cumulative, name in top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='pycares import time benchmark')
+    parser.add_argument('--modules', help='comma separated modules to import (default: %s)' % ', '.join(MODULES))
+    parser.add_argument('--repeat', type=int, default=20, help='fresh interpreters per module')
+    parser.add_argument('--top', type=int, default=5, help='slowest imported modules to show per module')
+    parser.add_argument('-o', '--output', help='write the JSON results to this file instead of stdout')
+    args = parser.parse_args(argv)
+
+    if sys.version_info < (3, 7):
+        parser.error('-X importtime needs Python 3.7 or newer')
+    modules = [m.strip() for m in args.modules.split(',')] if args.modules else MODULES
+
+    startup = set(import_times('pass'))
+    results = []
+    for module in modules:
+        totals, top = measure(module, args.repeat, startup)
+        results.append({
+            'benchmark': 'import',
+            'mode': module,
+            'runs': len(totals),
+            'median': statistics.median(totals),
+            'min': min(totals),
+            'max': max(totals),
+        })
+        print('%-20s %8.2f ms  (min %.2f ms, max %.2f ms)' % (
+            module, statistics.median(totals) * 1e3, min(totals) * 1e3, max(totals) * 1e3), file=sys.stderr)
+        for name, cumulative in top[:args.top]:
+            print('    %-30s %8.2f ms' % (name, cumulative * 1e3), file=sys.stderr)
+
+    meta = {
+        'pycares': pycares.__version__,
+        'c-ares': pycares.ARES_VERSION,
+        'python': '%s %s' % (platform.python_implementation(), platform.python_version()),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    }
+    data = json.dumps({'meta': meta, 'results': results}, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(data + '\n')
+    else:
+        print(data)
+
+
+if __name__ == '__main__':
+    main()
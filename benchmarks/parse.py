@@ -0,0 +1,212 @@
+
+# Parse path microbenchmarks: feeds canned wire responses straight into
+# pycares.parse_result, for every supported query type and a range of answer
+# sizes, without any sockets or event loop involved.
+#
+#   python benchmarks/parse.py -o before.json
+#   python benchmarks/compare.py before.json after.json
+#
+# If pyperf is installed, --pyperf runs the same cases under pyperf's runner
+# (worker processes, calibration, system noise checks); any remaining arguments
+# are passed to it, e.g. --pyperf -o parse.json --rigorous.
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import pycares
+from pycares.testing import dns
+
+
+_clock = time.perf_counter
+
+ZONE = 'bench.test'
+
+SIZES = (1, 10, 50, 200, 250)
+
+
+def _a(i):
+    return (dns.TYPE_A, '10.%d.%d.%d' % (i >> 16 & 255, i >> 8 & 255, i & 255))
+
+
+def _aaaa(i):
+    return (dns.TYPE_AAAA, '2001:db8::%x' % i)
+
+
+def _mx(i):
+    return (dns.TYPE_MX, (i % 100, 'mx%d.%s' % (i, ZONE)))
+
+
+def _naptr(i):
+    return (dns.TYPE_NAPTR, (i, 10, 'S', 'SIP+D2U', '', '_sip._udp%d.%s' % (i, ZONE)))
+
+
+def _ns(i):
+    return (dns.TYPE_NS, 'ns%d.%s' % (i, ZONE))
+
+
+def _ptr(i):
+    return (dns.TYPE_PTR, 'host%d.%s' % (i, ZONE))
+
+
+def _srv(i):
+    return (dns.TYPE_SRV, (i % 100, 5, 5060, 'sip%d.%s' % (i, ZONE)))
+
+
+def _txt(i):
+    return (dns.TYPE_TXT, 'v=spf1 ip4:10.0.%d.0/24 ~all' % (i & 255))
+
+
+def _txt_multi(i):
+    # 600 bytes, split into three character strings on the wire
+    return (dns.TYPE_TXT, ('k%d=' % i).ljust(600, 'x'))
+
+
+def _cname(i):
+    return (dns.TYPE_CNAME, 'target.' + ZONE)
+
+
+def _soa(i):
+    return (dns.TYPE_SOA, ('ns1.' + ZONE, 'hostmaster.' + ZONE, 2019010100 + i, 3600, 600, 86400, 300))
+
+
+# case name -> (query type, record factory, sizes)
+CASES = {
+    'A': (pycares.QUERY_TYPE_A, _a, SIZES),
+    'AAAA': (pycares.QUERY_TYPE_AAAA, _aaaa, SIZES),
+    'CNAME': (pycares.QUERY_TYPE_CNAME, _cname, (1,)),
+    'MX': (pycares.QUERY_TYPE_MX, _mx, SIZES),
+    'NAPTR': (pycares.QUERY_TYPE_NAPTR, _naptr, SIZES),
+    'NS': (pycares.QUERY_TYPE_NS, _ns, SIZES),
+    'PTR': (pycares.QUERY_TYPE_PTR, _ptr, SIZES),
+    'SOA': (pycares.QUERY_TYPE_SOA, _soa, (1,)),
+    'SRV': (pycares.QUERY_TYPE_SRV, _srv, SIZES),
+    'TXT': (pycares.QUERY_TYPE_TXT, _txt, SIZES),
+    'TXT-multi': (pycares.QUERY_TYPE_TXT, _txt_multi, (1, 10, 50)),
+}
+
+
+def make_response(query_type, factory, n):
+    name = 'bench.' + ZONE
+    question = dns.Question(0, 0x0100, name, query_type, dns.CLASS_IN)
+    answers = []
+    for i in range(n):
+        rtype, value = factory(i)
+        answers.append((name, rtype, 300, value))
+    return dns.build_response(question, answers)
+
+
+def cases(names=None):
+    for case in sorted(CASES):
+        if names and case not in names:
+            continue
+        query_type, factory, sizes = CASES[case]
+        for n in sizes:
+            yield case, query_type, n, make_response(query_type, factory, n)
+
+
+def check(case, query_type, n, abuf):
+    result, error = pycares.parse_result(query_type, abuf, len(abuf))
+    if error is not None:
+        raise RuntimeError('%s/%d: parse failed: %s' % (case, n, pycares.errno.errorcode.get(error, error)))
+    count = len(result) if isinstance(result, list) else 1
+    if count != n and query_type not in (pycares.QUERY_TYPE_PTR, pycares.QUERY_TYPE_CNAME):
+        raise RuntimeError('%s/%d: got %d records' % (case, n, count))
+
+
+def time_loops(query_type, abuf, loops):
+    # Return (total, c_parse) seconds for the given number of parse_result calls.
+    parse_result = pycares.parse_result
+    alen = len(abuf)
+    timings = [0.0]
+    t0 = _clock()
+    for _ in range(loops):
+        parse_result(query_type, abuf, alen, timings)
+    return _clock() - t0, timings[0]
+
+
+def measure(query_type, abuf, repeat, min_time):
+    loops = 1
+    while True:
+        elapsed, _ = time_loops(query_type, abuf, loops)
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    runs = [time_loops(query_type, abuf, loops) for _ in range(repeat)]
+    total, c_parse = min(runs)
+    return loops, total / loops, c_parse / loops
+
+
+def run_pyperf(names):
+    import pyperf
+
+    def bench(loops, query_type, abuf):
+        return time_loops(query_type, abuf, loops)[0]
+
+    runner = pyperf.Runner()
+    runner.metadata['pycares'] = pycares.__version__
+    runner.metadata['c-ares'] = pycares.ARES_VERSION
+    for case, query_type, n, abuf in cases(names):
+        check(case, query_type, n, abuf)
+        runner.bench_time_func('parse_result %s x%d' % (case, n), bench, query_type, abuf, inner_loops=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='pycares parse path microbenchmarks')
+    parser.add_argument('--types', help='comma separated cases (%s)' % ', '.join(sorted(CASES)))
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs per case, the fastest one is kept')
+    parser.add_argument('--min-time', type=float, default=0.05, help='minimum duration of a timing run, in seconds')
+    parser.add_argument('--pyperf', action='store_true', help='run under pyperf, passing the remaining arguments to it')
+    parser.add_argument('-o', '--output', help='write the JSON results to this file instead of stdout')
+    args, rest = parser.parse_known_args(argv)
+
+    names = [n.strip() for n in args.types.split(',')] if args.types else None
+    if names:
+        for name in names:
+            if name not in CASES:
+                parser.error('invalid case: %r' % name)
+
+    if args.pyperf:
+        sys.argv[1:] = rest
+        run_pyperf(names)
+        return
+    if rest:
+        parser.error('unrecognized arguments: %s' % ' '.join(rest))
+
+    results = []
+    for case, query_type, n, abuf in cases(names):
+        check(case, query_type, n, abuf)
+        loops, mean, c_parse = measure(query_type, abuf, args.repeat, args.min_time)
+        results.append({
+            'benchmark': 'parse_result',
+            'type': case,
+            'records': n,
+            'bytes': len(abuf),
+            'loops': loops,
+            'mean': mean,
+            'c_parse': c_parse,
+            'build': mean - c_parse,
+            'per_record': mean / n,
+        })
+        print('%-10s x%-4d %10.2f us  (c-ares %8.2f us, objects %8.2f us, %6.3f us/record)' % (
+            case, n, mean * 1e6, c_parse * 1e6, (mean - c_parse) * 1e6, mean / n * 1e6), file=sys.stderr)
+
+    meta = {
+        'pycares': pycares.__version__,
+        'c-ares': pycares.ARES_VERSION,
+        'python': '%s %s' % (platform.python_implementation(), platform.python_version()),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    }
+    data = json.dumps({'meta': meta, 'results': results}, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(data + '\n')
+    else:
+        print(data)
+
+
+if __name__ == '__main__':
+    main()
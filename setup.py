@@ -43,7 +43,7 @@ setup(name             = 'pycares',
       extras_require   = {'idna': ['idna >= 2.1']},
       cffi_modules     = ['src/_cffi_src/build_cares.py:ffi'],
       package_dir      = {'': 'src'},
-      packages         = ['pycares'],
+      packages         = ['pycares', 'pycares.testing'],
       ext_package      = 'pycares',
       zip_safe         = False
 )
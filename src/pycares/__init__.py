@@ -2,18 +2,13 @@
 from ._cares import ffi as _ffi, lib as _lib
 import _cffi_backend  # hint for bundler tools
 
-if _lib.ARES_SUCCESS != _lib.ares_library_init(_lib.ARES_LIB_INIT_ALL):
-    raise RuntimeError('Could not initialize c-ares')
-
 from . import errno
 from .utils import ascii_bytes, maybe_str, parse_name
 from ._version import __version__
 
-import collections.abc
-import socket
-import math
-import functools
-import sys
+import _socket  # the socket module pulls in enum, selectors, ...
+import itertools
+import time
 
 
 exported_pycares_symbols = [
@@ -83,217 +78,424 @@ globals()['ARES_VERSION'] = maybe_str(_ffi.string(_lib.ares_version(_ffi.NULL)))
 
 PYCARES_ADDRTTL_SIZE = 256
 
+_query_type_names = {
+    _lib.T_A: 'A',
+    _lib.T_AAAA: 'AAAA',
+    _lib.T_ANY: 'ANY',
+    _lib.T_CNAME: 'CNAME',
+    _lib.T_MX: 'MX',
+    _lib.T_NAPTR: 'NAPTR',
+    _lib.T_NS: 'NS',
+    _lib.T_PTR: 'PTR',
+    _lib.T_SOA: 'SOA',
+    _lib.T_SRV: 'SRV',
+    _lib.T_TXT: 'TXT',
+}
+
 
 class AresError(Exception):
     pass
 
 
+# c-ares is initialized when the first channel is created, not on import
+
+_library_initialized = False
+
+def _library_init():
+    global _library_initialized
+    if not _library_initialized:
+        if _lib.ARES_SUCCESS != _lib.ares_library_init(_lib.ARES_LIB_INIT_ALL):
+            raise RuntimeError('Could not initialize c-ares')
+        _library_initialized = True
+
+
 # callback helpers
 
 _global_set = set()
 
+_clock = time.perf_counter
+
+_query_ids = itertools.count(1)
+
+
+class _Query:
+    __slots__ = ('monitor', 'id', 'type', 'name', 'started', 'done')
+
+    def __init__(self, monitor, query_type, name):
+        self.monitor = monitor
+        self.id = next(_query_ids)
+        self.type = query_type
+        self.name = name
+        self.started = _clock()
+        self.done = False
+
+
+class _QueryMonitor:
+    # Per-channel instrumentation state. It must not reference the Channel
+    # itself, pending queries hold on to it.
+    __slots__ = ('stats', 'server', 'hooks', 'sock_state_cb', 'sockets', 'slow_threshold', 'profile', 'capture')
+
+    def __init__(self, stats=None, hooks=(), sock_state_cb=None, slow_threshold=None, profile=None, capture=None):
+        self.stats = stats
+        self.server = None
+        self.hooks = list(hooks)
+        self.sock_state_cb = sock_state_cb
+        self.sockets = set()
+        self.slow_threshold = slow_threshold
+        self.profile = profile
+        self.capture = capture
+
+    def emit(self, event, query_id, info):
+        timestamp = _clock()
+        for hook in self.hooks:
+            hook(event, query_id, timestamp, info)
+
+    def start(self, query_type, name, method, arg=0):
+        query = _Query(self, _query_type_names.get(query_type, query_type), name)
+        if self.stats is not None:
+            self.stats.submitted += 1
+        if self.capture is not None:
+            self.capture.submit(query.id, method, query_type, arg, name)
+        if self.hooks:
+            self.emit('submit', query.id, {'type': query.type, 'name': name})
+        return query
+
+    def sent(self, query):
+        if self.hooks and not query.done:
+            self.emit('send', query.id, None)
+
+    def complete(self, query, callback, timeouts, parse, *args, source=None):
+        # source replaces the server in the statistics of queries answered
+        # without c-ares.
+        query.done = True
+        hooks = self.hooks
+        profile = self.profile
+        if hooks:
+            if timeouts:
+                self.emit('retry', query.id, {'timeouts': timeouts})
+            self.emit('parse_start', query.id, None)
+
+        if self.capture is not None:
+            if parse is _query_reply:
+                _, status, abuf, alen = args
+                response = None
+                if self.capture.responses and abuf != _ffi.NULL and alen > 0:
+                    response = bytes(_ffi.buffer(abuf, alen))
+            else:
+                status, response = args[0], None
+            self.capture.complete(query.id, status, response)
+
+        if profile is None:
+            result, status = parse(*args)
+        else:
+            timings = [0.0]
+            t0 = _clock()
+            if parse is _query_reply:
+                result, status = parse(*args, timings=timings)
+            else:
+                result, status = parse(*args)
+            parse_time = _clock() - t0
+
+        if hooks:
+            self.emit('parse_end', query.id, {'status': status})
+        if self.stats is not None:
+            self.stats.record(source or self.server, query.type, _clock() - query.started, status, timeouts)
+
+        if hooks:
+            self.emit('callback_start', query.id, None)
+        if self.slow_threshold is None and profile is None:
+            callback(result, status)
+        else:
+            t0 = _clock()
+            callback(result, status)
+            elapsed = _clock() - t0
+            if self.slow_threshold is not None and elapsed >= self.slow_threshold:
+                self.slow_callback(elapsed, 'callback for %s query %r' % (query.type, query.name))
+            if profile is not None:
+                if result is None:
+                    records = 0
+                elif isinstance(result, list):
+                    records = len(result)
+                else:
+                    records = 1
+                profile.record(query.type, timings[0], parse_time - timings[0], elapsed, records)
+        if hooks:
+            self.emit('callback_end', query.id, None)
+
+    def slow_callback(self, elapsed, what):
+        import logging
+        if self.stats is not None:
+            self.stats.slow_callbacks += 1
+        logging.getLogger('pycares').warning('slow %s took %.3f seconds', what, elapsed)
+
+    def sock_state(self, fd, readable, writable):
+        if readable or writable:
+            if fd not in self.sockets:
+                self.sockets.add(fd)
+                if self.hooks:
+                    self.emit('socket_open', None, {'fd': fd})
+        elif fd in self.sockets:
+            self.sockets.discard(fd)
+            if self.hooks:
+                self.emit('socket_close', None, {'fd': fd})
+        if self.sock_state_cb is None:
+            return
+        if self.slow_threshold is None:
+            self.sock_state_cb(fd, readable, writable)
+        else:
+            t0 = _clock()
+            self.sock_state_cb(fd, readable, writable)
+            elapsed = _clock() - t0
+            if elapsed >= self.slow_threshold:
+                self.slow_callback(elapsed, 'sock_state_cb for fd %d' % fd)
+
+
 @_ffi.def_extern()
 def _sock_state_cb(data, socket_fd, readable, writable):
     sock_state_cb = _ffi.from_handle(data)
     sock_state_cb(socket_fd, readable, writable)
 
+def _host_reply(status, hostent):
+    if status != _lib.ARES_SUCCESS:
+        return None, status
+    return ares_host_result(hostent), None
+
 @_ffi.def_extern()
 def _host_cb(arg, status, timeouts, hostent):
-    callback = _ffi.from_handle(arg)
+    callback, query = _ffi.from_handle(arg)
     _global_set.discard(arg)
 
-    if status != _lib.ARES_SUCCESS:
-        result = None
-    else:
-        result = ares_host_result(hostent)
-        status = None
+    if query is not None:
+        query.monitor.complete(query, callback, timeouts, _host_reply, status, hostent)
+        return
 
+    result, status = _host_reply(status, hostent)
     callback(result, status)
 
+def _local_reply(status, result):
+    if status != _lib.ARES_SUCCESS:
+        return None, status
+    return result, None
+
+def _nameinfo_reply(status, node, service):
+    if status != _lib.ARES_SUCCESS:
+        return None, status
+    return ares_nameinfo_result(node, service), None
+
 @_ffi.def_extern()
 def _nameinfo_cb(arg, status, timeouts, node, service):
-    callback = _ffi.from_handle(arg)
+    callback, query = _ffi.from_handle(arg)
     _global_set.discard(arg)
 
-    if status != _lib.ARES_SUCCESS:
-        result = None
-    else:
-        result = ares_nameinfo_result(node, service)
-        status = None
+    if query is not None:
+        query.monitor.complete(query, callback, timeouts, _nameinfo_reply, status, node, service)
+        return
 
+    result, status = _nameinfo_reply(status, node, service)
     callback(result, status)
 
+def _query_reply(query_type, status, abuf, alen, timings=None):
+    if status != _lib.ARES_SUCCESS:
+        return None, status
+
+    if query_type != _lib.T_ANY:
+        return parse_result(query_type, abuf, alen, timings)
+
+    result = []
+    for qtype in (_lib.T_A, _lib.T_AAAA, _lib.T_CNAME, _lib.T_MX, _lib.T_NAPTR, _lib.T_NS, _lib.T_PTR, _lib.T_SOA, _lib.T_SRV, _lib.T_TXT):
+        r, status = parse_result(qtype, abuf, alen, timings)
+        if status not in (None, _lib.ARES_ENODATA, _lib.ARES_EBADRESP):
+            return None, status
+        if r is not None:
+            if isinstance(r, list):
+                result.extend(r)
+            else:
+                result.append(r)
+    return result, None
+
 @_ffi.def_extern()
 def _query_cb(arg, status, timeouts, abuf, alen):
-    callback, query_type = _ffi.from_handle(arg)
+    callback, query_type, query = _ffi.from_handle(arg)
     _global_set.discard(arg)
 
-    if status == _lib.ARES_SUCCESS:
-        if query_type == _lib.T_ANY:
-            result = []
-            for qtype in (_lib.T_A, _lib.T_AAAA, _lib.T_CNAME, _lib.T_MX, _lib.T_NAPTR, _lib.T_NS, _lib.T_PTR, _lib.T_SOA, _lib.T_SRV, _lib.T_TXT):
-                r, status = parse_result(qtype, abuf, alen)
-                if status not in (None, _lib.ARES_ENODATA, _lib.ARES_EBADRESP):
-                    result = None
-                    break
-                if r is not None:
-                    if isinstance(r, collections.abc.Iterable):
-                        result.extend(r)
-                    else:
-                        result.append(r)
-            else:
-                status = None
-        else:
-            result, status = parse_result(query_type, abuf, alen)
-    else:
-        result = None
+    if query is not None:
+        query.monitor.complete(query, callback, timeouts, _query_reply, query_type, status, abuf, alen)
+        return
 
+    result, status = _query_reply(query_type, status, abuf, alen)
     callback(result, status)
 
-def parse_result(query_type, abuf, alen):
-    if query_type == _lib.T_A:
-        addrttls = _ffi.new("struct ares_addrttl[]", PYCARES_ADDRTTL_SIZE)
-        naddrttls = _ffi.new("int*", PYCARES_ADDRTTL_SIZE)
-        parse_status = _lib.ares_parse_a_reply(abuf, alen, _ffi.NULL, addrttls, naddrttls)
-        if parse_status != _lib.ARES_SUCCESS:
-            result = None
-            status = parse_status
-        else:
-            result = [ares_query_a_result(addrttls[i]) for i in range(naddrttls[0])]
-            status = None
-    elif query_type == _lib.T_AAAA:
-        addrttls = _ffi.new("struct ares_addr6ttl[]", PYCARES_ADDRTTL_SIZE)
-        naddrttls = _ffi.new("int*", PYCARES_ADDRTTL_SIZE)
-        parse_status = _lib.ares_parse_aaaa_reply(abuf, alen, _ffi.NULL, addrttls, naddrttls)
-        if parse_status != _lib.ARES_SUCCESS:
-            result = None
-            status = parse_status
-        else:
-            result = [ares_query_aaaa_result(addrttls[i]) for i in range(naddrttls[0])]
-            status = None
-    elif query_type == _lib.T_CNAME:
-        host = _ffi.new("struct hostent **")
-        parse_status = _lib.ares_parse_a_reply(abuf, alen, host, _ffi.NULL, _ffi.NULL)
-        if parse_status != _lib.ARES_SUCCESS:
-            result = None
-            status = parse_status
-        else:
-            result = ares_query_cname_result(host[0])
-            _lib.ares_free_hostent(host[0])
-            status = None
-    elif query_type == _lib.T_MX:
-        mx_reply = _ffi.new("struct ares_mx_reply **")
-        parse_status = _lib.ares_parse_mx_reply(abuf, alen, mx_reply);
-        if parse_status != _lib.ARES_SUCCESS:
-            result = None
-            status = parse_status
-        else:
-            result = []
-            mx_reply_ptr = mx_reply[0]
-            while mx_reply_ptr != _ffi.NULL:
-                result.append(ares_query_mx_result(mx_reply_ptr))
-                mx_reply_ptr = mx_reply_ptr.next
-            _lib.ares_free_data(mx_reply[0])
-            status = None
-    elif query_type == _lib.T_NAPTR:
-        naptr_reply = _ffi.new("struct ares_naptr_reply **")
-        parse_status = _lib.ares_parse_naptr_reply(abuf, alen, naptr_reply);
-        if parse_status != _lib.ARES_SUCCESS:
-            result = None
-            status = parse_status
-        else:
-            result = []
-            naptr_reply_ptr = naptr_reply[0]
-            while naptr_reply_ptr != _ffi.NULL:
-                result.append(ares_query_naptr_result(naptr_reply_ptr))
-                naptr_reply_ptr = naptr_reply_ptr.next
-            _lib.ares_free_data(naptr_reply[0])
-            status = None
-    elif query_type == _lib.T_NS:
-        hostent = _ffi.new("struct hostent **")
-        parse_status = _lib.ares_parse_ns_reply(abuf, alen, hostent);
-        if parse_status != _lib.ARES_SUCCESS:
-            result = None
-            status = parse_status
-        else:
-            result = []
-            host = hostent[0]
-            i = 0
-            while host.h_aliases[i] != _ffi.NULL:
-                result.append(ares_query_ns_result(host.h_aliases[i]))
-                i += 1
-            _lib.ares_free_hostent(host)
-            status = None
-    elif query_type == _lib.T_PTR:
-        hostent = _ffi.new("struct hostent **")
-        hostttl = _ffi.new("int*", PYCARES_ADDRTTL_SIZE)
-        parse_status = _lib.ares_parse_ptr_reply(abuf, alen, _ffi.NULL, 0, socket.AF_UNSPEC, hostent, hostttl);
-        if parse_status != _lib.ARES_SUCCESS:
-            result = None
-            status = parse_status
-        else:
-            aliases = []
-            host = hostent[0]
-            i = 0
-            while host.h_aliases[i] != _ffi.NULL:
-                aliases.append(maybe_str(_ffi.string(host.h_aliases[i])))
-                i += 1
-            result = ares_query_ptr_result(host, hostttl[0], aliases)
-            _lib.ares_free_hostent(host)
-            status = None
-    elif query_type == _lib.T_SOA:
-        soa_reply = _ffi.new("struct ares_soa_reply **")
-        parse_status = _lib.ares_parse_soa_reply(abuf, alen, soa_reply);
-        if parse_status != _lib.ARES_SUCCESS:
-            result = None
-            status = parse_status
+def _parse_a_reply(abuf, alen):
+    addrttls = _ffi.new("struct ares_addrttl[]", PYCARES_ADDRTTL_SIZE)
+    naddrttls = _ffi.new("int*", PYCARES_ADDRTTL_SIZE)
+    parse_status = _lib.ares_parse_a_reply(abuf, alen, _ffi.NULL, addrttls, naddrttls)
+    return parse_status, (addrttls, naddrttls)
+
+def _build_a_result(reply):
+    addrttls, naddrttls = reply
+    return [ares_query_a_result(addrttls[i]) for i in range(naddrttls[0])]
+
+def _parse_aaaa_reply(abuf, alen):
+    addrttls = _ffi.new("struct ares_addr6ttl[]", PYCARES_ADDRTTL_SIZE)
+    naddrttls = _ffi.new("int*", PYCARES_ADDRTTL_SIZE)
+    parse_status = _lib.ares_parse_aaaa_reply(abuf, alen, _ffi.NULL, addrttls, naddrttls)
+    return parse_status, (addrttls, naddrttls)
+
+def _build_aaaa_result(reply):
+    addrttls, naddrttls = reply
+    return [ares_query_aaaa_result(addrttls[i]) for i in range(naddrttls[0])]
+
+def _parse_cname_reply(abuf, alen):
+    host = _ffi.new("struct hostent **")
+    parse_status = _lib.ares_parse_a_reply(abuf, alen, host, _ffi.NULL, _ffi.NULL)
+    return parse_status, host
+
+def _build_cname_result(host):
+    result = ares_query_cname_result(host[0])
+    _lib.ares_free_hostent(host[0])
+    return result
+
+def _parse_mx_reply(abuf, alen):
+    mx_reply = _ffi.new("struct ares_mx_reply **")
+    parse_status = _lib.ares_parse_mx_reply(abuf, alen, mx_reply);
+    return parse_status, mx_reply
+
+def _build_mx_result(mx_reply):
+    result = []
+    mx_reply_ptr = mx_reply[0]
+    while mx_reply_ptr != _ffi.NULL:
+        result.append(ares_query_mx_result(mx_reply_ptr))
+        mx_reply_ptr = mx_reply_ptr.next
+    _lib.ares_free_data(mx_reply[0])
+    return result
+
+def _parse_naptr_reply(abuf, alen):
+    naptr_reply = _ffi.new("struct ares_naptr_reply **")
+    parse_status = _lib.ares_parse_naptr_reply(abuf, alen, naptr_reply);
+    return parse_status, naptr_reply
+
+def _build_naptr_result(naptr_reply):
+    result = []
+    naptr_reply_ptr = naptr_reply[0]
+    while naptr_reply_ptr != _ffi.NULL:
+        result.append(ares_query_naptr_result(naptr_reply_ptr))
+        naptr_reply_ptr = naptr_reply_ptr.next
+    _lib.ares_free_data(naptr_reply[0])
+    return result
+
+def _parse_ns_reply(abuf, alen):
+    hostent = _ffi.new("struct hostent **")
+    parse_status = _lib.ares_parse_ns_reply(abuf, alen, hostent);
+    return parse_status, hostent
+
+def _build_ns_result(hostent):
+    result = []
+    host = hostent[0]
+    i = 0
+    while host.h_aliases[i] != _ffi.NULL:
+        result.append(ares_query_ns_result(host.h_aliases[i]))
+        i += 1
+    _lib.ares_free_hostent(host)
+    return result
+
+def _parse_ptr_reply(abuf, alen):
+    hostent = _ffi.new("struct hostent **")
+    hostttl = _ffi.new("int*", PYCARES_ADDRTTL_SIZE)
+    parse_status = _lib.ares_parse_ptr_reply(abuf, alen, _ffi.NULL, 0, _socket.AF_UNSPEC, hostent, hostttl);
+    return parse_status, (hostent, hostttl)
+
+def _build_ptr_result(reply):
+    hostent, hostttl = reply
+    aliases = []
+    host = hostent[0]
+    i = 0
+    while host.h_aliases[i] != _ffi.NULL:
+        aliases.append(maybe_str(_ffi.string(host.h_aliases[i])))
+        i += 1
+    result = ares_query_ptr_result(host, hostttl[0], aliases)
+    _lib.ares_free_hostent(host)
+    return result
+
+def _parse_soa_reply(abuf, alen):
+    soa_reply = _ffi.new("struct ares_soa_reply **")
+    parse_status = _lib.ares_parse_soa_reply(abuf, alen, soa_reply);
+    return parse_status, soa_reply
+
+def _build_soa_result(soa_reply):
+    result = ares_query_soa_result(soa_reply[0])
+    _lib.ares_free_data(soa_reply[0])
+    return result
+
+def _parse_srv_reply(abuf, alen):
+    srv_reply = _ffi.new("struct ares_srv_reply **")
+    parse_status = _lib.ares_parse_srv_reply(abuf, alen, srv_reply);
+    return parse_status, srv_reply
+
+def _build_srv_result(srv_reply):
+    result = []
+    srv_reply_ptr = srv_reply[0]
+    while srv_reply_ptr != _ffi.NULL:
+        result.append(ares_query_srv_result(srv_reply_ptr))
+        srv_reply_ptr = srv_reply_ptr.next
+    _lib.ares_free_data(srv_reply[0])
+    return result
+
+def _parse_txt_reply(abuf, alen):
+    txt_reply = _ffi.new("struct ares_txt_ext **")
+    parse_status = _lib.ares_parse_txt_reply_ext(abuf, alen, txt_reply);
+    return parse_status, txt_reply
+
+def _build_txt_result(txt_reply):
+    result = []
+    txt_reply_ptr = txt_reply[0]
+    tmp_obj = None
+    while True:
+        if txt_reply_ptr == _ffi.NULL:
+            if tmp_obj is not None:
+                result.append(ares_query_txt_result(tmp_obj))
+            break
+        if txt_reply_ptr.record_start == 1:
+            if tmp_obj is not None:
+                result.append(ares_query_txt_result(tmp_obj))
+            tmp_obj = ares_query_txt_result_chunk(txt_reply_ptr)
         else:
-            result = ares_query_soa_result(soa_reply[0])
-            _lib.ares_free_data(soa_reply[0])
-            status = None
-    elif query_type == _lib.T_SRV:
-        srv_reply = _ffi.new("struct ares_srv_reply **")
-        parse_status = _lib.ares_parse_srv_reply(abuf, alen, srv_reply);
-        if parse_status != _lib.ARES_SUCCESS:
-            result = None
-            status = parse_status
-        else:
-            result = []
-            srv_reply_ptr = srv_reply[0]
-            while srv_reply_ptr != _ffi.NULL:
-                result.append(ares_query_srv_result(srv_reply_ptr))
-                srv_reply_ptr = srv_reply_ptr.next
-            _lib.ares_free_data(srv_reply[0])
-            status = None
-    elif query_type == _lib.T_TXT:
-        txt_reply = _ffi.new("struct ares_txt_ext **")
-        parse_status = _lib.ares_parse_txt_reply_ext(abuf, alen, txt_reply);
-        if parse_status != _lib.ARES_SUCCESS:
-            result = None
-            status = parse_status
-        else:
-            result = []
-            txt_reply_ptr = txt_reply[0]
-            tmp_obj = None
-            while True:
-                if txt_reply_ptr == _ffi.NULL:
-                    if tmp_obj is not None:
-                        result.append(ares_query_txt_result(tmp_obj))
-                    break
-                if txt_reply_ptr.record_start == 1:
-                    if tmp_obj is not None:
-                        result.append(ares_query_txt_result(tmp_obj))
-                    tmp_obj = ares_query_txt_result_chunk(txt_reply_ptr)
-                else:
-                    new_chunk = ares_query_txt_result_chunk(txt_reply_ptr)
-                    tmp_obj.text += new_chunk.text
-                txt_reply_ptr = txt_reply_ptr.next
-            _lib.ares_free_data(txt_reply[0])
-            status = None
-    else:
+            new_chunk = ares_query_txt_result_chunk(txt_reply_ptr)
+            tmp_obj.text += new_chunk.text
+        txt_reply_ptr = txt_reply_ptr.next
+    _lib.ares_free_data(txt_reply[0])
+    return result
+
+# query type -> (function calling the c-ares parser, function building the result objects)
+_reply_parsers = {
+    _lib.T_A: (_parse_a_reply, _build_a_result),
+    _lib.T_AAAA: (_parse_aaaa_reply, _build_aaaa_result),
+    _lib.T_CNAME: (_parse_cname_reply, _build_cname_result),
+    _lib.T_MX: (_parse_mx_reply, _build_mx_result),
+    _lib.T_NAPTR: (_parse_naptr_reply, _build_naptr_result),
+    _lib.T_NS: (_parse_ns_reply, _build_ns_result),
+    _lib.T_PTR: (_parse_ptr_reply, _build_ptr_result),
+    _lib.T_SOA: (_parse_soa_reply, _build_soa_result),
+    _lib.T_SRV: (_parse_srv_reply, _build_srv_result),
+    _lib.T_TXT: (_parse_txt_reply, _build_txt_result),
+}
+
+def parse_result(query_type, abuf, alen, timings=None):
+    try:
+        parse, build = _reply_parsers[query_type]
+    except KeyError:
         raise ValueError("invalid query type specified")
 
-    return result, status
+    if timings is None:
+        parse_status, reply = parse(abuf, alen)
+    else:
+        t0 = _clock()
+        parse_status, reply = parse(abuf, alen)
+        timings[0] += _clock() - t0
+
+    if parse_status != _lib.ARES_SUCCESS:
+        return None, parse_status
+
+    return build(reply), None
 
 
 class Channel:
@@ -316,7 +518,14 @@ class Channel:
                  rotate = False,
                  local_ip = None,
                  local_dev = None,
-                 resolvconf_path = None):
+                 resolvconf_path = None,
+                 stats = None,
+                 trace_hooks = None,
+                 slow_callback_threshold = None,
+                 parse_profile = None,
+                 capture = None,
+                 hosts = None,
+                 overlay = None):
 
         channel = _ffi.new("ares_channel *")
         options = _ffi.new("struct ares_options *")
@@ -354,10 +563,24 @@ class Channel:
             options.socket_receive_buffer_size = socket_receive_buffer_size
             optmask = optmask |  _lib.ARES_OPT_SOCK_RCVBUF
 
-        if sock_state_cb:
-            if not callable(sock_state_cb):
-                raise TypeError("sock_state_cb is not callable")
+        if sock_state_cb and not callable(sock_state_cb):
+            raise TypeError("sock_state_cb is not callable")
 
+        if (stats is not None or trace_hooks is not None or slow_callback_threshold is not None or parse_profile is not None or
+                capture is not None):
+            monitor = _QueryMonitor(stats, trace_hooks or (), sock_state_cb or None, slow_callback_threshold, parse_profile, capture)
+            sock_state_cb = monitor.sock_state
+            self._sock_monitor = None
+        else:
+            monitor = None
+            # c-ares only takes sock_state_cb at init, so socket events go
+            # through a monitor which becomes the channel's own if a trace
+            # hook is added later.
+            self._sock_monitor = _QueryMonitor(sock_state_cb=sock_state_cb) if sock_state_cb else None
+            if self._sock_monitor is not None:
+                sock_state_cb = self._sock_monitor.sock_state
+
+        if sock_state_cb:
             userdata = _ffi.new_handle(sock_state_cb)
 
             # This must be kept alive while the channel is alive.
@@ -368,7 +591,9 @@ class Channel:
             optmask = optmask |  _lib.ARES_OPT_SOCK_STATE_CB
 
         if lookups:
-            options.lookups = _ffi.new('char[]', ascii_bytes(lookups))
+            # Strings must be kept alive until ares_init_options has copied them.
+            lookups_str = _ffi.new('char[]', ascii_bytes(lookups))
+            options.lookups = lookups_str
             optmask = optmask |  _lib.ARES_OPT_LOOKUPS
 
         if domains:
@@ -386,13 +611,22 @@ class Channel:
 
         if resolvconf_path is not None:
             optmask = optmask |  _lib.ARES_OPT_RESOLVCONF
-            options.resolvconf_path = _ffi.new('char[]', ascii_bytes(resolvconf_path))
+            resolvconf_path_str = _ffi.new('char[]', ascii_bytes(resolvconf_path))
+            options.resolvconf_path = resolvconf_path_str
 
+        _library_init()
         r = _lib.ares_init_options(channel, options, optmask)
         if r != _lib.ARES_SUCCESS:
             raise AresError('Failed to initialize c-ares channel')
 
         self._channel = _ffi.gc(channel, lambda x: _lib.ares_destroy(x[0]))
+        self._monitor = monitor
+
+        if hosts is not None and not hasattr(hosts, 'gethostbyname'):
+            from .hosts import HostsFile
+            hosts = HostsFile(hosts)
+        self._hosts = hosts
+        self._overlay = overlay
 
         if servers:
             self.servers = servers
@@ -403,6 +637,65 @@ class Channel:
         if local_dev:
             self.set_local_dev(local_dev)
 
+        if monitor is not None and monitor.server is None:
+            monitor.server = ','.join(self.servers)
+
+    def _start_query(self, query_type, name, method, arg=0):
+        if self._monitor is None:
+            return None
+        return self._monitor.start(query_type, name, method, arg)
+
+    def _local_answer(self, query, callback, source, result, status):
+        # Complete a query answered from the hosts file or the overlay through
+        # the monitor, as c-ares does with queries it answers from its own
+        # hosts file.
+        if query is None:
+            callback(result, status)
+            return
+        query.monitor.complete(query, callback, 0, _local_reply, status or _lib.ARES_SUCCESS, result, source=source)
+
+    def _monitor_or_create(self):
+        if self._monitor is None:
+            self._monitor = self._sock_monitor or _QueryMonitor()
+            self._monitor.server = ','.join(self.servers)
+        return self._monitor
+
+    def add_trace_hook(self, hook):
+        if not callable(hook):
+            raise TypeError("a callable is required")
+        self._monitor_or_create().hooks.append(hook)
+
+    def remove_trace_hook(self, hook):
+        if self._monitor is None or hook not in self._monitor.hooks:
+            raise ValueError("hook is not installed")
+        self._monitor.hooks.remove(hook)
+
+    @property
+    def stats(self):
+        if self._monitor is None:
+            return None
+        return self._monitor.stats
+
+    @property
+    def parse_profile(self):
+        if self._monitor is None:
+            return None
+        return self._monitor.profile
+
+    @property
+    def capture(self):
+        if self._monitor is None:
+            return None
+        return self._monitor.capture
+
+    @property
+    def hosts(self):
+        return self._hosts
+
+    @property
+    def overlay(self):
+        return self._overlay
+
     def cancel(self):
         _lib.ares_cancel(self._channel[0])
 
@@ -433,10 +726,10 @@ class Channel:
     def servers(self, servers):
         c = _ffi.new("struct ares_addr_node[%d]" % len(servers))
         for i, server in enumerate(servers):
-            if _lib.ares_inet_pton(socket.AF_INET, ascii_bytes(server), _ffi.addressof(c[i].addr.addr4)) == 1:
-                c[i].family = socket.AF_INET
-            elif _lib.ares_inet_pton(socket.AF_INET6, ascii_bytes(server), _ffi.addressof(c[i].addr.addr6)) == 1:
-                c[i].family = socket.AF_INET6
+            if _lib.ares_inet_pton(_socket.AF_INET, ascii_bytes(server), _ffi.addressof(c[i].addr.addr4)) == 1:
+                c[i].family = _socket.AF_INET
+            elif _lib.ares_inet_pton(_socket.AF_INET6, ascii_bytes(server), _ffi.addressof(c[i].addr.addr6)) == 1:
+                c[i].family = _socket.AF_INET6
             else:
                 raise ValueError("invalid IP address")
 
@@ -447,6 +740,9 @@ class Channel:
         if r != _lib.ARES_SUCCESS:
             raise AresError(r, errno.strerror(r))
 
+        if self._monitor is not None:
+            self._monitor.server = ','.join(servers)
+
     def getsock(self):
         rfds = []
         wfds = []
@@ -470,8 +766,9 @@ class Channel:
         if t is not None:
             if t >= 0.0:
                 maxtv = _ffi.new("struct timeval*")
-                maxtv.tv_sec = int(math.floor(t))
-                maxtv.tv_usec = int(math.fmod(t, 1.0) * 1000000)
+                sec, frac = divmod(t, 1.0)
+                maxtv.tv_sec = int(sec)
+                maxtv.tv_usec = int(frac * 1000000)
             else:
                 raise ValueError("timeout needs to be a positive number or None")
 
@@ -488,26 +785,53 @@ class Channel:
 
         addr4 = _ffi.new("struct in_addr*")
         addr6 = _ffi.new("struct ares_in6_addr*")
-        if _lib.ares_inet_pton(socket.AF_INET, ascii_bytes(addr), (addr4)) == 1:
+        if _lib.ares_inet_pton(_socket.AF_INET, ascii_bytes(addr), (addr4)) == 1:
             address = addr4
-            family = socket.AF_INET
-        elif _lib.ares_inet_pton(socket.AF_INET6, ascii_bytes(addr), (addr6)) == 1:
+            family = _socket.AF_INET
+        elif _lib.ares_inet_pton(_socket.AF_INET6, ascii_bytes(addr), (addr6)) == 1:
             address = addr6
-            family = socket.AF_INET6
+            family = _socket.AF_INET6
         else:
             raise ValueError("invalid IP address")
 
-        userdata = _ffi.new_handle(callback)
+        query = self._start_query('gethostbyaddr', addr, 'gethostbyaddr', family)
+
+        if self._hosts is not None:
+            result = self._hosts.gethostbyaddr(addr)
+            if result is not None:
+                self._local_answer(query, callback, 'hosts', result, None)
+                return
+
+        userdata = _ffi.new_handle((callback, query))
         _global_set.add(userdata)
         _lib.ares_gethostbyaddr(self._channel[0], address, _ffi.sizeof(address[0]), family, _lib._host_cb, userdata)
+        if query is not None:
+            query.monitor.sent(query)
 
     def gethostbyname(self, name, family, callback):
         if not callable(callback):
             raise TypeError("a callable is required")
 
-        userdata = _ffi.new_handle(callback)
+        encoded = parse_name(name)
+        query = self._start_query('gethostbyname', name, 'gethostbyname', family)
+
+        if self._overlay is not None:
+            answer = self._overlay.gethostbyname(name, family)
+            if answer is not None:
+                self._local_answer(query, callback, 'overlay', *answer)
+                return
+
+        if self._hosts is not None:
+            result = self._hosts.gethostbyname(name, family)
+            if result is not None:
+                self._local_answer(query, callback, 'hosts', result, None)
+                return
+
+        userdata = _ffi.new_handle((callback, query))
         _global_set.add(userdata)
-        _lib.ares_gethostbyname(self._channel[0], parse_name(name), family, _lib._host_cb, userdata)
+        _lib.ares_gethostbyname(self._channel[0], encoded, family, _lib._host_cb, userdata)
+        if query is not None:
+            query.monitor.sent(query)
 
     def query(self, name, query_type, callback, query_class=None):
         self._do_query(_lib.ares_query, name, query_type, callback, query_class=query_class)
@@ -528,16 +852,27 @@ class Channel:
         if query_class not in self.__qclasses__:
             raise ValueError('invalid query class specified')
 
-        userdata = _ffi.new_handle((callback, query_type))
+        encoded = parse_name(name)
+        query = self._start_query(query_type, name, 'search' if func is _lib.ares_search else 'query', query_class)
+
+        if self._overlay is not None and query_class == _lib.C_IN:
+            answer = self._overlay.lookup(name, query_type)
+            if answer is not None:
+                self._local_answer(query, callback, 'overlay', *answer)
+                return
+
+        userdata = _ffi.new_handle((callback, query_type, query))
         _global_set.add(userdata)
-        func(self._channel[0], parse_name(name), query_class, query_type, _lib._query_cb, userdata)
+        func(self._channel[0], encoded, query_class, query_type, _lib._query_cb, userdata)
+        if query is not None:
+            query.monitor.sent(query)
 
     def set_local_ip(self, ip):
         addr4 = _ffi.new("struct in_addr*")
         addr6 = _ffi.new("struct ares_in6_addr*")
-        if _lib.ares_inet_pton(socket.AF_INET, ascii_bytes(ip), addr4) == 1:
-            _lib.ares_set_local_ip4(self._channel[0], socket.ntohl(addr4.s_addr))
-        elif _lib.ares_inet_pton(socket.AF_INET6, ascii_bytes(ip), addr6) == 1:
+        if _lib.ares_inet_pton(_socket.AF_INET, ascii_bytes(ip), addr4) == 1:
+            _lib.ares_set_local_ip4(self._channel[0], _socket.ntohl(addr4.s_addr))
+        elif _lib.ares_inet_pton(_socket.AF_INET6, ascii_bytes(ip), addr6) == 1:
             _lib.ares_set_local_ip6(self._channel[0], addr6)
         else:
             raise ValueError("invalid IP address")
@@ -549,27 +884,30 @@ class Channel:
         if len(address) == 2:
             (ip, port) = address
             sa4 = _ffi.new("struct sockaddr_in*")
-            if _lib.ares_inet_pton(socket.AF_INET, ascii_bytes(ip), _ffi.addressof(sa4.sin_addr)) != 1:
+            if _lib.ares_inet_pton(_socket.AF_INET, ascii_bytes(ip), _ffi.addressof(sa4.sin_addr)) != 1:
                 raise ValueError("Invalid IPv4 address %r" % ip)
-            sa4.sin_family = socket.AF_INET
-            sa4.sin_port = socket.htons(port)
+            sa4.sin_family = _socket.AF_INET
+            sa4.sin_port = _socket.htons(port)
             sa = sa4
         elif len(address) == 4:
             (ip, port, flowinfo, scope_id) = address
             sa6 = _ffi.new("struct sockaddr_in6*")
-            if _lib.ares_inet_pton(socket.AF_INET6, ascii_bytes(ip), _ffi.addressof(sa6.sin6_addr)) != 1:
+            if _lib.ares_inet_pton(_socket.AF_INET6, ascii_bytes(ip), _ffi.addressof(sa6.sin6_addr)) != 1:
                 raise ValueError("Invalid IPv6 address %r" % ip)
-            sa6.sin6_family = socket.AF_INET6
-            sa6.sin6_port = socket.htons(port)
-            sa6.sin6_flowinfo = socket.htonl(flowinfo) # I'm unsure about byteorder here.
+            sa6.sin6_family = _socket.AF_INET6
+            sa6.sin6_port = _socket.htons(port)
+            sa6.sin6_flowinfo = _socket.htonl(flowinfo) # I'm unsure about byteorder here.
             sa6.sin6_scope_id = scope_id # Yes, without htonl.
             sa = sa6
         else:
             raise ValueError("Invalid address argument")
 
-        userdata = _ffi.new_handle(callback)
+        query = self._start_query('getnameinfo', address[0], 'getnameinfo', flags)
+        userdata = _ffi.new_handle((callback, query))
         _global_set.add(userdata)
         _lib.ares_getnameinfo(self._channel[0], _ffi.cast("struct sockaddr*", sa), _ffi.sizeof(sa[0]), flags, _lib._nameinfo_cb, userdata)
+        if query is not None:
+            query.monitor.sent(query)
 
     def set_local_dev(self, dev):
         _lib.ares_set_local_dev(self._channel[0], dev)
@@ -592,7 +930,7 @@ class ares_query_a_result(AresResult):
 
     def __init__(self, ares_addrttl):
         buf = _ffi.new("char[]", _lib.INET6_ADDRSTRLEN)
-        _lib.ares_inet_ntop(socket.AF_INET, _ffi.addressof(ares_addrttl.ipaddr), buf, _lib.INET6_ADDRSTRLEN)
+        _lib.ares_inet_ntop(_socket.AF_INET, _ffi.addressof(ares_addrttl.ipaddr), buf, _lib.INET6_ADDRSTRLEN)
         self.host = maybe_str(_ffi.string(buf, _lib.INET6_ADDRSTRLEN))
         self.ttl = ares_addrttl.ttl
 
@@ -603,7 +941,7 @@ class ares_query_aaaa_result(AresResult):
 
     def __init__(self, ares_addrttl):
         buf = _ffi.new("char[]", _lib.INET6_ADDRSTRLEN)
-        _lib.ares_inet_ntop(socket.AF_INET6, _ffi.addressof(ares_addrttl.ip6addr), buf, _lib.INET6_ADDRSTRLEN)
+        _lib.ares_inet_ntop(_socket.AF_INET6, _ffi.addressof(ares_addrttl.ip6addr), buf, _lib.INET6_ADDRSTRLEN)
         self.host = maybe_str(_ffi.string(buf, _lib.INET6_ADDRSTRLEN))
         self.ttl = ares_addrttl.ttl
 
@@ -736,6 +1074,19 @@ class ares_nameinfo_result(AresResult):
         self.service = maybe_str(_ffi.string(service)) if service != _ffi.NULL else None
 
 
+# Submodules which are imported on first access as attributes of the package,
+# on Python 3.7+ only; code which supports older versions must import them.
+_lazy_submodules = ('cache', 'capture', 'hosts', 'openmetrics', 'overlay', 'ratelimit', 'router', 'stats', 'testing',
+                    'upstream')
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        import importlib
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
 __all__ = exported_pycares_symbols + list(exported_pycares_symbols_map.keys()) + ['AresError', 'Channel', 'errno', '__version__']
 
 del exported_pycares_symbols, exported_pycares_symbols_map
@@ -1,20 +1,30 @@
 
+import argparse
 import collections.abc
+import json
 import pycares
 import select
 import socket
 import sys
+import time
 
 
 def wait_channel(channel):
+    # Channel groups may have queries waiting for a timer (e.g. a rate limit)
+    # and no socket open.
     while True:
         read_fds, write_fds = channel.getsock()
-        if not read_fds and not write_fds:
+        idle = not read_fds and not write_fds
+        if idle and not getattr(channel, 'pending', 0):
             break
         timeout = channel.timeout()
         if not timeout:
             channel.process_fd(pycares.ARES_SOCKET_BAD, pycares.ARES_SOCKET_BAD)
             continue
+        if idle:
+            time.sleep(timeout)
+            channel.process_fd(pycares.ARES_SOCKET_BAD, pycares.ARES_SOCKET_BAD)
+            continue
         rlist, wlist, xlist = select.select(read_fds, write_fds, [], timeout)
         for fd in rlist:
             channel.process_fd(fd, pycares.ARES_SOCKET_BAD)
@@ -22,61 +32,245 @@ def wait_channel(channel):
             channel.process_fd(pycares.ARES_SOCKET_BAD, fd)
 
 
-def cb(result, error):
-    if error is not None:
-        print('Error: (%d) %s' % (error, pycares.errno.strerror(error)))
-    else:
+def rdata(r):
+    if r.type in ('A', 'AAAA'):
+        return r.host
+    elif r.type == 'CNAME':
+        return r.cname
+    elif r.type == 'MX':
+        return '%d %s' % (r.priority, r.host)
+    elif r.type == 'NAPTR':
+        return '%d %d "%s" "%s" "%s" %s' % (r.order, r.preference, r.flags, r.service, r.regex, r.replacement)
+    elif r.type == 'NS':
+        return r.host
+    elif r.type == 'PTR':
+        return r.name
+    elif r.type == 'SOA':
+        return '%s %s %d %d %d %d %d' % (r.nsname, r.hostmaster, r.serial, r.refresh, r.retry, r.expires, r.minttl)
+    elif r.type == 'SRV':
+        return '%d %d %d %s' % (r.priority, r.weight, r.port, r.host)
+    elif r.type == 'TXT':
+        text = r.text.decode('utf-8', 'backslashreplace') if isinstance(r.text, bytes) else r.text
+        return '"%s"' % text
+
+
+def records(result):
+    if result is None:
+        return []
+    if not isinstance(result, collections.abc.Iterable):
+        return [result]
+    return result
+
+
+def query_type(name):
+    try:
+        return getattr(pycares, 'QUERY_TYPE_%s' % name.upper())
+    except AttributeError:
+        raise ValueError('Invalid query type: %s' % name)
+
+
+# Single query, dig like output
+#
+
+def dig(channel, hostname, qtype):
+    def cb(result, error):
+        if error is not None:
+            print('Error: (%d) %s' % (error, pycares.errno.strerror(error)))
+            return
+
         parts = [
             ';; QUESTION SECTION:',
             ';%s\t\t\tIN\t%s' % (hostname, qtype.upper()),
             '',
             ';; ANSWER SECTION:'
         ]
+        for r in records(result):
+            parts.append('%s\t\t%d\tIN\t%s\t%s' % (hostname, r.ttl, r.type, rdata(r)))
+        print('\n'.join(parts))
 
-        if not isinstance(result, collections.abc.Iterable):
-            result = [result]
-
-        for r in result:
-            txt = '%s\t\t%d\tIN\t%s' % (hostname, r.ttl, r.type)
-            if r.type in ('A', 'AAAA'):
-                parts.append('%s\t%s' % (txt, r.host))
-            elif r.type == 'CNAME':
-                parts.append('%s\t%s' % (txt, r.cname))
-            elif r.type == 'MX':
-                parts.append('%s\t%d %s' % (txt, r.priority, r.host))
-            elif r.type == 'NAPTR':
-                parts.append('%s\t%d %d "%s" "%s" "%s" %s' % (txt, r.order, r.preference, r.flags, r.service, r.regex, r.replacement))
-            elif r.type == 'NS':
-                parts.append('%s\t%s' % (txt, r.host))
-            elif r.type == 'PTR':
-                parts.append('%s\t%s' % (txt, r.name))
-            elif r.type == 'SOA':
-                parts.append('%s\t%s %s %d %d %d %d %d' % (txt, r.nsname, r.hostmaster, r.serial, r.refresh, r.retry, r.expires, r.minttl))
-            elif r.type == 'SRV':
-                parts.append('%s\t%d %d %d %s' % (txt, r.priority, r.weight, r.port, r.host))
-            elif r.type == 'TXT':
-                parts.append('%s\t"%s"' % (txt, r.text))
+    channel.query(hostname, query_type(qtype), cb)
+    wait_channel(channel)
+
+
+# Bulk mode
+#
+
+def read_names(f):
+    for line in f:
+        name = line.strip()
+        if name and not name.startswith('#'):
+            yield name
+
+
+def _json_default(o):
+    if isinstance(o, bytes):
+        return o.decode('utf-8', 'backslashreplace')
+    raise TypeError(repr(o))
+
+
+def format_jsonl(name, qtype, status, result, elapsed):
+    answers = []
+    for r in records(result):
+        answer = {'type': r.type}
+        for attr in r.__slots__:
+            answer[attr] = getattr(r, attr)
+        answers.append(answer)
+    return json.dumps({'name': name, 'type': qtype, 'status': status, 'elapsed': round(elapsed, 6), 'answers': answers},
+                      default=_json_default, ensure_ascii=False)
+
+
+def format_tsv(name, qtype, status, result, elapsed):
+    answers = ['%s %d %s' % (r.type, r.ttl, rdata(r)) for r in records(result)]
+    return '\t'.join([name, qtype, status, '%.6f' % elapsed] + answers).replace('\n', ' ')
+
+
+FORMATS = {
+    'jsonl': format_jsonl,
+    'tsv': format_tsv,
+}
+
+
+class BulkResolver:
+
+    def __init__(self, channel, names, qtypes, concurrency, formatter, out):
+        self.channel = channel
+        self.queries = ((name, qtype) for name in names for qtype in qtypes)
+        self.concurrency = concurrency
+        self.formatter = formatter
+        self.out = out
+        self.inflight = 0
+        self.completed = 0
+        self.statuses = {}
+
+    def _complete(self, name, qtype, result, error, elapsed):
+        status = 'NOERROR' if error is None else pycares.errno.errorcode.get(error, str(error))
+        self.completed += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.out.write(self.formatter(name, qtype, status, result, elapsed) + '\n')
+
+    def _submit(self, name, qtype):
+        started = time.perf_counter()
+
+        def cb(result, error):
+            self.inflight -= 1
+            self._complete(name, qtype, result, error, time.perf_counter() - started)
+
+        self.inflight += 1
+        try:
+            self.channel.query(name, query_type(qtype), cb)
+        except ValueError:
+            # the name can not be encoded (IDNA), report it and go on
+            self.inflight -= 1
+            self._complete(name, qtype, None, pycares.errno.ARES_EBADNAME, time.perf_counter() - started)
+
+    def _fill(self):
+        # Callbacks may run synchronously (e.g. for invalid names), so keep
+        # going until the limit is reached or the input is exhausted.
+        while self.inflight < self.concurrency:
+            try:
+                name, qtype = next(self.queries)
+            except StopIteration:
+                return
+            self._submit(name, qtype)
+
+    def run(self):
+        channel = self.channel
+        while True:
+            self._fill()
+            if not self.inflight:
+                break
+            read_fds, write_fds = channel.getsock()
+            if not read_fds and not write_fds:
+                time.sleep(channel.timeout(0.1))
+                channel.process_fd(pycares.ARES_SOCKET_BAD, pycares.ARES_SOCKET_BAD)
+                continue
+            timeout = channel.timeout()
+            if not timeout:
+                channel.process_fd(pycares.ARES_SOCKET_BAD, pycares.ARES_SOCKET_BAD)
+                continue
+            rlist, wlist, xlist = select.select(read_fds, write_fds, [], timeout)
+            for fd in rlist:
+                channel.process_fd(fd, pycares.ARES_SOCKET_BAD)
+            for fd in wlist:
+                channel.process_fd(pycares.ARES_SOCKET_BAD, fd)
+            self.out.flush()
+        self.out.flush()
+
+    def summary(self, elapsed):
+        qps = self.completed / elapsed if elapsed > 0 else 0.0
+        counts = ', '.join('%d %s' % (n, status) for status, n in sorted(self.statuses.items(), key=lambda i: (-i[1], i[0])))
+        return ';; %d queries in %.3f seconds (%.1f qps)%s' % (self.completed, elapsed, qps, ': ' + counts if counts else '')
+
+
+def bulk(channel, args):
+    qtypes = [t.strip().upper() for t in args.types.split(',') if t.strip()]
+    for qtype in qtypes:
+        query_type(qtype)
+
+    f = sys.stdin if args.file == '-' else open(args.file)
+    try:
+        resolver = BulkResolver(channel, read_names(f), qtypes, args.concurrency, FORMATS[args.format], sys.stdout)
+        start = time.perf_counter()
+        resolver.run()
+        elapsed = time.perf_counter() - start
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+    if not args.quiet:
+        print(resolver.summary(elapsed), file=sys.stderr)
+    return resolver
 
-        print('\n'.join(parts))
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m pycares',
+                                     usage='%(prog)s [options] [query_type] hostname\n'
+                                           '       %(prog)s [options] -f FILE [-t TYPES] [-c N] [--format {jsonl,tsv}]',
+                                     description='Resolve names with pycares.')
+    parser.add_argument('args', nargs='*', metavar='[query_type] hostname', help=argparse.SUPPRESS)
+    parser.add_argument('-f', '--file', help='bulk mode: read names from this file, one per line ("-" for stdin)')
+    parser.add_argument('-t', '--types', default='A', help='bulk mode: comma separated query types (default: A)')
+    parser.add_argument('-c', '--concurrency', type=int, default=100, help='bulk mode: maximum queries in flight (default: 100)')
+    parser.add_argument('--format', choices=sorted(FORMATS), default='jsonl', help='bulk mode: output format (default: jsonl)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='bulk mode: do not print the summary')
+    parser.add_argument('-s', '--servers', help='comma separated name servers to use')
+    parser.add_argument('-p', '--port', type=int, help='name server port')
+    parser.add_argument('--timeout', type=float, help='query timeout, in seconds')
+    parser.add_argument('--tries', type=int, help='number of tries per query')
+    args = parser.parse_args(argv)
 
-channel = pycares.Channel()
+    if args.file is None and len(args.args) not in (1, 2):
+        print('Invalid arguments! Usage: python -m pycares [query_type] hostname')
+        sys.exit(1)
+    if args.file is not None and args.args:
+        parser.error('names can not be given as arguments in bulk mode')
+    if args.concurrency < 1:
+        parser.error('concurrency must be at least 1')
 
-if len(sys.argv) not in (2, 3):
-    print('Invalid arguments! Usage: python -m pycares [query_type] hostname')
-    sys.exit(1)
+    options = {}
+    if args.servers:
+        options['servers'] = [s.strip() for s in args.servers.split(',') if s.strip()]
+    if args.port is not None:
+        options['udp_port'] = options['tcp_port'] = args.port
+    if args.timeout is not None:
+        options['timeout'] = args.timeout
+    if args.tries is not None:
+        options['tries'] = args.tries
+    channel = pycares.Channel(**options)
 
-if len(sys.argv) == 2:
-    _, hostname = sys.argv
-    qtype = 'A'
-else:
-    _, qtype, hostname = sys.argv
+    try:
+        if args.file is not None:
+            bulk(channel, args)
+        else:
+            if len(args.args) == 1:
+                qtype, hostname = 'A', args.args[0]
+            else:
+                qtype, hostname = args.args
+            dig(channel, hostname, qtype)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
 
-try:
-    query_type = getattr(pycares, 'QUERY_TYPE_%s' % qtype.upper())
-except Exception:
-    print('Invalid query type: %s' % qtype)
-    sys.exit(1)
 
-channel.query(hostname, query_type, cb)
-wait_channel(channel)
+if __name__ == '__main__':
+    main()
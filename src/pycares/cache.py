@@ -0,0 +1,382 @@
+
+import collections
+import time
+
+from . import QUERY_CLASS_IN, errno
+from .ratelimit import TokenBucket
+from .router import ChannelGroup
+from .utils import normalize_name
+
+
+_clock = time.perf_counter
+
+# Answers which are cached, besides successful ones
+_NEGATIVE = frozenset((errno.ARES_ENOTFOUND, errno.ARES_ENODATA))
+
+# Statuses meaning the upstreams could not answer, for which a stale answer
+# is served if there is one (c-ares reports SERVFAIL and REFUSED answers as
+# ARES_ECONNREFUSED).
+_FAILURES = frozenset((errno.ARES_ETIMEOUT, errno.ARES_ECONNREFUSED, errno.ARES_ESERVFAIL, errno.ARES_EREFUSED))
+
+
+class StaleResult(list):
+    # List result served from an expired cache entry.
+    stale = True
+
+
+def _stale_repr(self):
+    cls = self.__class__.__base__
+    attrs = ['%s=%s' % (a, getattr(self, a)) for a in cls.__slots__]
+    return '<%s> %s, stale' % (cls.__name__, ', '.join(attrs))
+
+
+_stale_classes = {}
+
+
+def _stale_record(record, ttl):
+    # Return a copy of record flagged as stale, with the given TTL.
+    cls = record.__class__
+    stale_cls = _stale_classes.get(cls)
+    if stale_cls is None:
+        stale_cls = _stale_classes[cls] = type(cls.__name__, (cls,), {
+            '__slots__': (), '__repr__': _stale_repr, 'stale': True})
+    copy = stale_cls.__new__(stale_cls)
+    for name in cls.__slots__:
+        setattr(copy, name, getattr(record, name))
+    if copy.ttl >= 0:
+        copy.ttl = ttl
+    return copy
+
+
+def _stale_result(result, ttl):
+    if isinstance(result, list):
+        return StaleResult(_stale_record(r, ttl) for r in result)
+    if result is None:
+        return None
+    return _stale_record(result, ttl)
+
+
+def _copy(result):
+    # Every callback gets its own list, so that one modifying it does not
+    # change the cached answer.
+    if isinstance(result, list):
+        return type(result)(result)
+    return result
+
+
+def is_stale(result):
+    # Return True if result was served from an expired cache entry.
+    return getattr(result, 'stale', False)
+
+
+def _ttl(result):
+    # Return the smallest TTL of the records, or None if none is known.
+    records = result if isinstance(result, list) else (result,)
+    ttls = [r.ttl for r in records if r.ttl >= 0]
+    return min(ttls) if ttls else None
+
+
+# Seeds of the hash functions of the four rows of a FrequencySketch, odd 64
+# bit constants, and the table halving every counter.
+_SEED0 = 0x9e3779b97f4a7c15
+_SEED1 = 0xc2b2ae3d27d4eb4f
+_SEED2 = 0x165667b19e3779f9
+_SEED3 = 0xd6e8feb86659fd93
+_MASK64 = (1 << 64) - 1
+_HALVE = bytes(i >> 1 for i in range(256))
+
+# Largest value of a FrequencySketch counter
+_MAX_COUNT = 15
+
+
+class FrequencySketch:
+    # Count-min sketch estimating how often keys were seen, with one row of
+    # width counters per hash function. Every sample_size increments all the
+    # counters are halved, so that the estimates favor recent activity.
+
+    def __init__(self, width, sample_size=None):
+        bits = max(4, (max(1, width) - 1).bit_length())
+        self.width = 1 << bits
+        self._shift = 64 - bits
+        self._rows = [bytearray(self.width) for _ in range(4)]
+        self.sample_size = sample_size if sample_size is not None else 10 * self.width
+        self.additions = 0
+
+    def _indexes(self, key):
+        # The counter of key in each row: the high bits of the hash
+        # multiplied by the seed of the row.
+        h = hash(key) & _MASK64
+        shift = self._shift
+        return (((h * _SEED0) & _MASK64) >> shift, ((h * _SEED1) & _MASK64) >> shift,
+                ((h * _SEED2) & _MASK64) >> shift, ((h * _SEED3) & _MASK64) >> shift)
+
+    def increment(self, key):
+        i0, i1, i2, i3 = self._indexes(key)
+        r0, r1, r2, r3 = self._rows
+        if r0[i0] < _MAX_COUNT:
+            r0[i0] += 1
+        if r1[i1] < _MAX_COUNT:
+            r1[i1] += 1
+        if r2[i2] < _MAX_COUNT:
+            r2[i2] += 1
+        if r3[i3] < _MAX_COUNT:
+            r3[i3] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.age()
+
+    def estimate(self, key):
+        i0, i1, i2, i3 = self._indexes(key)
+        r0, r1, r2, r3 = self._rows
+        return min(r0[i0], r1[i1], r2[i2], r3[i3])
+
+    def age(self):
+        for row in self._rows:
+            row[:] = row.translate(_HALVE)
+        self.additions //= 2
+
+    def reset(self):
+        for row in self._rows:
+            row[:] = bytes(self.width)
+        self.additions = 0
+
+
+class _Entry:
+    __slots__ = ('result', 'status', 'ttl', 'expires', 'stale_until', 'hits')
+
+    def __init__(self, result, status, ttl, expires, stale_until):
+        self.result = result
+        self.status = status
+        self.ttl = ttl
+        self.expires = expires
+        self.stale_until = stale_until
+        self.hits = 0
+
+
+class _Lookup:
+    # A query sent upstream, and the callbacks waiting for it.
+    __slots__ = ('callbacks', 'entry', 'timer', 'timed_out')
+
+    def __init__(self, entry):
+        self.callbacks = []
+        self.entry = entry
+        self.timer = None
+        self.timed_out = False
+
+
+class ResponseCache(ChannelGroup):
+    # Caches the answers to query() calls, for the smallest TTL of their
+    # records clamped to [min_ttl, max_ttl]. Negative answers (ARES_ENOTFOUND
+    # and ARES_ENODATA) are cached for negative_ttl seconds, and answers whose
+    # records carry no TTL for default_ttl seconds. Queries for a name which
+    # is already being looked up wait for that lookup.
+    #
+    # With stale_ttl set, expired entries are kept that many more seconds. If
+    # the upstreams fail to answer a query for one of them, or do not answer
+    # within stale_timeout seconds, the expired answer is served instead, as in
+    # RFC 8767, with stale_answer_ttl as the TTL of its records.
+    #
+    # With prefetch set, an entry hit at least prefetch_hits times which is in
+    # the last prefetch fraction of its TTL is refreshed in the background, at
+    # most prefetch_rate times per second.
+    #
+    # Entries are evicted least recently used first. With eviction='tinylfu',
+    # a new entry only replaces the least recently used one if its key was
+    # queried more often according to a FrequencySketch of recent queries, so
+    # that names queried once do not flush the popular ones.
+    #
+    # The other methods are passed to the resolver, a Channel or another
+    # group, created from channel_options if not given.
+
+    def __init__(self, resolver=None, max_entries=10000, min_ttl=0, max_ttl=86400, negative_ttl=60, default_ttl=60,
+                 stale_ttl=0, stale_timeout=None, stale_answer_ttl=30, prefetch=None, prefetch_hits=2, prefetch_rate=10,
+                 eviction='lru', sock_state_cb=None, **channel_options):
+        super().__init__(sock_state_cb)
+        if eviction not in ('lru', 'tinylfu'):
+            raise ValueError('invalid eviction policy: %r' % (eviction,))
+        if resolver is None:
+            resolver = self._make_channel(**channel_options)
+        else:
+            self._add_channel(resolver)
+        self.resolver = resolver
+        self.max_entries = max_entries
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.negative_ttl = negative_ttl
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.stale_timeout = stale_timeout
+        self.stale_answer_ttl = stale_answer_ttl
+        self.prefetch = prefetch
+        self.prefetch_hits = prefetch_hits
+        self._prefetch_bucket = TokenBucket(prefetch_rate) if prefetch_rate is not None else None
+        self.eviction = eviction
+        self._sketch = FrequencySketch(max_entries) if eviction == 'tinylfu' else None
+        self._entries = collections.OrderedDict()
+        self._lookups = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.prefetches = 0
+        self.prefetch_throttled = 0
+        self.rejected = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def snapshot(self):
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'evictions': self.evictions,
+            'prefetches': self.prefetches,
+            'prefetch_throttled': self.prefetch_throttled,
+            'rejected': self.rejected,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        if self._sketch is not None:
+            self._sketch.reset()
+
+    def _store(self, key, result, status, now):
+        if status is None:
+            ttl = _ttl(result)
+            ttl = min(max(ttl if ttl is not None else self.default_ttl, self.min_ttl), self.max_ttl)
+        else:
+            ttl = self.negative_ttl
+        if ttl <= 0 and not self.stale_ttl:
+            return
+        entries = self._entries
+        if self._sketch is not None and key not in entries and len(entries) >= self.max_entries > 0:
+            # admit the new entry only if it is queried more often than the
+            # one it would evict, or if that one is past its stale window
+            victim_key = next(iter(entries))
+            if (now < entries[victim_key].stale_until and
+                    self._sketch.estimate(key) <= self._sketch.estimate(victim_key)):
+                self.rejected += 1
+                return
+            del entries[victim_key]
+            self.evictions += 1
+        entries[key] = _Entry(result, status, ttl, now + ttl, now + ttl + self.stale_ttl)
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def _can_serve_stale(self, entry):
+        # A prefetched entry may be past its stale window, or have none at
+        # all, by the time its lookup fails.
+        return entry is not None and self.stale_ttl > 0 and _clock() < entry.stale_until
+
+    def _serve_stale(self, lookup):
+        entry = lookup.entry
+        result = _stale_result(entry.result, self.stale_answer_ttl)
+        callbacks = lookup.callbacks
+        lookup.callbacks = []
+        self.stale += len(callbacks)
+        for callback in callbacks:
+            callback(_copy(result), entry.status)
+
+    def query(self, name, query_type, callback, query_class=None):
+        if not callable(callback):
+            raise TypeError('a callable is required')
+        name_key = normalize_name(name)
+        if name_key is None:
+            self._submit(self.resolver, callback, 'query', name, query_type, query_class=query_class)
+            return
+        key = (name_key, query_type, query_class if query_class is not None else QUERY_CLASS_IN)
+        if self._sketch is not None:
+            self._sketch.increment(key)
+        entry = self._entries.get(key)
+        if entry is not None:
+            now = _clock()
+            if now < entry.expires:
+                self.hits += 1
+                entry.hits += 1
+                self._entries.move_to_end(key)
+                if (self.prefetch is not None and entry.hits >= self.prefetch_hits and
+                        entry.expires - now <= self.prefetch * entry.ttl):
+                    self._prefetch(key, entry)
+                callback(_copy(entry.result), entry.status)
+                return
+            if now >= entry.stale_until:
+                del self._entries[key]
+                entry = None
+        lookup = self._lookups.get(key)
+        if lookup is not None:
+            if lookup.timed_out:
+                lookup.callbacks.append(callback)
+                self._serve_stale(lookup)
+            else:
+                self.misses += 1
+                lookup.callbacks.append(callback)
+            return
+        self.misses += 1
+        self._lookup(key, name, query_type, query_class, entry, callback)
+
+    def _lookup(self, key, name, query_type, query_class, entry, callback=None):
+        # Send the query for key to the resolver. entry is the expired entry
+        # which can be served if it fails, or the entry being prefetched.
+        lookup = self._lookups[key] = _Lookup(entry)
+        if callback is not None:
+            lookup.callbacks.append(callback)
+
+        def cb(result, errorno):
+            del self._lookups[key]
+            if lookup.timer is not None:
+                self._cancel_timer(lookup.timer)
+            if errorno is None or errorno in _NEGATIVE:
+                self._store(key, result, errorno, _clock())
+            elif errorno in _FAILURES and self._can_serve_stale(lookup.entry):
+                self._serve_stale(lookup)
+                return
+            callbacks = lookup.callbacks
+            lookup.callbacks = []
+            for callback in callbacks:
+                callback(_copy(result), errorno)
+
+        def timeout():
+            lookup.timer = None
+            if not self._can_serve_stale(lookup.entry):
+                return
+            lookup.timed_out = True
+            self._serve_stale(lookup)
+
+        try:
+            self._submit(self.resolver, cb, 'query', name, query_type, query_class=query_class)
+        except Exception:
+            self._lookups.pop(key, None)
+            raise
+        if (callback is not None and entry is not None and self.stale_timeout is not None and
+                self._lookups.get(key) is lookup):
+            lookup.timer = self._call_later(self.stale_timeout, timeout)
+
+    def _prefetch(self, key, entry):
+        # Refresh a popular entry about to expire in the background.
+        if key in self._lookups:
+            return
+        if self._prefetch_bucket is not None and not self._prefetch_bucket.take():
+            self.prefetch_throttled += 1
+            return
+        self.prefetches += 1
+        name, query_type, query_class = key
+        self._lookup(key, name, query_type, query_class, entry)
+
+    def search(self, name, query_type, callback, query_class=None):
+        self._submit(self.resolver, callback, 'search', name, query_type, query_class=query_class)
+
+    def gethostbyname(self, name, family, callback):
+        self._submit(self.resolver, callback, 'gethostbyname', name, family)
+
+    def gethostbyaddr(self, addr, callback):
+        self._submit(self.resolver, callback, 'gethostbyaddr', addr)
+
+    def getnameinfo(self, address, flags, callback):
+        self._submit(self.resolver, callback, 'getnameinfo', address, flags)
+
+
+__all__ = ['FrequencySketch', 'ResponseCache', 'StaleResult', 'is_stale']
@@ -0,0 +1,360 @@
+
+import select
+import struct
+import sys
+import time
+
+from . import ARES_SOCKET_BAD, Channel, errno
+from .stats import LatencyHistogram
+
+
+# File format: a header followed by query and response records, all big
+# endian. Times are seconds since the start of the capture.
+#
+#   header:   magic (6s), version (B), flags (B), start time since the epoch (d)
+#   query:    kind=1 (B), method (B), id (I), time (d), type (H), class / family / flags (H), name length (H), name
+#   response: kind=2 (B), id (I), time (d), status (H), response length (I), response
+#
+# The response is the raw DNS message, only captured for query / search and
+# when the recorder was created with responses=True.
+
+MAGIC = b'PYCCAP'
+VERSION = 1
+
+_FLAG_RESPONSES = 1
+
+_KIND_QUERY = 1
+_KIND_RESPONSE = 2
+
+_HEADER = struct.Struct('!6sBBd')
+_QUERY = struct.Struct('!BBIdHHH')
+_RESPONSE = struct.Struct('!BIdHI')
+
+METHODS = ('query', 'search', 'gethostbyname', 'gethostbyaddr', 'getnameinfo')
+_METHOD_CODES = {m: i for i, m in enumerate(METHODS)}
+
+_clock = time.perf_counter
+
+
+class Recorder:
+
+    def __init__(self, file, responses=False):
+        if isinstance(file, (str, bytes)):
+            self._file = open(file, 'wb')
+            self._close = True
+        else:
+            self._file = file
+            self._close = False
+        self.responses = responses
+        self.queries = 0
+        self._started = _clock()
+        self._file.write(_HEADER.pack(MAGIC, VERSION, _FLAG_RESPONSES if responses else 0, time.time()))
+
+    def submit(self, query_id, method, query_type, arg, name):
+        if isinstance(name, str):
+            name = name.encode('utf-8')
+        if not isinstance(query_type, int):
+            query_type = 0
+        self._file.write(_QUERY.pack(_KIND_QUERY, _METHOD_CODES[method], query_id & 0xffffffff, _clock() - self._started,
+                                     query_type, arg & 0xffff, len(name)) + name)
+        self.queries += 1
+
+    def complete(self, query_id, status, response):
+        if not self.responses:
+            return
+        response = response or b''
+        self._file.write(_RESPONSE.pack(_KIND_RESPONSE, query_id & 0xffffffff, _clock() - self._started, status, len(response)) +
+                         response)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if self._close:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CapturedQuery:
+    __slots__ = ('id', 'timestamp', 'method', 'type', 'arg', 'name', 'status', 'response', 'elapsed')
+
+    def __init__(self, id, timestamp, method, type, arg, name):
+        self.id = id
+        self.timestamp = timestamp
+        self.method = method
+        self.type = type
+        self.arg = arg
+        self.name = name
+        self.status = None
+        self.response = None
+        self.elapsed = None
+
+    def __repr__(self):
+        return '<%s> id=%d, timestamp=%.6f, method=%s, type=%d, name=%s, status=%s' % (self.__class__.__name__,
+                                                                                     self.id,
+                                                                                     self.timestamp,
+                                                                                     self.method,
+                                                                                     self.type,
+                                                                                     self.name,
+                                                                                     self.status)
+
+
+class Capture:
+
+    def __init__(self, started, responses, queries):
+        self.started = started
+        self.responses = responses
+        self.queries = queries
+
+    @property
+    def duration(self):
+        if not self.queries:
+            return 0.0
+        return self.queries[-1].timestamp - self.queries[0].timestamp
+
+
+def _read_exactly(f, n):
+    data = f.read(n)
+    if len(data) != n:
+        raise ValueError('truncated capture file')
+    return data
+
+
+def load(file):
+    if isinstance(file, (str, bytes)):
+        with open(file, 'rb') as f:
+            return load(f)
+    f = file
+
+    magic, version, flags, started = _HEADER.unpack(_read_exactly(f, _HEADER.size))
+    if magic != MAGIC:
+        raise ValueError('not a pycares capture file')
+    if version != VERSION:
+        raise ValueError('unsupported capture file version: %d' % version)
+
+    queries = []
+    pending = {}
+    while True:
+        kind = f.read(1)
+        if not kind:
+            break
+        if kind[0] == _KIND_QUERY:
+            _, method, query_id, timestamp, query_type, arg, length = _QUERY.unpack(kind + _read_exactly(f, _QUERY.size - 1))
+            name = _read_exactly(f, length).decode('utf-8')
+            query = CapturedQuery(query_id, timestamp, METHODS[method], query_type, arg, name)
+            queries.append(query)
+            pending[query_id] = query
+        elif kind[0] == _KIND_RESPONSE:
+            _, query_id, timestamp, status, length = _RESPONSE.unpack(kind + _read_exactly(f, _RESPONSE.size - 1))
+            response = _read_exactly(f, length)
+            query = pending.pop(query_id, None)
+            if query is not None:
+                query.status = status
+                query.response = response or None
+                query.elapsed = timestamp - query.timestamp
+        else:
+            raise ValueError('invalid record kind: %d' % kind[0])
+
+    return Capture(started, bool(flags & _FLAG_RESPONSES), queries)
+
+
+def build_zone(capture):
+    # A pycares.testing.Zone answering with the captured responses.
+    from .testing import Zone, dns
+
+    zone = Zone()
+    for query in capture.queries:
+        if query.response is not None:
+            try:
+                question = dns.parse_query(query.response)
+            except (ValueError, IndexError, struct.error):
+                continue
+            zone.add_response(question.name, question.type, query.response)
+    return zone
+
+
+class Replayer:
+
+    def __init__(self, capture, channel, speed=1.0, concurrency=None):
+        if speed is not None and speed <= 0:
+            raise ValueError('speed must be positive')
+        self.queries = [q for q in capture.queries if q.method != 'getnameinfo']
+        self.channel = channel
+        self.speed = speed
+        self.concurrency = concurrency
+        self.inflight = 0
+        self.completed = 0
+        self.statuses = {}
+        self.histogram = LatencyHistogram()
+        self.elapsed = 0.0
+
+    def _submit(self, query):
+        started = _clock()
+
+        def cb(result, error):
+            self.histogram.record(_clock() - started)
+            self.inflight -= 1
+            self.completed += 1
+            status = error if error is not None else 0
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+        self.inflight += 1
+        channel = self.channel
+        if query.method == 'query':
+            channel.query(query.name, query.type, cb, query_class=query.arg)
+        elif query.method == 'search':
+            channel.search(query.name, query.type, cb, query_class=query.arg)
+        elif query.method == 'gethostbyname':
+            channel.gethostbyname(query.name, query.arg, cb)
+        elif query.method == 'gethostbyaddr':
+            channel.gethostbyaddr(query.name, cb)
+
+    def _pump(self, start):
+        # Submit every query which is due, return the delay until the next one
+        # or None if there is nothing left to submit.
+        queries = self.queries
+        base = queries[0].timestamp if queries else 0.0
+        while self._next < len(queries):
+            if self.concurrency is not None and self.inflight >= self.concurrency:
+                return None
+            query = queries[self._next]
+            if self.speed is not None:
+                delay = start + (query.timestamp - base) / self.speed - _clock()
+                if delay > 0:
+                    return delay
+            self._next += 1
+            self._submit(query)
+        return None
+
+    def run(self):
+        channel = self.channel
+        self._next = 0
+        start = _clock()
+        while True:
+            delay = self._pump(start)
+            if not self.inflight and self._next == len(self.queries):
+                break
+            read_fds, write_fds = channel.getsock()
+            if not read_fds and not write_fds:
+                time.sleep(delay if delay is not None else channel.timeout(0.1))
+                channel.process_fd(ARES_SOCKET_BAD, ARES_SOCKET_BAD)
+                continue
+            timeout = channel.timeout(delay)
+            if not timeout:
+                channel.process_fd(ARES_SOCKET_BAD, ARES_SOCKET_BAD)
+                continue
+            rlist, wlist, _ = select.select(read_fds, write_fds, [], timeout)
+            if not rlist and not wlist:
+                channel.process_fd(ARES_SOCKET_BAD, ARES_SOCKET_BAD)
+            for fd in rlist:
+                channel.process_fd(fd, ARES_SOCKET_BAD)
+            for fd in wlist:
+                channel.process_fd(ARES_SOCKET_BAD, fd)
+        self.elapsed = _clock() - start
+        return self
+
+
+def _status_name(status):
+    return 'NOERROR' if status == 0 else errno.errorcode.get(status, str(status))
+
+
+def _info(args):
+    capture = load(args.file)
+    print('started:   %s' % time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(capture.started)))
+    print('duration:  %.3f seconds' % capture.duration)
+    print('queries:   %d' % len(capture.queries))
+    print('responses: %s' % ('yes' if capture.responses else 'no'))
+    methods = {}
+    for q in capture.queries:
+        methods[q.method] = methods.get(q.method, 0) + 1
+    for method, n in sorted(methods.items()):
+        print('  %-14s %d' % (method, n))
+    if capture.responses:
+        statuses = {}
+        for q in capture.queries:
+            if q.status is not None:
+                statuses[q.status] = statuses.get(q.status, 0) + 1
+        for status, n in sorted(statuses.items()):
+            print('  %-14s %d' % (_status_name(status), n))
+
+
+def _replay(args):
+    capture = load(args.file)
+    options = {}
+    server = None
+    if args.stub:
+        from .testing import StubServer
+        server = StubServer(build_zone(capture)).start()
+        options.update(server.channel_options)
+    else:
+        if args.servers:
+            options['servers'] = [s.strip() for s in args.servers.split(',') if s.strip()]
+        if args.port is not None:
+            options['udp_port'] = options['tcp_port'] = args.port
+    if args.timeout is not None:
+        options['timeout'] = args.timeout
+    if args.tries is not None:
+        options['tries'] = args.tries
+
+    try:
+        channel = Channel(**options)
+        replayer = Replayer(capture, channel, speed=None if args.fast else args.speed, concurrency=args.concurrency)
+        replayer.run()
+    finally:
+        if server is not None:
+            server.stop()
+
+    elapsed = replayer.elapsed
+    histogram = replayer.histogram
+    print('%d queries in %.3f seconds (%.1f qps), captured over %.3f seconds' % (
+        replayer.completed, elapsed, replayer.completed / elapsed if elapsed > 0 else 0.0, capture.duration))
+    print('latency: p50 %.3f ms, p99 %.3f ms, max %.3f ms' % (
+        histogram.percentile(50) * 1000, histogram.percentile(99) * 1000, (histogram.max or 0) / 1000.0))
+    for status, n in sorted(replayer.statuses.items()):
+        print('  %-18s %d' % (_status_name(status), n))
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m pycares.capture', description='Inspect and replay pycares query captures.')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    info = commands.add_parser('info', help='summarize a capture file')
+    info.add_argument('file')
+    info.set_defaults(func=_info)
+
+    replay = commands.add_parser('replay', help='re-issue the queries in a capture file')
+    replay.add_argument('file')
+    pacing = replay.add_mutually_exclusive_group()
+    pacing.add_argument('--speed', type=float, default=1.0, help='replay speed relative to the original pacing (default: 1.0)')
+    pacing.add_argument('--fast', action='store_true', help='replay as fast as possible')
+    replay.add_argument('-c', '--concurrency', type=int, help='maximum queries in flight')
+    replay.add_argument('--stub', action='store_true', help='answer from a local stub server serving the captured responses')
+    replay.add_argument('-s', '--servers', help='comma separated name servers to use')
+    replay.add_argument('-p', '--port', type=int, help='name server port')
+    replay.add_argument('--timeout', type=float, help='query timeout, in seconds')
+    replay.add_argument('--tries', type=int, help='number of tries per query')
+    replay.set_defaults(func=_replay)
+
+    args = parser.parse_args(argv)
+    try:
+        args.func(args)
+    except (OSError, ValueError) as e:
+        print('Error: %s' % e, file=sys.stderr)
+        sys.exit(1)
+
+
+__all__ = ['Capture', 'CapturedQuery', 'Recorder', 'Replayer', 'build_zone', 'load']
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+
+import _socket
+import os
+import sys
+import time
+
+from . import ares_host_result
+from .utils import normalize_name
+
+
+if sys.platform == 'win32':
+    DEFAULT_PATH = os.path.join(os.environ.get('SystemRoot', 'C:\\Windows'), 'System32', 'drivers', 'etc', 'hosts')
+else:
+    DEFAULT_PATH = '/etc/hosts'
+
+_clock = time.monotonic
+
+
+class _Entry:
+    __slots__ = ('name', 'aliases', 'ipv4', 'ipv6')
+
+    def __init__(self, name, aliases):
+        self.name = name
+        self.aliases = aliases
+        self.ipv4 = []
+        self.ipv6 = []
+
+
+def _host_result(name, aliases, addresses):
+    result = ares_host_result.__new__(ares_host_result)
+    result.name = name
+    result.aliases = list(aliases)
+    result.addresses = list(addresses)
+    return result
+
+
+def _parse_address(text):
+    # Return (family, packed address) or None if text is not an IP address.
+    for family in (_socket.AF_INET, _socket.AF_INET6):
+        try:
+            return family, _socket.inet_pton(family, text)
+        except (OSError, ValueError):
+            pass
+    return None
+
+
+class HostsFile:
+    # In memory index of a hosts file, reloaded when its modification time or
+    # size changes (checked at most every check_interval seconds).
+
+    def __init__(self, path=None, check_interval=1.0):
+        self.path = path if path is not None else DEFAULT_PATH
+        self.check_interval = check_interval
+        self._by_name = {}
+        self._by_address = {}
+        self._signature = None
+        self._checked = None
+        self.reload()
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def reload(self):
+        try:
+            st = os.stat(self.path)
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            st, data = None, b''
+        self._signature = (st.st_mtime_ns, st.st_size) if st is not None else None
+        self._checked = _clock()
+        self._parse(data.decode('utf-8', 'replace'))
+
+    def _parse(self, text):
+        by_name = {}
+        by_address = {}
+        for line in text.splitlines():
+            line = line.split('#', 1)[0].split()
+            if len(line) < 2:
+                continue
+            address = _parse_address(line[0].split('%', 1)[0])
+            if address is None:
+                continue
+            names = [n.rstrip('.') for n in line[1:]]
+            family, packed = address
+            text_address = _socket.inet_ntop(family, packed)
+            if address not in by_address:
+                by_address[address] = (names[0], names[1:])
+            for name in names:
+                key = name.lower()
+                entry = by_name.get(key)
+                if entry is None:
+                    entry = by_name[key] = _Entry(names[0], names[1:])
+                addresses = entry.ipv4 if family == _socket.AF_INET else entry.ipv6
+                if text_address not in addresses:
+                    addresses.append(text_address)
+        self._by_name = by_name
+        self._by_address = by_address
+
+    def check(self):
+        now = _clock()
+        if self.check_interval is not None and now - self._checked < self.check_interval:
+            return
+        self._checked = now
+        try:
+            st = os.stat(self.path)
+            signature = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            signature = None
+        if signature != self._signature:
+            self.reload()
+
+    def gethostbyname(self, name, family):
+        # Return an ares_host_result, or None if the name is not in the file.
+        self.check()
+        key = normalize_name(name)
+        entry = self._by_name.get(key) if key is not None else None
+        if entry is None:
+            return None
+        if family == _socket.AF_INET:
+            addresses = entry.ipv4
+        elif family == _socket.AF_INET6:
+            addresses = entry.ipv6
+        else:
+            addresses = entry.ipv6 or entry.ipv4
+        if not addresses:
+            return None
+        return _host_result(entry.name, entry.aliases, addresses)
+
+    def gethostbyaddr(self, addr):
+        # Return an ares_host_result, or None if the address is not in the file.
+        self.check()
+        address = _parse_address(addr.decode('ascii', 'replace') if isinstance(addr, bytes) else addr)
+        entry = self._by_address.get(address) if address is not None else None
+        if entry is None:
+            return None
+        name, aliases = entry
+        return _host_result(name, aliases, [_socket.inet_ntop(*address)])
+
+
+__all__ = ['DEFAULT_PATH', 'HostsFile']
@@ -0,0 +1,136 @@
+
+import http.server
+import socketserver
+import threading
+
+from . import errno
+from .stats import ChannelStats
+
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{%s}' % ','.join('%s="%s"' % (k, _escape(v)) for k, v in labels)
+
+
+def _cumulative(histogram, buckets):
+    r = []
+    total = 0
+    i = 0
+    for upper, n in histogram.buckets():
+        while i < len(buckets) and upper > buckets[i]:
+            r.append(total)
+            i += 1
+        total += n
+    while i < len(buckets):
+        r.append(total)
+        i += 1
+    return r
+
+
+def render(stats, prefix='pycares', buckets=DEFAULT_BUCKETS):
+    if isinstance(stats, ChannelStats):
+        channels = [((), stats)]
+    else:
+        channels = [((('channel', name),), s) for name, s in sorted(stats.items())]
+
+    def family(name, mtype, help, unit=None):
+        lines.append('# TYPE %s_%s %s' % (prefix, name, mtype))
+        if unit is not None:
+            lines.append('# UNIT %s_%s %s' % (prefix, name, unit))
+        lines.append('# HELP %s_%s %s' % (prefix, name, help))
+
+    def sample(name, labels, value):
+        lines.append('%s_%s%s %s' % (prefix, name, _labels(labels), value))
+
+    lines = []
+
+    family('queries', 'counter', 'Queries submitted.')
+    for labels, s in channels:
+        sample('queries_total', labels, s.submitted)
+
+    family('queries_completed', 'counter', 'Queries completed, successfully or not.')
+    for labels, s in channels:
+        sample('queries_completed_total', labels, s.completed)
+
+    family('query_errors', 'counter', 'Queries completed with an error.')
+    for labels, s in channels:
+        for status, n in sorted(list(s.errors.items())):
+            sample('query_errors_total', labels + (('error', errno.errorcode.get(status, status)),), n)
+
+    family('query_timeouts', 'counter', 'Timeouts (retries) seen by completed queries.')
+    for labels, s in channels:
+        sample('query_timeouts_total', labels, s.timeouts)
+
+    family('slow_callbacks', 'counter', 'Callbacks which exceeded the slow callback threshold.')
+    for labels, s in channels:
+        sample('slow_callbacks_total', labels, s.slow_callbacks)
+
+    family('queries_throttled', 'counter', 'Queries delayed by a rate limit.')
+    for labels, s in channels:
+        sample('queries_throttled_total', labels, s.throttled)
+
+    family('queries_rejected', 'counter', 'Queries rejected by a rate limit with a full wait queue.')
+    for labels, s in channels:
+        sample('queries_rejected_total', labels, s.rejected)
+
+    family('queries_inflight', 'gauge', 'Queries waiting for an answer.')
+    for labels, s in channels:
+        sample('queries_inflight', labels, s.inflight)
+
+    family('query_duration_seconds', 'histogram', 'Time from query submission until its callback is called.', 'seconds')
+    for labels, s in channels:
+        for (server, query_type), histogram in sorted(list(s.latency.items())):
+            hlabels = labels + (('server', server), ('type', query_type))
+            for le, n in zip(buckets, _cumulative(histogram, buckets)):
+                sample('query_duration_seconds_bucket', hlabels + (('le', repr(float(le))),), n)
+            sample('query_duration_seconds_bucket', hlabels + (('le', '+Inf'),), histogram.count)
+            sample('query_duration_seconds_count', hlabels, histogram.count)
+            sample('query_duration_seconds_sum', hlabels, repr(histogram.sum))
+
+    lines.append('# EOF')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = render(self.server.stats, **self.server.render_args).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _MetricsServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+def start_http_server(stats, port=0, addr='127.0.0.1', **render_args):
+    server = _MetricsServer((addr, port), _MetricsHandler)
+    server.stats = stats
+    server.render_args = render_args
+    thread = threading.Thread(target=server.serve_forever, name='pycares-metrics')
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+__all__ = ['CONTENT_TYPE', 'DEFAULT_BUCKETS', 'render', 'start_http_server']
@@ -0,0 +1,270 @@
+
+import _socket
+
+from . import (QUERY_TYPE_A, QUERY_TYPE_AAAA, QUERY_TYPE_ANY, QUERY_TYPE_CNAME, QUERY_TYPE_MX, QUERY_TYPE_NAPTR,
+               QUERY_TYPE_NS, QUERY_TYPE_PTR, QUERY_TYPE_SOA, QUERY_TYPE_SRV, QUERY_TYPE_TXT, errno,
+               ares_host_result, ares_query_a_result, ares_query_aaaa_result, ares_query_cname_result,
+               ares_query_mx_result, ares_query_naptr_result, ares_query_ns_result, ares_query_ptr_result,
+               ares_query_soa_result, ares_query_srv_result, ares_query_txt_result)
+from .utils import maybe_str, normalize_name
+
+
+# Values are given as in pycares.testing.Zone:
+#
+#   A, AAAA:         address
+#   CNAME, NS, PTR:  name
+#   MX:              (priority, host)
+#   NAPTR:           (order, preference, flags, service, regex, replacement)
+#   SOA:             (nsname, hostmaster, serial, refresh, retry, expire, minttl)
+#   SRV:             (priority, weight, port, host)
+#   TXT:             text, or a tuple of character strings
+
+def _result(cls, **attrs):
+    result = cls.__new__(cls)
+    for name, value in attrs.items():
+        setattr(result, name, value)
+    return result
+
+
+def _copy(record):
+    # Results are copies of the stored records, so that callers modifying
+    # them do not change the overlay.
+    cls = record.__class__
+    copy = cls.__new__(cls)
+    for name in cls.__slots__:
+        value = getattr(record, name)
+        setattr(copy, name, list(value) if isinstance(value, list) else value)
+    return copy
+
+
+def _address(family, value):
+    return _socket.inet_ntop(family, _socket.inet_pton(family, value))
+
+
+def _text(value):
+    if isinstance(value, (tuple, list)):
+        value = b''.join(v.encode('utf-8') if isinstance(v, str) else v for v in value)
+    if isinstance(value, str):
+        return value
+    return maybe_str(value)
+
+
+def _make_a(value, ttl):
+    return _result(ares_query_a_result, host=_address(_socket.AF_INET, value), ttl=ttl)
+
+def _make_aaaa(value, ttl):
+    return _result(ares_query_aaaa_result, host=_address(_socket.AF_INET6, value), ttl=ttl)
+
+def _make_cname(value, ttl):
+    return _result(ares_query_cname_result, cname=value, ttl=ttl)
+
+def _make_mx(value, ttl):
+    priority, host = value
+    return _result(ares_query_mx_result, host=host, priority=priority, ttl=ttl)
+
+def _make_naptr(value, ttl):
+    order, preference, flags, service, regex, replacement = value
+    return _result(ares_query_naptr_result, order=order, preference=preference, flags=flags, service=service,
+                   regex=regex, replacement=replacement, ttl=ttl)
+
+def _make_ns(value, ttl):
+    return _result(ares_query_ns_result, host=value, ttl=ttl)
+
+def _make_ptr(value, ttl):
+    return _result(ares_query_ptr_result, name=value, ttl=ttl, aliases=[])
+
+def _make_soa(value, ttl):
+    nsname, hostmaster, serial, refresh, retry, expires, minttl = value
+    return _result(ares_query_soa_result, nsname=nsname, hostmaster=hostmaster, serial=serial, refresh=refresh,
+                   retry=retry, expires=expires, minttl=minttl, ttl=ttl)
+
+def _make_srv(value, ttl):
+    priority, weight, port, host = value
+    return _result(ares_query_srv_result, host=host, port=port, priority=priority, weight=weight, ttl=ttl)
+
+def _make_txt(value, ttl):
+    return _result(ares_query_txt_result, text=_text(value), ttl=ttl)
+
+
+# query type -> (record factory, whether the result is a list)
+_types = {
+    QUERY_TYPE_A: (_make_a, True),
+    QUERY_TYPE_AAAA: (_make_aaaa, True),
+    QUERY_TYPE_CNAME: (_make_cname, False),
+    QUERY_TYPE_MX: (_make_mx, True),
+    QUERY_TYPE_NAPTR: (_make_naptr, True),
+    QUERY_TYPE_NS: (_make_ns, True),
+    QUERY_TYPE_PTR: (_make_ptr, False),
+    QUERY_TYPE_SOA: (_make_soa, False),
+    QUERY_TYPE_SRV: (_make_srv, True),
+    QUERY_TYPE_TXT: (_make_txt, True),
+}
+
+
+class _Node:
+    __slots__ = ('children', 'records')
+
+    def __init__(self):
+        self.children = {}
+        self.records = None
+
+
+class Overlay:
+    # In process answers for exact names and wildcards, consulted by a Channel
+    # before c-ares. Exact names are kept in a dictionary, wildcards in a trie
+    # of reversed labels, "*.svc.local" matches any name below svc.local.
+
+    def __init__(self, records=None):
+        self._names = {}
+        self._wildcards = _Node()
+        self._nwildcards = 0
+        if records is not None:
+            for record in records:
+                self.add(*record)
+
+    def __len__(self):
+        return len(self._names) + self._nwildcards
+
+    def __contains__(self, name):
+        return self._match(normalize_name(name)) is not None
+
+    def _wildcard_node(self, suffix, create=False):
+        node = self._wildcards
+        for label in reversed(suffix.split('.')) if suffix else ():
+            child = node.children.get(label)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[label] = _Node()
+            node = child
+        return node
+
+    def add(self, name, query_type, value, ttl=300):
+        if query_type not in _types:
+            raise ValueError('invalid query type specified')
+        key = normalize_name(name)
+        if key is None:
+            raise ValueError('invalid name: %r' % (name,))
+        factory, _ = _types[query_type]
+        record = factory(value, ttl)
+        if key == '*' or key.startswith('*.'):
+            node = self._wildcard_node(key[2:], create=True)
+            if node.records is None:
+                node.records = {}
+                self._nwildcards += 1
+            records = node.records
+        else:
+            records = self._names.setdefault(key, {})
+        records.setdefault(query_type, []).append(record)
+
+    def remove(self, name, query_type=None):
+        key = normalize_name(name)
+        if key is None:
+            return
+        if key == '*' or key.startswith('*.'):
+            node = self._wildcard_node(key[2:])
+            if node is None or node.records is None:
+                return
+            if query_type is not None:
+                node.records.pop(query_type, None)
+            if query_type is None or not node.records:
+                node.records = None
+                self._nwildcards -= 1
+        elif query_type is None:
+            self._names.pop(key, None)
+        elif key in self._names:
+            records = self._names[key]
+            records.pop(query_type, None)
+            if not records:
+                del self._names[key]
+
+    def _match(self, key):
+        # Return the records of the exact name, or of the longest wildcard
+        # covering it.
+        if key is None:
+            return None
+        records = self._names.get(key)
+        if records is not None or not self._nwildcards:
+            return records
+        node = self._wildcards
+        match = None
+        labels = key.split('.')
+        for i in range(len(labels) - 1, -1, -1):
+            if node.records is not None:
+                match = node.records
+            node = node.children.get(labels[i])
+            if node is None:
+                break
+        return match
+
+    def _resolve(self, name, query_type):
+        # Return the records of query_type for name, or an empty tuple, and
+        # the names followed through CNAMEs to them, the last one being the
+        # canonical name. None if the name is not in the overlay.
+        key = normalize_name(name)
+        records = self._match(key)
+        if records is None:
+            return None
+        names = [key]
+        for _ in range(8):
+            rrs = records.get(query_type)
+            if rrs:
+                return rrs, names
+            cnames = records.get(QUERY_TYPE_CNAME)
+            if not cnames:
+                break
+            key = normalize_name(cnames[0].cname)
+            records = self._match(key)
+            if records is None:
+                return None
+            names.append(key)
+        return (), names
+
+    def lookup(self, name, query_type):
+        # Return (result, status) as a query callback would get them, or None
+        # if the name is not in the overlay. CNAMEs are followed within the
+        # overlay only.
+        if query_type == QUERY_TYPE_ANY:
+            records = self._match(normalize_name(name))
+            if records is None:
+                return None
+            result = []
+            for rrs in records.values():
+                result.extend(_copy(r) for r in rrs)
+            return result, None
+        answer = self._resolve(name, query_type)
+        if answer is None:
+            return None
+        rrs = answer[0]
+        if not rrs:
+            return None, errno.ARES_ENODATA
+        if _types[query_type][1]:
+            return [_copy(r) for r in rrs], None
+        return _copy(rrs[0]), None
+
+    def gethostbyname(self, name, family):
+        # Return (ares_host_result, status) as a gethostbyname callback would
+        # get them, or None if the name is not in the overlay. As with c-ares,
+        # the name of the result is the canonical name and the names which
+        # led to it through CNAMEs are its aliases.
+        if family == _socket.AF_INET:
+            query_types = (QUERY_TYPE_A,)
+        elif family == _socket.AF_INET6:
+            query_types = (QUERY_TYPE_AAAA,)
+        else:
+            query_types = (QUERY_TYPE_AAAA, QUERY_TYPE_A)
+        for query_type in query_types:
+            answer = self._resolve(name, query_type)
+            if answer is None:
+                return None
+            rrs, names = answer
+            if rrs:
+                result = ares_host_result.__new__(ares_host_result)
+                result.name = names[-1]
+                result.aliases = names[:-1]
+                result.addresses = [r.host for r in rrs]
+                return result, None
+        return None, errno.ARES_ENODATA
+
+
+__all__ = ['Overlay']
@@ -0,0 +1,44 @@
+
+import time
+
+
+_clock = time.perf_counter
+
+
+class TokenBucket:
+    # rate tokens per second, of which up to burst can be saved up. The
+    # bucket starts full.
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError('rate must be a positive number')
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate)
+        if self.burst < 1.0:
+            raise ValueError('burst must be at least 1')
+        self.tokens = self.burst
+        self._updated = _clock()
+
+    def _refill(self):
+        now = _clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def take(self):
+        # Take a token, return False if there is none.
+        self._refill()
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def delay(self):
+        # Return the number of seconds until a token is available.
+        self._refill()
+        return max(0.0, (1.0 - self.tokens) / self.rate)
+
+    def __repr__(self):
+        return '<%s> rate=%s, burst=%s, tokens=%.2f' % (self.__class__.__name__, self.rate, self.burst, self.tokens)
+
+
+__all__ = ['TokenBucket']
@@ -0,0 +1,327 @@
+
+import _socket
+import collections
+import heapq
+import itertools
+import time
+
+from . import ARES_SOCKET_BAD, Channel, errno
+from .ratelimit import TokenBucket
+from .utils import normalize_name
+
+
+_clock = time.perf_counter
+
+
+def _reverse_name(addr):
+    # Return the in-addr.arpa / ip6.arpa name of an address, or None.
+    if isinstance(addr, bytes):
+        addr = addr.decode('ascii', 'replace')
+    try:
+        packed = _socket.inet_pton(_socket.AF_INET, addr)
+    except (OSError, ValueError):
+        pass
+    else:
+        return '.'.join(str(b) for b in reversed(packed)) + '.in-addr.arpa'
+    try:
+        packed = _socket.inet_pton(_socket.AF_INET6, addr)
+    except (OSError, ValueError):
+        return None
+    return '.'.join('%x' % (b >> shift & 0xf) for b in reversed(packed) for shift in (0, 4)) + '.ip6.arpa'
+
+
+class _Limit:
+    __slots__ = ('bucket', 'max_queue', 'stats', 'queue', 'timer', 'throttled', 'rejected')
+
+    def __init__(self, bucket, max_queue, stats):
+        self.bucket = bucket
+        self.max_queue = max_queue
+        self.stats = stats
+        self.queue = collections.deque()
+        self.timer = None
+        self.throttled = 0
+        self.rejected = 0
+
+
+class ChannelGroup:
+    # Several channels driven as one: getsock, process_fd and timeout cover
+    # every channel in the group, so a group can be used with the same event
+    # loop integration as a single Channel. Queries must be submitted through
+    # the group, which keeps count of the queries pending on each channel.
+    # Subclasses can also schedule timers, run by process_fd() when due, and
+    # rate limit queries with token buckets.
+
+    def __init__(self, sock_state_cb=None):
+        self._channels = []
+        self._pending = {}
+        self._fds = {}
+        self._sock_state_cb = sock_state_cb
+        self._retiring = set()
+        self._limits = {}
+        self._timers = []
+        self._timer_seq = itertools.count()
+
+    def _call_later(self, delay, fn):
+        timer = [_clock() + delay, next(self._timer_seq), fn]
+        heapq.heappush(self._timers, timer)
+        return timer
+
+    @staticmethod
+    def _cancel_timer(timer):
+        timer[2] = None
+
+    def _run_timers(self):
+        timers = self._timers
+        now = _clock()
+        while timers and timers[0][0] <= now:
+            fn = heapq.heappop(timers)[2]
+            if fn is not None:
+                fn()
+
+    def _next_timer(self):
+        # Return the number of seconds until the next timer, or None.
+        timers = self._timers
+        while timers and timers[0][2] is None:
+            heapq.heappop(timers)
+        if not timers:
+            return None
+        return max(0.0, timers[0][0] - _clock())
+
+    def _set_rate_limit(self, key, rate, burst=None, max_queue=100, stats=None):
+        self._limits[key] = _Limit(TokenBucket(rate, burst), max_queue, stats)
+
+    def _limit(self, key, fn, callback):
+        # Call fn() now if the rate limit of key allows it, or queue it until
+        # it does. Return False if the wait queue is full, fn() is not called
+        # then. If a queued fn() raises, callback gets ARES_EBADQUERY.
+        limit = self._limits.get(key)
+        if limit is None or (not limit.queue and limit.bucket.take()):
+            fn()
+            return True
+        stats = limit.stats
+        if len(limit.queue) >= limit.max_queue:
+            limit.rejected += 1
+            if stats is not None:
+                stats.rejected += 1
+            return False
+        limit.queue.append((fn, callback))
+        limit.throttled += 1
+        if stats is not None:
+            stats.throttled += 1
+        if limit.timer is None:
+            limit.timer = self._call_later(limit.bucket.delay(), lambda: self._drain(limit))
+        return True
+
+    def _drain(self, limit):
+        limit.timer = None
+        queue = limit.queue
+        while queue and limit.bucket.take():
+            fn, callback = queue.popleft()
+            try:
+                fn()
+            except Exception:
+                callback(None, errno.ARES_EBADQUERY)
+        if queue:
+            limit.timer = self._call_later(limit.bucket.delay(), lambda: self._drain(limit))
+
+    def _make_channel(self, **options):
+        # Create a channel whose sockets are reported through the group's
+        # sock_state_cb, if any.
+        if self._sock_state_cb is None:
+            channel = Channel(**options)
+        else:
+            owner = []
+
+            def sock_state_cb(fd, readable, writable):
+                if readable or writable:
+                    self._fds[fd] = owner[0]
+                else:
+                    self._fds.pop(fd, None)
+                self._sock_state_cb(fd, readable, writable)
+
+            channel = Channel(sock_state_cb=sock_state_cb, **options)
+            owner.append(channel)
+        self._add_channel(channel)
+        return channel
+
+    def _add_channel(self, channel):
+        if channel not in self._pending:
+            self._channels.append(channel)
+            self._pending[channel] = 0
+
+    def _retire_channel(self, channel):
+        # Remove a channel from the group once its pending queries complete.
+        if self._pending.get(channel):
+            self._retiring.add(channel)
+        elif channel in self._pending:
+            self._remove_channel(channel)
+
+    def _remove_channel(self, channel):
+        self._retiring.discard(channel)
+        self._channels.remove(channel)
+        del self._pending[channel]
+        for fd in [fd for fd, c in self._fds.items() if c is channel]:
+            del self._fds[fd]
+
+    def _submit(self, channel, callback, method, *args, **kwargs):
+        # Call channel.method(*args, callback, **kwargs), counting the query
+        # as pending on the channel until the callback runs.
+        if not callable(callback):
+            raise TypeError('a callable is required')
+        pending = self._pending
+
+        def cb(result, errorno):
+            pending[channel] -= 1
+            if not pending[channel] and channel in self._retiring:
+                self._remove_channel(channel)
+            callback(result, errorno)
+
+        pending[channel] += 1
+        try:
+            getattr(channel, method)(*args + (cb,), **kwargs)
+        except Exception:
+            pending[channel] -= 1
+            raise
+
+    @property
+    def channels(self):
+        return list(self._channels)
+
+    @property
+    def pending(self):
+        # Queries sent to a channel or waiting for their rate limit.
+        return sum(self._pending.values()) + sum(len(limit.queue) for limit in self._limits.values())
+
+    def getsock(self):
+        rfds = []
+        wfds = []
+        fds = {}
+        for channel in self._channels:
+            r, w = channel.getsock()
+            for fd in r:
+                fds[fd] = channel
+            for fd in w:
+                fds[fd] = channel
+            rfds.extend(r)
+            wfds.extend(w)
+        self._fds = fds
+        return rfds, wfds
+
+    def process_fd(self, read_fd, write_fd):
+        fd = read_fd if read_fd != ARES_SOCKET_BAD else write_fd
+        channel = self._fds.get(fd) if fd != ARES_SOCKET_BAD else None
+        if channel is not None:
+            channel.process_fd(read_fd, write_fd)
+        else:
+            for channel in list(self._channels):
+                if self._pending.get(channel):
+                    channel.process_fd(read_fd, write_fd)
+        if self._timers:
+            self._run_timers()
+
+    def timeout(self, t=None):
+        if t is not None and t < 0.0:
+            raise ValueError("timeout needs to be a positive number or None")
+        timeouts = [c.timeout(t) for c in self._channels if self._pending[c]]
+        if self._timers:
+            timer = self._next_timer()
+            if timer is not None:
+                timeouts.append(timer if t is None else min(timer, t))
+        return min(timeouts) if timeouts else 0.0
+
+    def cancel(self):
+        for limit in self._limits.values():
+            if limit.timer is not None:
+                self._cancel_timer(limit.timer)
+                limit.timer = None
+            queue = limit.queue
+            while queue:
+                queue.popleft()[1](None, errno.ARES_ECANCELLED)
+        for channel in self._channels:
+            channel.cancel()
+
+
+class Router(ChannelGroup):
+    # Sends each query to the channel of the longest domain suffix matching
+    # the name, like dnsmasq's server=/corp/10.0.0.1. With rate_limit set,
+    # every channel gets a token bucket of rate_limit queries per second.
+
+    def __init__(self, routes, default=None, rate_limit=None, burst=None, max_queue=100, sock_state_cb=None,
+                 **channel_options):
+        super().__init__(sock_state_cb)
+        self._channel_options = channel_options
+        self._by_servers = {}
+        self._routes = {}
+        for suffix, target in routes.items():
+            key = normalize_name(suffix)
+            if not key:
+                raise ValueError('invalid domain: %r' % (suffix,))
+            self._routes[key] = self._channel(target)
+        self.default = self._channel(default if default is not None else ())
+        if rate_limit is not None:
+            for channel in self._channels:
+                self._set_rate_limit(channel, rate_limit, burst, max_queue, channel.stats)
+
+    def _channel(self, target):
+        # target is a Channel, a server or a list of servers; channels for
+        # the same servers are shared. An empty list uses the system servers.
+        if hasattr(target, 'query'):
+            self._add_channel(target)
+            return target
+        servers = (target,) if isinstance(target, str) else tuple(target)
+        channel = self._by_servers.get(servers)
+        if channel is None:
+            options = dict(self._channel_options)
+            if servers:
+                options['servers'] = list(servers)
+            channel = self._by_servers[servers] = self._make_channel(**options)
+        return channel
+
+    @property
+    def routes(self):
+        return dict(self._routes)
+
+    def route(self, name):
+        # Return the channel for the given name.
+        key = normalize_name(name)
+        if key is not None and self._routes:
+            routes = self._routes
+            while True:
+                channel = routes.get(key)
+                if channel is not None:
+                    return channel
+                dot = key.find('.')
+                if dot < 0:
+                    break
+                key = key[dot + 1:]
+        return self.default
+
+    def _send(self, channel, callback, method, *args, **kwargs):
+        # Submit the query when the rate limit of the channel allows it, a
+        # query which does not fit in the wait queue gets ARES_EREFUSED.
+        if not callable(callback):
+            raise TypeError('a callable is required')
+        if not self._limit(channel, lambda: self._submit(channel, callback, method, *args, **kwargs), callback):
+            callback(None, errno.ARES_EREFUSED)
+
+    def query(self, name, query_type, callback, query_class=None):
+        self._send(self.route(name), callback, 'query', name, query_type, query_class=query_class)
+
+    def search(self, name, query_type, callback, query_class=None):
+        self._send(self.route(name), callback, 'search', name, query_type, query_class=query_class)
+
+    def gethostbyname(self, name, family, callback):
+        self._send(self.route(name), callback, 'gethostbyname', name, family)
+
+    def gethostbyaddr(self, addr, callback):
+        name = _reverse_name(addr)
+        if name is None:
+            raise ValueError("invalid IP address")
+        self._send(self.route(name), callback, 'gethostbyaddr', addr)
+
+    def getnameinfo(self, address, flags, callback):
+        name = _reverse_name(address[0]) if len(address) in (2, 4) else None
+        self._send(self.route(name) if name is not None else self.default, callback, 'getnameinfo', address, flags)
+
+
+__all__ = ['ChannelGroup', 'Router']
@@ -0,0 +1,212 @@
+
+import array
+
+
+# Latencies are recorded as integer microseconds in log-linear buckets: values
+# below 2 * _SUB_BUCKETS get a bucket each, above that every power of two is
+# split in _SUB_BUCKETS equal parts, which bounds the relative error to ~6%.
+_SUB_BUCKET_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_MAX_VALUE = (1 << 32) - 1  # ~71 minutes
+_NUM_BUCKETS = ((_MAX_VALUE.bit_length() - _SUB_BUCKET_BITS - 1) << _SUB_BUCKET_BITS) + 2 * _SUB_BUCKETS
+
+
+def _bucket_index(value):
+    if value < 2 * _SUB_BUCKETS:
+        return value
+    if value > _MAX_VALUE:
+        value = _MAX_VALUE
+    shift = value.bit_length() - _SUB_BUCKET_BITS - 1
+    return (shift << _SUB_BUCKET_BITS) + (value >> shift)
+
+
+def _bucket_bounds(index):
+    if index < 2 * _SUB_BUCKETS:
+        return index, index
+    shift = (index >> _SUB_BUCKET_BITS) - 1
+    sub = (index & (_SUB_BUCKETS - 1)) + _SUB_BUCKETS
+    return sub << shift, ((sub + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = array.array('Q', bytes(8 * _NUM_BUCKETS))
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def record(self, seconds):
+        value = int(seconds * 1000000)
+        if value < 0:
+            value = 0
+        self.counts[_bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def sum(self):
+        return self.total / 1000000.0
+
+    @property
+    def mean(self):
+        if not self.count:
+            return 0.0
+        return self.total / self.count / 1000000.0
+
+    def percentile(self, p):
+        if not 0 <= p <= 100:
+            raise ValueError('percentile must be between 0 and 100')
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(p / 100.0 * self.count)))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            if n:
+                seen += n
+                if seen >= rank:
+                    value = min(_bucket_bounds(index)[1], self.max)
+                    return value / 1000000.0
+        return self.max / 1000000.0
+
+    def buckets(self):
+        for index, n in enumerate(self.counts):
+            if n:
+                yield _bucket_bounds(index)[1] / 1000000.0, n
+
+    def count_at_or_below(self, seconds):
+        limit = int(seconds * 1000000)
+        total = 0
+        for index, n in enumerate(self.counts):
+            if n:
+                if _bucket_bounds(index)[1] > limit:
+                    break
+                total += n
+        return total
+
+    def merge(self, other):
+        counts = self.counts
+        for index, n in enumerate(other.counts):
+            if n:
+                counts[index] += n
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def reset(self):
+        self.__init__()
+
+    def __repr__(self):
+        return '<%s> count=%d, p50=%.6f, p99=%.6f, max=%.6f' % (self.__class__.__name__,
+                                                               self.count,
+                                                               self.percentile(50),
+                                                               self.percentile(99),
+                                                               (self.max or 0) / 1000000.0)
+
+
+class ChannelStats:
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.submitted = 0
+        self.completed = 0
+        self.timeouts = 0
+        self.slow_callbacks = 0
+        self.throttled = 0
+        self.rejected = 0
+        self.errors = {}
+        self.latency = {}
+
+    @property
+    def inflight(self):
+        return self.submitted - self.completed
+
+    def record(self, server, query_type, seconds, status, timeouts=0):
+        self.completed += 1
+        self.timeouts += timeouts
+        if status is not None:
+            self.errors[status] = self.errors.get(status, 0) + 1
+        key = (server, query_type)
+        histogram = self.latency.get(key)
+        if histogram is None:
+            histogram = self.latency[key] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def _merged(self, pos):
+        r = {}
+        for key, histogram in self.latency.items():
+            merged = r.get(key[pos])
+            if merged is None:
+                merged = r[key[pos]] = LatencyHistogram()
+            merged.merge(histogram)
+        return r
+
+    def by_server(self):
+        return self._merged(0)
+
+    def by_type(self):
+        return self._merged(1)
+
+    def histogram(self, query_type=None, server=None):
+        r = LatencyHistogram()
+        for (s, t), histogram in self.latency.items():
+            if (query_type is None or t == query_type) and (server is None or s == server):
+                r.merge(histogram)
+        return r
+
+
+class ParseTimes:
+    __slots__ = ('count', 'records', 'c_parse', 'build', 'callback')
+
+    def __init__(self):
+        self.count = 0
+        self.records = 0
+        self.c_parse = 0.0
+        self.build = 0.0
+        self.callback = 0.0
+
+    @property
+    def total(self):
+        return self.c_parse + self.build + self.callback
+
+    def __repr__(self):
+        n = self.count or 1
+        return '<%s> count=%d, records=%d, c_parse=%.9f, build=%.9f, callback=%.9f (per query)' % (self.__class__.__name__,
+                                                                                                 self.count,
+                                                                                                 self.records,
+                                                                                                 self.c_parse / n,
+                                                                                                 self.build / n,
+                                                                                                 self.callback / n)
+
+
+class ParseProfile:
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.types = {}
+
+    def record(self, query_type, c_parse, build, callback, records):
+        times = self.types.get(query_type)
+        if times is None:
+            times = self.types[query_type] = ParseTimes()
+        times.count += 1
+        times.records += records
+        times.c_parse += c_parse
+        times.build += build
+        times.callback += callback
+
+
+__all__ = ['ChannelStats', 'LatencyHistogram', 'ParseProfile', 'ParseTimes']
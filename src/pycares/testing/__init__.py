@@ -0,0 +1,6 @@
+
+from .fake import FakeChannel
+from .server import StubServer, Zone
+
+
+__all__ = ['FakeChannel', 'StubServer', 'Zone']
@@ -0,0 +1,170 @@
+
+import socket
+import struct
+
+
+TYPE_A = 1
+TYPE_NS = 2
+TYPE_CNAME = 5
+TYPE_SOA = 6
+TYPE_PTR = 12
+TYPE_MX = 15
+TYPE_TXT = 16
+TYPE_AAAA = 28
+TYPE_SRV = 33
+TYPE_NAPTR = 35
+TYPE_OPT = 41
+TYPE_ANY = 255
+
+CLASS_IN = 1
+
+RCODE_NOERROR = 0
+RCODE_FORMERR = 1
+RCODE_SERVFAIL = 2
+RCODE_NXDOMAIN = 3
+RCODE_NOTIMP = 4
+RCODE_REFUSED = 5
+
+_HEADER = struct.Struct('!HHHHHH')
+
+
+class Question:
+    __slots__ = ('id', 'flags', 'name', 'type', 'dnsclass', 'udp_size')
+
+    def __init__(self, id, flags, name, type, dnsclass, udp_size=512):
+        self.id = id
+        self.flags = flags
+        self.name = name
+        self.type = type
+        self.dnsclass = dnsclass
+        self.udp_size = udp_size
+
+    def __repr__(self):
+        return '<%s> id=%d, name=%s, type=%d, class=%d' % (self.__class__.__name__, self.id, self.name, self.type, self.dnsclass)
+
+
+def encode_name(name):
+    if isinstance(name, str):
+        try:
+            name = name.encode('ascii')
+        except UnicodeEncodeError:
+            name = name.encode('idna')
+    r = []
+    for label in name.rstrip(b'.').split(b'.'):
+        if not label:
+            continue
+        if len(label) > 63:
+            raise ValueError('label too long: %r' % label)
+        r.append(struct.pack('!B', len(label)) + label)
+    r.append(b'\x00')
+    return b''.join(r)
+
+
+def decode_name(data, offset):
+    labels = []
+    end = None
+    for _ in range(128):
+        length = data[offset]
+        if length & 0xc0 == 0xc0:
+            if end is None:
+                end = offset + 2
+            offset = ((length & 0x3f) << 8) | data[offset + 1]
+            continue
+        offset += 1
+        if length == 0:
+            break
+        labels.append(data[offset:offset + length])
+        offset += length
+    else:
+        raise ValueError('too many labels or compression loop')
+    return b'.'.join(labels).decode('ascii', 'replace'), end if end is not None else offset
+
+
+def _character_string(value):
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+    if len(value) > 255:
+        raise ValueError('character string too long')
+    return struct.pack('!B', len(value)) + value
+
+
+def _txt_chunks(value):
+    if isinstance(value, (str, bytes)):
+        value = [value]
+    for chunk in value:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        if not chunk:
+            yield chunk
+        for i in range(0, len(chunk), 255):
+            yield chunk[i:i + 255]
+
+
+def encode_rdata(rtype, value):
+    if rtype == TYPE_A:
+        return socket.inet_pton(socket.AF_INET, value)
+    if rtype == TYPE_AAAA:
+        return socket.inet_pton(socket.AF_INET6, value)
+    if rtype in (TYPE_CNAME, TYPE_NS, TYPE_PTR):
+        return encode_name(value)
+    if rtype == TYPE_MX:
+        priority, host = value
+        return struct.pack('!H', priority) + encode_name(host)
+    if rtype == TYPE_SRV:
+        priority, weight, port, host = value
+        return struct.pack('!HHH', priority, weight, port) + encode_name(host)
+    if rtype == TYPE_NAPTR:
+        order, preference, flags, service, regexp, replacement = value
+        return (struct.pack('!HH', order, preference) + _character_string(flags) + _character_string(service) +
+                _character_string(regexp) + encode_name(replacement))
+    if rtype == TYPE_SOA:
+        mname, rname, serial, refresh, retry, expire, minimum = value
+        return encode_name(mname) + encode_name(rname) + struct.pack('!IIIII', serial, refresh, retry, expire, minimum)
+    if rtype == TYPE_TXT:
+        return b''.join(_character_string(chunk) for chunk in _txt_chunks(value))
+    if isinstance(value, bytes):
+        return value
+    raise ValueError('unsupported record type: %r' % rtype)
+
+
+def encode_record(name, rtype, ttl, value, dnsclass=CLASS_IN):
+    rdata = encode_rdata(rtype, value)
+    return encode_name(name) + struct.pack('!HHIH', rtype, dnsclass, ttl, len(rdata)) + rdata
+
+
+def build_query(name, rtype, id=0, dnsclass=CLASS_IN, rd=True):
+    return _HEADER.pack(id, 0x0100 if rd else 0, 1, 0, 0, 0) + encode_name(name) + struct.pack('!HH', rtype, dnsclass)
+
+
+def parse_query(data):
+    if len(data) < _HEADER.size:
+        raise ValueError('message too short')
+    id, flags, qdcount, ancount, nscount, arcount = _HEADER.unpack_from(data)
+    if qdcount != 1:
+        raise ValueError('expected one question, got %d' % qdcount)
+    name, offset = decode_name(data, _HEADER.size)
+    rtype, dnsclass = struct.unpack_from('!HH', data, offset)
+    offset += 4
+    udp_size = 512
+    for _ in range(ancount + nscount + arcount):
+        _, offset = decode_name(data, offset)
+        rrtype, rrclass, _, rdlength = struct.unpack_from('!HHIH', data, offset)
+        offset += 10 + rdlength
+        if rrtype == TYPE_OPT:
+            udp_size = max(512, rrclass)
+    return Question(id, flags, name, rtype, dnsclass, udp_size)
+
+
+def build_response(question, answers=(), rcode=RCODE_NOERROR, truncated=False, authoritative=True):
+    flags = 0x8000 | (question.flags & 0x7900) | 0x0080 | rcode
+    if authoritative:
+        flags |= 0x0400
+    if truncated:
+        flags |= 0x0200
+        answers = ()
+    records = [encode_record(*answer) for answer in answers]
+    header = _HEADER.pack(question.id, flags, 1, len(records), 0, 0)
+    return header + encode_name(question.name) + struct.pack('!HH', question.type, question.dnsclass) + b''.join(records)
+
+
+__all__ = ['Question', 'build_query', 'build_response', 'decode_name', 'encode_name', 'encode_rdata', 'encode_record', 'parse_query']
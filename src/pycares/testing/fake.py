@@ -0,0 +1,295 @@
+
+import heapq
+import ipaddress
+import itertools
+import socket
+
+from .. import Channel, ares_nameinfo_result, errno, _ffi, _lib, _host_reply, _query_reply
+from ..utils import parse_name
+
+from . import dns
+from .server import Zone
+
+
+# response code -> c-ares status; SERVFAIL, NOTIMP and REFUSED make c-ares try
+# the next server and report ECONNREFUSED, unless ARES_FLAG_NOCHECKRESP is set
+_rcode_status = {
+    dns.RCODE_FORMERR: errno.ARES_EFORMERR,
+    dns.RCODE_SERVFAIL: errno.ARES_ESERVFAIL,
+    dns.RCODE_NXDOMAIN: errno.ARES_ENOTFOUND,
+    dns.RCODE_NOTIMP: errno.ARES_ENOTIMP,
+    dns.RCODE_REFUSED: errno.ARES_EREFUSED,
+}
+
+_checked_rcodes = (dns.RCODE_SERVFAIL, dns.RCODE_NOTIMP, dns.RCODE_REFUSED)
+
+
+class FakeChannel:
+    # Drop-in replacement for pycares.Channel answering from a Zone, in process.
+    # Answers are delivered by process_fd(), advance() or run(), in virtual time.
+
+    def __init__(self, zone=None, flags=None, timeout=None, tries=None, ndots=None, servers=None, domains=None,
+                 immediate=False, **kwargs):
+        self.zone = zone if zone is not None else Zone()
+        self.flags = flags or 0
+        self._timeout = 5.0 if timeout is None else timeout
+        self.tries = 4 if tries is None else tries
+        self.ndots = 1 if ndots is None else ndots
+        self.domains = list(domains or ())
+        self.immediate = immediate
+        self.now = 0.0
+        self.queries = []
+        self._servers = list(servers or ['127.0.0.1'])
+        self._pending = []
+        self._seq = itertools.count()
+
+    @property
+    def servers(self):
+        return list(self._servers)
+
+    @servers.setter
+    def servers(self, servers):
+        self._servers = list(servers)
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    # Event loop integration, there are never any sockets
+
+    def getsock(self):
+        return [], []
+
+    def timeout(self, t=None):
+        if t is not None and t < 0.0:
+            raise ValueError("timeout needs to be a positive number or None")
+        if not self._pending:
+            return t if t is not None else 0.0
+        r = max(0.0, self._pending[0][0] - self.now)
+        return r if t is None else min(r, t)
+
+    def process_fd(self, read_fd, write_fd):
+        self._deliver()
+
+    def advance(self, seconds):
+        # Move the virtual clock forward, delivering the answers which are due.
+        if seconds < 0:
+            raise ValueError('can not go back in time')
+        deadline = self.now + seconds
+        while self._pending and self._pending[0][0] <= deadline:
+            self.now = max(self.now, self._pending[0][0])
+            self._deliver()
+        self.now = deadline
+
+    def run(self):
+        # Deliver every pending answer, advancing the virtual clock as needed.
+        while self._pending:
+            self.now = max(self.now, self._pending[0][0])
+            self._deliver()
+
+    def cancel(self):
+        pending, self._pending = self._pending, []
+        for _, _, callback, _ in sorted(pending):
+            callback(None, errno.ARES_ECANCELLED)
+
+    def _deliver(self):
+        while self._pending and self._pending[0][0] <= self.now:
+            _, _, callback, answer = heapq.heappop(self._pending)
+            callback(*answer())
+
+    def _schedule(self, name, callback, answer):
+        # answer is a function returning (result, status), called when the
+        # answer is due, so zone changes made meanwhile are seen.
+        behaviour = self.zone.behaviour(name)
+        delay = 0.0
+        if behaviour is not None:
+            if behaviour.drop or behaviour.delay >= self._timeout:
+                delay = self._timeout * self.tries
+                answer = lambda: (None, errno.ARES_ETIMEOUT)
+            else:
+                delay = behaviour.delay
+        if self.immediate and delay == 0.0:
+            callback(*answer())
+            return
+        heapq.heappush(self._pending, (self.now + delay, next(self._seq), callback, answer))
+
+    # Wire level helpers
+
+    def _resolve(self, name, query_type):
+        # Return (status, response) as c-ares would pass them to its callback.
+        self.queries.append((name, query_type))
+        behaviour = self.zone.behaviour(name)
+        question = dns.Question(0, 0x0100, name, query_type, dns.CLASS_IN)
+        response = self.zone.response(name, query_type)
+        if behaviour is not None and behaviour.rcode is not None:
+            rcode = behaviour.rcode
+            response = dns.build_response(question, rcode=rcode)
+        elif response is not None:
+            rcode = response[3] & 0x0f
+        else:
+            rcode, answers = self.zone.answer(question)
+            response = dns.build_response(question, answers, rcode=rcode)
+        if rcode == dns.RCODE_NOERROR:
+            return _lib.ARES_SUCCESS, response
+        if rcode in _checked_rcodes and not self.flags & _lib.ARES_FLAG_NOCHECKRESP:
+            return errno.ARES_ECONNREFUSED, response
+        return _rcode_status.get(rcode, errno.ARES_EBADRESP), response
+
+    def _search_names(self, name):
+        if self.flags & _lib.ARES_FLAG_NOSEARCH or name.endswith('.') or not self.domains:
+            return [name.rstrip('.')]
+        qualified = ['%s.%s' % (name, domain) for domain in self.domains]
+        if name.count('.') >= self.ndots:
+            return [name] + qualified
+        return qualified + [name]
+
+    def _answer(self, names, query_type):
+        status, response = None, None
+        for name in names:
+            status, response = self._resolve(name, query_type)
+            if status == _lib.ARES_SUCCESS:
+                result, status = _query_reply(query_type, status, response, len(response))
+                if status not in (errno.ARES_ENODATA, errno.ARES_EBADRESP):
+                    return result, status
+            elif status != errno.ARES_ENOTFOUND:
+                return None, status
+        return None, status
+
+    # Channel API
+
+    def query(self, name, query_type, callback, query_class=None):
+        self._do_query(False, name, query_type, callback, query_class)
+
+    def search(self, name, query_type, callback, query_class=None):
+        self._do_query(True, name, query_type, callback, query_class)
+
+    def _do_query(self, search, name, query_type, callback, query_class=None):
+        if not callable(callback):
+            raise TypeError('a callable is required')
+        if query_type not in Channel.__qtypes__:
+            raise ValueError('invalid query type specified')
+        if query_class is None:
+            query_class = _lib.C_IN
+        if query_class not in Channel.__qclasses__:
+            raise ValueError('invalid query class specified')
+
+        name = parse_name(name).decode('ascii')
+        names = self._search_names(name) if search else [name]
+        self._schedule(names[0], callback, lambda: self._answer(names, query_type))
+
+    def gethostbyname(self, name, family, callback):
+        if not callable(callback):
+            raise TypeError("a callable is required")
+        name = parse_name(name).decode('ascii')
+        self._schedule(name, callback, lambda: self._host_answer(name, family))
+
+    def _host_answer(self, name, family):
+        try:
+            address = ipaddress.ip_address(name)
+        except ValueError:
+            pass
+        else:
+            # c-ares answers for IP addresses without querying
+            rtype = dns.TYPE_A if address.version == 4 else dns.TYPE_AAAA
+            question = dns.Question(0, 0x0100, name, rtype, dns.CLASS_IN)
+            return self._parse_host(dns.build_response(question, [(name, rtype, 0, name)]), rtype)
+
+        if family == socket.AF_INET:
+            families = [dns.TYPE_A]
+        elif family == socket.AF_INET6:
+            families = [dns.TYPE_AAAA]
+        else:
+            families = [dns.TYPE_AAAA, dns.TYPE_A]
+        status = errno.ARES_ENOTFOUND
+        for name in self._search_names(name):
+            for rtype in families:
+                status, response = self._resolve(name, rtype)
+                if status == _lib.ARES_SUCCESS:
+                    result, status = self._parse_host(response, rtype)
+                    if status is None:
+                        return result, status
+                elif status != errno.ARES_ENOTFOUND:
+                    return None, status
+        return None, status
+
+    def _parse_host(self, response, rtype):
+        hostent = _ffi.new("struct hostent **")
+        if rtype == dns.TYPE_A:
+            status = _lib.ares_parse_a_reply(response, len(response), hostent, _ffi.NULL, _ffi.NULL)
+        else:
+            status = _lib.ares_parse_aaaa_reply(response, len(response), hostent, _ffi.NULL, _ffi.NULL)
+        if status == _lib.ARES_SUCCESS and hostent[0].h_addr_list[0] == _ffi.NULL:
+            _lib.ares_free_hostent(hostent[0])
+            status = errno.ARES_ENODATA
+        if status != _lib.ARES_SUCCESS:
+            return None, status
+        result, status = _host_reply(status, hostent[0])
+        _lib.ares_free_hostent(hostent[0])
+        return result, status
+
+    def gethostbyaddr(self, addr, callback):
+        if not callable(callback):
+            raise TypeError("a callable is required")
+        try:
+            address = ipaddress.ip_address(addr)
+        except ValueError:
+            raise ValueError("invalid IP address")
+        self._schedule(address.reverse_pointer, callback, lambda: self._addr_answer(address))
+
+    def _addr_answer(self, address):
+        status, response = self._resolve(address.reverse_pointer, dns.TYPE_PTR)
+        if status != _lib.ARES_SUCCESS:
+            return None, status
+        family = socket.AF_INET if address.version == 4 else socket.AF_INET6
+        hostent = _ffi.new("struct hostent **")
+        status = _lib.ares_parse_ptr_reply(response, len(response), address.packed, len(address.packed), family, hostent, _ffi.NULL)
+        if status != _lib.ARES_SUCCESS:
+            return None, status
+        result, status = _host_reply(status, hostent[0])
+        _lib.ares_free_hostent(hostent[0])
+        return result, status
+
+    def getnameinfo(self, address, flags, callback):
+        if not callable(callback):
+            raise TypeError("a callable is required")
+        if len(address) not in (2, 4):
+            raise ValueError("Invalid address argument")
+        ip, port = address[0], address[1]
+        try:
+            ipaddress.ip_address(ip)
+        except ValueError:
+            raise ValueError("Invalid IP address %r" % ip)
+        self._schedule(ip, callback, lambda: self._nameinfo_answer(ipaddress.ip_address(ip), port, flags))
+
+    def _nameinfo_answer(self, address, port, flags):
+        node = str(address)
+        if not flags & _lib.ARES_NI_NUMERICHOST:
+            result, status = self._addr_answer(address)
+            if status is None:
+                node = result.name
+                if flags & _lib.ARES_NI_NOFQDN:
+                    node = node.split('.', 1)[0]
+            elif flags & _lib.ARES_NI_NAMEREQD:
+                return None, status
+
+        service = _ffi.NULL
+        if flags & _lib.ARES_NI_LOOKUPSERVICE:
+            name = str(port)
+            if not flags & _lib.ARES_NI_NUMERICSERV:
+                try:
+                    name = socket.getservbyport(port, 'udp' if flags & _lib.ARES_NI_DGRAM else 'tcp')
+                except OSError:
+                    pass
+            service = _ffi.new("char[]", name.encode('ascii'))
+        return ares_nameinfo_result(_ffi.new("char[]", node.encode('ascii')), service), None
+
+    # Unsupported configuration is accepted and ignored
+
+    def set_local_ip(self, ip):
+        pass
+
+    def set_local_dev(self, dev):
+        pass
+
+
+__all__ = ['FakeChannel']
@@ -0,0 +1,231 @@
+
+import asyncio
+import socket
+import struct
+import threading
+
+from . import dns
+
+
+class _Behaviour:
+    __slots__ = ('delay', 'drop', 'rcode', 'truncate')
+
+    def __init__(self, delay=0.0, drop=False, rcode=None, truncate=False):
+        self.delay = delay
+        self.drop = drop
+        self.rcode = rcode
+        self.truncate = truncate
+
+
+class Zone:
+
+    def __init__(self, records=None):
+        self._records = {}
+        self._responses = {}
+        self._behaviours = {}
+        if records is not None:
+            for record in records:
+                self.add(*record)
+
+    @staticmethod
+    def _key(name):
+        return name.rstrip('.').lower()
+
+    def add(self, name, rtype, value, ttl=300):
+        self._records.setdefault(self._key(name), []).append((rtype, ttl, value))
+
+    def remove(self, name, rtype=None):
+        key = self._key(name)
+        if rtype is None:
+            self._records.pop(key, None)
+        elif key in self._records:
+            self._records[key] = [r for r in self._records[key] if r[0] != rtype]
+
+    def add_response(self, name, rtype, data):
+        # Serve a complete wire format response, only its ID is rewritten.
+        self._responses[(self._key(name), rtype)] = data
+
+    def response(self, name, rtype):
+        return self._responses.get((self._key(name), rtype))
+
+    def configure(self, name, delay=0.0, drop=False, rcode=None, truncate=False):
+        self._behaviours[self._key(name)] = _Behaviour(delay, drop, rcode, truncate)
+
+    def behaviour(self, name):
+        return self._behaviours.get(self._key(name))
+
+    def __contains__(self, name):
+        return self._key(name) in self._records
+
+    def lookup(self, name, rtype):
+        answers = []
+        key = self._key(name)
+        for _ in range(8):
+            records = self._records.get(key)
+            if records is None:
+                break
+            matches = [r for r in records if rtype in (dns.TYPE_ANY, r[0])]
+            if matches or rtype == dns.TYPE_CNAME:
+                answers.extend((key, t, ttl, value) for t, ttl, value in matches)
+                break
+            cnames = [r for r in records if r[0] == dns.TYPE_CNAME]
+            if not cnames:
+                break
+            t, ttl, value = cnames[0]
+            answers.append((key, t, ttl, value))
+            key = self._key(value)
+        return answers
+
+    def answer(self, question):
+        # Return (rcode, answers) for the given question.
+        if question.name and self._key(question.name) not in self._records:
+            return dns.RCODE_NXDOMAIN, []
+        return dns.RCODE_NOERROR, self.lookup(question.name, question.type)
+
+
+class _UDPProtocol(asyncio.DatagramProtocol):
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.server._handle(data, 'udp', lambda response: self.transport.sendto(response, addr))
+
+
+class _TCPProtocol(asyncio.Protocol):
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.buffer = b''
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        self.buffer += data
+        while len(self.buffer) >= 2:
+            length = struct.unpack_from('!H', self.buffer)[0]
+            if len(self.buffer) < 2 + length:
+                break
+            message = self.buffer[2:2 + length]
+            self.buffer = self.buffer[2 + length:]
+            self.server._handle(message, 'tcp', self._send)
+
+    def _send(self, response):
+        if not self.transport.is_closing():
+            self.transport.write(struct.pack('!H', len(response)) + response)
+
+
+class StubServer:
+
+    def __init__(self, zone=None, host='127.0.0.1', port=0, delay=0.0, tcp=True):
+        self.zone = zone if zone is not None else Zone()
+        self.host = host
+        self.port = port
+        self.delay = delay
+        self.tcp = tcp
+        self.queries = []
+        self._loop = None
+        self._thread = None
+        self._udp = None
+        self._tcp = None
+
+    def _handle(self, data, transport, send):
+        try:
+            question = dns.parse_query(data)
+        except (ValueError, IndexError, struct.error):
+            return
+        self.queries.append((question.name, question.type, transport))
+
+        behaviour = self.zone.behaviour(question.name)
+        delay = self.delay
+        if behaviour is not None:
+            if behaviour.drop:
+                return
+            delay += behaviour.delay
+
+        raw = self.zone.response(question.name, question.type)
+        if behaviour is not None and behaviour.rcode is not None:
+            response = dns.build_response(question, rcode=behaviour.rcode)
+        elif raw is not None:
+            response = struct.pack('!H', question.id) + raw[2:]
+            if transport == 'udp' and len(response) > question.udp_size:
+                response = dns.build_response(question, rcode=raw[3] & 0x0f, truncated=True)
+        else:
+            rcode, answers = self.zone.answer(question)
+            truncate = transport == 'udp' and behaviour is not None and behaviour.truncate
+            response = dns.build_response(question, answers, rcode=rcode, truncated=truncate)
+            if transport == 'udp' and len(response) > question.udp_size:
+                response = dns.build_response(question, rcode=rcode, truncated=True)
+
+        if delay > 0:
+            self._loop.call_later(delay, send, response)
+        else:
+            send(response)
+
+    def _bind(self):
+        family = socket.AF_INET6 if ':' in self.host else socket.AF_INET
+        for _ in range(16):
+            udp, _ = self._loop.run_until_complete(
+                self._loop.create_datagram_endpoint(lambda: _UDPProtocol(self), local_addr=(self.host, self.port), family=family))
+            port = udp.get_extra_info('sockname')[1]
+            if not self.tcp:
+                return udp, None, port
+            try:
+                tcp = self._loop.run_until_complete(
+                    self._loop.create_server(lambda: _TCPProtocol(self), self.host, port, family=family))
+            except OSError:
+                udp.close()
+                if self.port:
+                    raise
+                continue
+            return udp, tcp, port
+        raise OSError('could not bind UDP and TCP sockets on the same port')
+
+    def start(self):
+        if self._thread is not None:
+            raise RuntimeError('server already started')
+        self._loop = asyncio.new_event_loop()
+        self._udp, self._tcp, self.port = self._bind()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='pycares-stub-server')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+        self._udp.close()
+        if self._tcp is not None:
+            self._tcp.close()
+            self._loop.run_until_complete(self._tcp.wait_closed())
+        self._loop.run_until_complete(asyncio.sleep(0))
+        self._loop.close()
+        self._loop = None
+
+    @property
+    def channel_options(self):
+        return {'servers': [self.host], 'udp_port': self.port, 'tcp_port': self.port}
+
+    def channel(self, **kwargs):
+        import pycares
+        options = self.channel_options
+        options.update(kwargs)
+        return pycares.Channel(**options)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+__all__ = ['StubServer', 'Zone']
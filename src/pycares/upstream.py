@@ -0,0 +1,436 @@
+
+import collections
+import random
+import time
+
+from . import QUERY_TYPE_NS, errno
+from .router import ChannelGroup
+
+
+_clock = time.perf_counter
+
+# Statuses meaning the server did not answer, the query is retried on the
+# next server. Other errors (e.g. ARES_ENOTFOUND) are answers.
+_FAILURES = frozenset((errno.ARES_ETIMEOUT, errno.ARES_ECONNREFUSED))
+
+# Statuses passed on without recording anything or retrying.
+_ABORTED = frozenset((errno.ARES_ECANCELLED, errno.ARES_EDESTRUCTION))
+
+# Number of recent RTTs the 'auto' hedge delay is computed from, how many
+# are needed first, and every how many new ones it is recomputed.
+_RTT_SAMPLES = 256
+_MIN_RTT_SAMPLES = 20
+_RTT_REFRESH = 16
+
+# Retransmission timeout estimation as in TCP (RFC 6298): gains of the
+# smoothed RTT and of the RTT variance, and the smallest variance term.
+_RTO_ALPHA = 0.125
+_RTO_BETA = 0.25
+_RTO_GRANULARITY = 0.01
+
+# The channel of a server is only recreated when its timeout is off by more
+# than this fraction.
+_RTO_TOLERANCE = 0.25
+
+# Hedges which can be saved up while the traffic is not hedged
+_MAX_HEDGE_TOKENS = 10.0
+
+# Circuit breaker states: closed servers get queries, open ones were ejected
+# after too many consecutive failures, half-open ones are being probed.
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class Upstream:
+    # A server of an UpstreamPool and what is known about it. rtt and
+    # failure_rate are exponentially weighted moving averages, srtt and rttvar
+    # the smoothed RTT and RTT variance of RFC 6298.
+
+    def __init__(self, server, channel, timeout, alpha):
+        self.server = server
+        self.channel = channel
+        self.timeout = timeout
+        self.alpha = alpha
+        self.rtt = None
+        self.srtt = None
+        self.rttvar = None
+        self.failure_rate = 0.0
+        self.queries = 0
+        self.failures = 0
+        self.inflight = 0
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.probes = 0
+        self.opened_at = None
+
+    @property
+    def score(self):
+        # Expected time to get an answer: the smoothed RTT plus the timeout,
+        # weighted by the failure rate. Servers which were never queried score
+        # 0, so they are tried first, those which never answered get the
+        # timeout as their RTT.
+        if self.rtt is not None:
+            rtt = self.rtt
+        else:
+            rtt = self.timeout if self.queries else 0.0
+        return rtt + self.failure_rate * self.timeout
+
+    @property
+    def rto(self):
+        # Retransmission timeout computed from the RTTs, None until the server
+        # answers.
+        if self.srtt is None:
+            return None
+        return self.srtt + max(_RTO_GRANULARITY, 4.0 * self.rttvar)
+
+    def record(self, elapsed, failed):
+        alpha = self.alpha
+        self.queries += 1
+        if failed:
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.failure_rate += alpha * (1.0 - self.failure_rate)
+        else:
+            self.consecutive_failures = 0
+            self.failure_rate -= alpha * self.failure_rate
+            self.rtt = elapsed if self.rtt is None else self.rtt + alpha * (elapsed - self.rtt)
+            if self.srtt is None:
+                self.srtt = elapsed
+                self.rttvar = elapsed / 2.0
+            else:
+                self.rttvar += _RTO_BETA * (abs(self.srtt - elapsed) - self.rttvar)
+                self.srtt += _RTO_ALPHA * (elapsed - self.srtt)
+
+    def snapshot(self):
+        return {
+            'server': self.server,
+            'state': self.state,
+            'rtt': self.rtt,
+            'timeout': self.timeout,
+            'failure_rate': self.failure_rate,
+            'queries': self.queries,
+            'failures': self.failures,
+            'inflight': self.inflight,
+            'ejections': self.ejections,
+            'probes': self.probes,
+        }
+
+    def __repr__(self):
+        return '<%s> server=%s, state=%s, rtt=%s, failure_rate=%.3f, queries=%d, failures=%d, inflight=%d' % (
+            self.__class__.__name__, self.server, self.state, '%.6f' % self.rtt if self.rtt is not None else None,
+            self.failure_rate, self.queries, self.failures, self.inflight)
+
+
+class _PoolQuery:
+    __slots__ = ('next', 'inflight', 'done', 'timer')
+
+    def __init__(self):
+        self.next = 0
+        self.inflight = 0
+        self.done = False
+        self.timer = None
+
+
+class UpstreamPool(ChannelGroup):
+    # One channel per server. Each query goes to the server with the best
+    # score, and to the next best ones if it does not answer, up to attempts
+    # servers in total. A fraction explore of the queries goes to a random
+    # server first, so that the scores of the others stay current.
+    #
+    # A server failing failure_threshold times in a row is ejected. After
+    # recovery_interval seconds it is probed with a query for probe (a (name,
+    # query type) tuple), and restored if the probe gets an answer. Probes are
+    # sent when the pool is used, by a query or process_fd().
+    #
+    # With hedge_delay set, a query still unanswered after that many seconds
+    # ('auto': the hedge_percentile of the recent RTTs) is also sent to the
+    # next server, and the first answer wins. The hedge_budget fraction of the
+    # queries may be hedged, at most.
+    #
+    # With adaptive_timeout, the timeout of each server follows its RTTs like
+    # the TCP retransmission timeout, between min_timeout and max_timeout (the
+    # timeout option by default), and doubles on every timeout. c-ares can not
+    # change the timeout of a channel, so a new channel is created for the
+    # server when it changes, the old one is dropped once its queries complete.
+    #
+    # With rate_limit set, each server gets a token bucket of rate_limit
+    # queries per second and a wait queue of max_queue queries. A query which
+    # does not fit in the queue goes to the next server, or gets
+    # ARES_EREFUSED if there is none.
+
+    def __init__(self, servers, attempts=None, alpha=0.2, explore=0.05, failure_threshold=3, recovery_interval=5.0,
+                 probe=('.', QUERY_TYPE_NS), hedge_delay=None, hedge_percentile=95, hedge_budget=0.05,
+                 adaptive_timeout=False, min_timeout=0.1, max_timeout=None, rate_limit=None, burst=None, max_queue=100,
+                 sock_state_cb=None, **channel_options):
+        super().__init__(sock_state_cb)
+        if not servers:
+            raise ValueError('at least one server is required')
+        channel_options.setdefault('tries', 1)
+        self._channel_options = channel_options
+        self.attempts = attempts if attempts is not None else len(servers)
+        self.alpha = alpha
+        self.explore = explore
+        self.failure_threshold = failure_threshold
+        self.recovery_interval = recovery_interval
+        self.probe = probe
+        self.hedge_delay = hedge_delay
+        self.hedge_percentile = hedge_percentile
+        self.hedge_budget = hedge_budget
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._hedge_tokens = 0.0
+        self._rtts = collections.deque(maxlen=_RTT_SAMPLES)
+        self._auto_delay = None
+        self.adaptive_timeout = adaptive_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout if max_timeout is not None else channel_options.get('timeout') or 5.0
+        self._ejected = 0
+        self._random = random.Random()
+        self._options = {}
+        self._upstreams = [self._make_upstream(server) for server in servers]
+        if rate_limit is not None:
+            for upstream in self._upstreams:
+                self._set_rate_limit(upstream, rate_limit, burst, max_queue, upstream.channel.stats)
+
+    def _make_upstream(self, server):
+        # server is an address, or an (address, port) tuple
+        options = dict(self._channel_options)
+        if isinstance(server, tuple):
+            host, port = server
+            options['udp_port'] = options['tcp_port'] = port
+            server = '%s:%d' % (host, port) if ':' not in host else '[%s]:%d' % (host, port)
+        else:
+            host = server
+        options['servers'] = [host]
+        timeout = options.get('timeout') or 5.0
+        if self.adaptive_timeout and timeout > self.max_timeout:
+            timeout = options['timeout'] = self.max_timeout
+        upstream = Upstream(server, self._make_channel(**options), timeout, self.alpha)
+        self._options[upstream] = options
+        return upstream
+
+    def _adapt_timeout(self, upstream, errorno):
+        if errorno == errno.ARES_ETIMEOUT:
+            timeout = upstream.timeout * 2.0
+        elif errorno in _FAILURES:
+            return
+        else:
+            timeout = upstream.rto
+        timeout = min(max(timeout, self.min_timeout), self.max_timeout)
+        if abs(timeout - upstream.timeout) > _RTO_TOLERANCE * upstream.timeout:
+            self._set_timeout(upstream, timeout)
+
+    def _set_timeout(self, upstream, timeout):
+        options = self._options[upstream]
+        options['timeout'] = timeout
+        self._retire_channel(upstream.channel)
+        upstream.channel = self._make_channel(**options)
+        upstream.timeout = timeout
+
+    @property
+    def upstreams(self):
+        return list(self._upstreams)
+
+    @property
+    def servers(self):
+        # The servers, best first.
+        return [u.server for u in self._ranked()]
+
+    @property
+    def active(self):
+        # The servers which are not ejected, best first.
+        return [u.server for u in self._ranked() if u.state == CLOSED]
+
+    def snapshot(self):
+        snapshot = []
+        for upstream in self._upstreams:
+            s = upstream.snapshot()
+            limit = self._limits.get(upstream)
+            if limit is not None:
+                s.update(throttled=limit.throttled, rejected=limit.rejected, queued=len(limit.queue))
+            snapshot.append(s)
+        return snapshot
+
+    def _ranked(self):
+        return sorted(self._upstreams, key=lambda u: u.score)
+
+    def _record(self, upstream, elapsed, errorno):
+        failed = errorno in _FAILURES
+        upstream.record(elapsed, failed)
+        if self.adaptive_timeout:
+            self._adapt_timeout(upstream, errorno)
+        if self.hedge_delay == 'auto' and not failed:
+            self._rtts.append(elapsed)
+            if len(self._rtts) % _RTT_REFRESH == 0:
+                self._auto_delay = None
+        if failed:
+            if (upstream.state == CLOSED and self.failure_threshold is not None and
+                    upstream.consecutive_failures >= self.failure_threshold):
+                upstream.state = OPEN
+                upstream.opened_at = _clock()
+                upstream.ejections += 1
+                self._ejected += 1
+        elif upstream.state == OPEN:
+            self._restore(upstream)
+
+    def _restore(self, upstream):
+        upstream.state = CLOSED
+        upstream.failure_rate = 0.0
+        self._ejected -= 1
+
+    def _check_ejected(self):
+        # Probe the ejected servers whose recovery interval elapsed.
+        now = _clock()
+        for upstream in self._upstreams:
+            if upstream.state == OPEN and now - upstream.opened_at >= self.recovery_interval:
+                self._send_probe(upstream)
+
+    def _send_probe(self, upstream):
+        started = _clock()
+
+        def cb(result, errorno):
+            upstream.inflight -= 1
+            failed = errorno in _FAILURES
+            if errorno not in _ABORTED:
+                upstream.record(_clock() - started, failed)
+            if failed or errorno in _ABORTED:
+                upstream.state = OPEN
+                upstream.opened_at = _clock()
+            else:
+                self._restore(upstream)
+
+        upstream.state = HALF_OPEN
+        upstream.probes += 1
+        upstream.inflight += 1
+        name, query_type = self.probe
+        self._submit(upstream.channel, cb, 'query', name, query_type)
+
+    def process_fd(self, read_fd, write_fd):
+        super().process_fd(read_fd, write_fd)
+        if self._ejected:
+            self._check_ejected()
+
+    def _order(self):
+        if self._ejected:
+            self._check_ejected()
+        order = self._ranked()
+        if self._ejected:
+            # every server ejected: better try them than fail right away
+            order = [u for u in order if u.state == CLOSED] or order
+        if len(order) > 1 and self.explore and self._random.random() < self.explore:
+            order.insert(0, order.pop(self._random.randrange(1, len(order))))
+        return order[:self.attempts]
+
+    def _hedge_delay(self):
+        # Return the delay after which a query is hedged, or None.
+        if self.hedge_delay != 'auto':
+            return self.hedge_delay
+        if self._auto_delay is None and len(self._rtts) >= _MIN_RTT_SAMPLES:
+            rtts = sorted(self._rtts)
+            self._auto_delay = rtts[min(len(rtts) - 1, int(len(rtts) * self.hedge_percentile / 100.0))]
+        return self._auto_delay
+
+    def _refund_hedge(self):
+        self._hedge_tokens = min(self._hedge_tokens + 1.0, _MAX_HEDGE_TOKENS)
+
+    def _dispatch(self, callback, method, *args, **kwargs):
+        if not callable(callback):
+            raise TypeError('a callable is required')
+        order = self._order()
+        query = _PoolQuery()
+
+        def attempt(upstream, hedge):
+            # Return the function sending the query to upstream, and the
+            # callback of that attempt.
+            started = []
+
+            def cb(result, errorno):
+                upstream.inflight -= 1
+                query.inflight -= 1
+                failed = errorno in _FAILURES
+                if errorno not in _ABORTED and started:
+                    self._record(upstream, _clock() - started[0], errorno)
+                if query.done:
+                    return
+                if failed:
+                    if query.inflight:
+                        return  # the other attempt may still answer
+                    if submit():
+                        return
+                query.done = True
+                if query.timer is not None:
+                    # the hedge was not needed, give its token back
+                    self._cancel_timer(query.timer)
+                    query.timer = None
+                    self._refund_hedge()
+                if hedge and not failed:
+                    self.hedge_wins += 1
+                callback(result, errorno)
+
+            def send():
+                started.append(_clock())
+                try:
+                    self._submit(upstream.channel, cb, method, *args, **kwargs)
+                except Exception:
+                    del started[:]
+                    raise
+
+            return send, cb
+
+        def submit(hedge=False):
+            # Send the query to the next server whose rate limit accepts it.
+            while query.next < len(order):
+                upstream = order[query.next]
+                query.next += 1
+                send, cb = attempt(upstream, hedge)
+                upstream.inflight += 1
+                query.inflight += 1
+                try:
+                    if self._limit(upstream, send, cb):
+                        return True
+                except Exception:
+                    upstream.inflight -= 1
+                    query.inflight -= 1
+                    raise
+                upstream.inflight -= 1
+                query.inflight -= 1
+            return False
+
+        def fire():
+            query.timer = None
+            if not query.done and submit(hedge=True):
+                self.hedged += 1
+            else:
+                self._refund_hedge()
+
+        if not submit():
+            callback(None, errno.ARES_EREFUSED)
+            return
+        if not query.done and query.next < len(order) and self.hedge_delay is not None:
+            self._hedge_tokens = min(self._hedge_tokens + self.hedge_budget, _MAX_HEDGE_TOKENS)
+            delay = self._hedge_delay()
+            if delay is not None and self._hedge_tokens >= 1.0:
+                # the token is taken now, so that a burst of queries can not
+                # schedule more hedges than the budget allows
+                self._hedge_tokens -= 1.0
+                query.timer = self._call_later(delay, fire)
+
+    def query(self, name, query_type, callback, query_class=None):
+        self._dispatch(callback, 'query', name, query_type, query_class=query_class)
+
+    def search(self, name, query_type, callback, query_class=None):
+        self._dispatch(callback, 'search', name, query_type, query_class=query_class)
+
+    def gethostbyname(self, name, family, callback):
+        self._dispatch(callback, 'gethostbyname', name, family)
+
+    def gethostbyaddr(self, addr, callback):
+        self._dispatch(callback, 'gethostbyaddr', addr)
+
+    def getnameinfo(self, address, flags, callback):
+        self._dispatch(callback, 'getnameinfo', address, flags)
+
+
+__all__ = ['CLOSED', 'HALF_OPEN', 'OPEN', 'Upstream', 'UpstreamPool']
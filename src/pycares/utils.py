@@ -1,8 +1,13 @@
 
-try:
-    import idna as idna2008
-except ImportError:
-    idna2008 = None
+import functools
+
+# The idna package is imported when the first non-ASCII name is encoded
+idna2008 = None
+_idna2008_loaded = False
+
+
+# Number of distinct non-ASCII names whose encoding is remembered
+IDNA_CACHE_SIZE = 1024
 
 
 def ascii_bytes(data):
@@ -24,33 +29,69 @@ def maybe_str(data):
     raise TypeError('only str (ascii encoding) and bytes are supported')
 
 
-def is_all_ascii(text):
-    for c in text:
-        if ord(c) > 0x7f:
-            return False
-    return True
+try:
+    is_all_ascii = str.isascii
+except AttributeError:
+    # Python < 3.7
+    def is_all_ascii(text):
+        for c in text:
+            if ord(c) > 0x7f:
+                return False
+        return True
+
+def _load_idna2008():
+    global idna2008, _idna2008_loaded
+    if not _idna2008_loaded:
+        try:
+            import idna
+        except ImportError:
+            pass
+        else:
+            idna2008 = idna
+        _idna2008_loaded = True
+    return idna2008
 
 def parse_name_idna2008(name):
+    idna = _load_idna2008()
     parts = name.split('.')
     r = []
     for part in parts:
         if is_all_ascii(part):
             r.append(part.encode('ascii'))
         else:
-            r.append(idna2008.encode(part))
+            r.append(idna.encode(part))
     return b'.'.join(r)
 
+@functools.lru_cache(maxsize=IDNA_CACHE_SIZE)
+def _encode_idna(name):
+    if _load_idna2008() is not None:
+        return parse_name_idna2008(name)
+    return name.encode('idna')
+
 def parse_name(name):
     if isinstance(name, str):
         if is_all_ascii(name):
             return name.encode('ascii')
-        if idna2008 is not None:
-            return parse_name_idna2008(name)
-        return name.encode('idna')
+        return _encode_idna(name)
     if isinstance(name, bytes):
         return name
     raise TypeError('only str and bytes are supported')
 
+def normalize_name(name):
+    # Return the name as a lowercase string without the trailing dot, as names
+    # are matched by the hosts file, overlays, routes and caches, or None if
+    # it can not be encoded.
+    try:
+        name = parse_name(name).decode('ascii')
+    except (TypeError, UnicodeError):
+        return None
+    return name.rstrip('.').lower()
+
+def parse_names(names):
+    # Encode names ahead of time, the resulting bytes are passed through as
+    # they are when given to a query.
+    return [parse_name(name) for name in names]
+
 
-__all__ = ['ascii_bytes', 'maybe_str', 'parse_name']
+__all__ = ['ascii_bytes', 'maybe_str', 'normalize_name', 'parse_name', 'parse_names']
 
@@ -1,17 +1,60 @@
 #!/usr/bin/env python
 
+import contextlib
+import gc
+import io
+import json
 import ipaddress
 import os
 import select
 import socket
+import subprocess
 import sys
+import tempfile
+import time
+import tracemalloc
 import unittest
+import urllib.request
 
 import pycares
+import pycares.__main__
+import pycares.cache
+import pycares.capture
+import pycares.hosts
+import pycares.openmetrics
+import pycares.overlay
+import pycares.ratelimit
+import pycares.router
+import pycares.stats
+import pycares.upstream
+from pycares.testing import FakeChannel, StubServer, Zone, dns
 
 FIXTURES_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), 'fixtures'))
 
 
+def wait_channel(channel):
+    # Channel groups may have queries waiting for a timer (e.g. a rate limit)
+    # and no socket open.
+    while True:
+        read_fds, write_fds = channel.getsock()
+        idle = not read_fds and not write_fds
+        if idle and not getattr(channel, 'pending', 0):
+            break
+        timeout = channel.timeout()
+        if timeout == 0.0:
+            channel.process_fd(pycares.ARES_SOCKET_BAD, pycares.ARES_SOCKET_BAD)
+            continue
+        if idle:
+            time.sleep(timeout)
+            channel.process_fd(pycares.ARES_SOCKET_BAD, pycares.ARES_SOCKET_BAD)
+            continue
+        rlist, wlist, xlist = select.select(read_fds, write_fds, [], timeout)
+        for fd in rlist:
+            channel.process_fd(fd, pycares.ARES_SOCKET_BAD)
+        for fd in wlist:
+            channel.process_fd(pycares.ARES_SOCKET_BAD, fd)
+
+
 class DNSTest(unittest.TestCase):
 
     def setUp(self):
@@ -21,19 +64,7 @@ class DNSTest(unittest.TestCase):
         self.channel = None
 
     def wait(self):
-        while True:
-            read_fds, write_fds = self.channel.getsock()
-            if not read_fds and not write_fds:
-                break
-            timeout = self.channel.timeout()
-            if timeout == 0.0:
-                self.channel.process_fd(pycares.ARES_SOCKET_BAD, pycares.ARES_SOCKET_BAD)
-                continue
-            rlist, wlist, xlist = select.select(read_fds, write_fds, [], timeout)
-            for fd in rlist:
-                self.channel.process_fd(fd, pycares.ARES_SOCKET_BAD)
-            for fd in wlist:
-                self.channel.process_fd(pycares.ARES_SOCKET_BAD, fd)
+        wait_channel(self.channel)
 
     def assertNoError(self, errorno):
         if errorno == pycares.errno.ARES_ETIMEOUT and (os.environ.get('APPVEYOR') or os.environ.get('TRAVIS')):
@@ -586,6 +617,1413 @@ class DNSTest(unittest.TestCase):
         for key in pycares.errno.errorcode:
             self.assertTrue(type(pycares.errno.strerror(key)), str)
 
+    @unittest.skipIf(sys.platform == 'win32', 'skipped on Windows')
+    def test_channel_stats(self):
+        self.result, self.errorno = None, None
+        def cb(result, errorno):
+            self.result, self.errorno = result, errorno
+        stats = pycares.stats.ChannelStats()
+        self.channel = pycares.Channel(timeout=5.0, tries=1, servers=['8.8.8.8'], stats=stats)
+        self.assertIs(self.channel.stats, stats)
+        self.channel.gethostbyname('localhost', socket.AF_INET, cb)
+        self.wait()
+        self.assertNoError(self.errorno)
+        self.channel.query('google.com', pycares.QUERY_TYPE_NS, cb)
+        self.assertEqual(stats.inflight, 1)
+        self.channel.cancel()
+        self.wait()
+        self.assertEqual(stats.submitted, 2)
+        self.assertEqual(stats.completed, 2)
+        self.assertEqual(stats.errors, {pycares.errno.ARES_ECANCELLED: 1})
+        self.assertEqual(set(stats.latency), {('8.8.8.8', 'gethostbyname'), ('8.8.8.8', 'NS')})
+        self.assertEqual(stats.by_type()['NS'].count, 1)
+        self.assertEqual(stats.by_server()['8.8.8.8'].count, 2)
+
+    def test_channel_no_stats(self):
+        self.assertEqual(self.channel.stats, None)
+
+    def test_channel_stats_invalid_name(self):
+        events = []
+        stats = pycares.stats.ChannelStats()
+        channel = pycares.Channel(servers=['127.0.0.1'], stats=stats, trace_hooks=[lambda *args: events.append(args)])
+        handles = len(pycares._global_set)
+        cb = lambda result, errorno: None
+        self.assertRaises(ValueError, channel.query, '-\xf1-.com', pycares.QUERY_TYPE_A, cb)
+        self.assertRaises(TypeError, channel.query, 123, pycares.QUERY_TYPE_A, cb)
+        self.assertRaises(ValueError, channel.gethostbyname, '-\xf1-.com', socket.AF_INET, cb)
+        self.assertEqual((stats.submitted, stats.inflight), (0, 0))
+        self.assertEqual(events, [])
+        self.assertEqual(len(pycares._global_set), handles)
+
+    @unittest.skipIf(sys.platform == 'win32', 'skipped on Windows')
+    def test_trace_hooks(self):
+        events = []
+        def hook(event, query_id, timestamp, info):
+            events.append((event, query_id, timestamp, info))
+        def cb(result, errorno):
+            events.append(('user_callback', None, None, errorno))
+        self.channel = pycares.Channel(timeout=1.0, tries=1, servers=['127.0.0.1'], udp_port=1, tcp_port=1, trace_hooks=[hook])
+        self.channel.query('google.com', pycares.QUERY_TYPE_A, cb)
+        self.wait()
+        names = [e[0] for e in events]
+        self.assertEqual(names[0], 'submit')
+        self.assertEqual(events[0][3], {'type': 'A', 'name': 'google.com'})
+        self.assertIn('socket_open', names)
+        self.assertIn('send', names)
+        self.assertEqual(names[-5:], ['parse_start', 'parse_end', 'callback_start', 'user_callback', 'callback_end'])
+        self.assertEqual(set(e[1] for e in events if e[0] not in ('socket_open', 'socket_close', 'user_callback')), {events[0][1]})
+        timestamps = [e[2] for e in events if e[2] is not None]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+        del events[:]
+        self.channel.remove_trace_hook(hook)
+        self.assertRaises(ValueError, self.channel.remove_trace_hook, hook)
+        self.channel.query('google.com', pycares.QUERY_TYPE_A, cb)
+        self.wait()
+        self.assertEqual([e[0] for e in events], ['user_callback'])
+
+    @unittest.skipIf(sys.platform == 'win32', 'skipped on Windows')
+    def test_slow_callback(self):
+        def cb(result, errorno):
+            time.sleep(0.05)
+        def fast_cb(result, errorno):
+            pass
+        stats = pycares.stats.ChannelStats()
+        self.channel = pycares.Channel(stats=stats, slow_callback_threshold=0.02)
+        with self.assertLogs('pycares', 'WARNING') as logs:
+            self.channel.gethostbyname('localhost', socket.AF_INET, cb)
+            self.channel.gethostbyname('localhost', socket.AF_INET, fast_cb)
+            self.wait()
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("callback for gethostbyname query 'localhost'", logs.output[0])
+        self.assertEqual(stats.slow_callbacks, 1)
+
+    @unittest.skipIf(sys.platform == 'win32', 'skipped on Windows')
+    def test_slow_sock_state_cb(self):
+        def sock_state_cb(fd, readable, writable):
+            time.sleep(0.05)
+        self.channel = pycares.Channel(timeout=1.0, tries=1, servers=['127.0.0.1'], udp_port=1, tcp_port=1,
+                                       sock_state_cb=sock_state_cb, slow_callback_threshold=0.02)
+        with self.assertLogs('pycares', 'WARNING') as logs:
+            self.channel.query('google.com', pycares.QUERY_TYPE_A, lambda *x: None)
+            self.wait()
+        self.assertIn('sock_state_cb for fd', logs.output[0])
+
+    @unittest.skipIf(sys.platform == 'win32', 'skipped on Windows')
+    def test_parse_profile(self):
+        def cb(result, errorno):
+            time.sleep(0.01)
+        profile = pycares.stats.ParseProfile()
+        self.channel = pycares.Channel(timeout=1.0, tries=1, servers=['127.0.0.1'], udp_port=1, tcp_port=1, parse_profile=profile)
+        self.assertIs(self.channel.parse_profile, profile)
+        self.channel.gethostbyname('localhost', socket.AF_INET, cb)
+        self.channel.query('google.com', pycares.QUERY_TYPE_A, cb)
+        self.wait()
+        self.assertEqual(set(profile.types), {'gethostbyname', 'A'})
+        times = profile.types['gethostbyname']
+        self.assertEqual((times.count, times.records, times.c_parse), (1, 1, 0.0))
+        self.assertGreater(times.build, 0.0)
+        self.assertGreaterEqual(times.callback, 0.01)
+        times = profile.types['A']
+        self.assertEqual((times.count, times.records), (1, 0))
+
+    def test_parse_result_timings(self):
+        reply = b'\x00\x01\x81\x80\x00\x01\x00\x01\x00\x00\x00\x00\x07example\x03com\x00\x00\x01\x00\x01' \
+                b'\x07example\x03com\x00\x00\x01\x00\x01\x00\x00\x01,\x00\x04\x01\x02\x03\x04'
+        timings = [0.0]
+        result, errorno = pycares.parse_result(pycares.QUERY_TYPE_A, reply, len(reply), timings)
+        self.assertEqual(errorno, None)
+        self.assertEqual([(r.host, r.ttl) for r in result], [('1.2.3.4', 300)])
+        self.assertGreater(timings[0], 0.0)
+        self.assertRaises(ValueError, pycares.parse_result, 667, reply, len(reply))
+
+    @unittest.skipIf(sys.platform == 'win32', 'skipped on Windows')
+    def test_add_trace_hook(self):
+        events = []
+        self.result, self.errorno = None, None
+        def cb(result, errorno):
+            self.result, self.errorno = result, errorno
+        self.channel.add_trace_hook(lambda *args: events.append(args))
+        self.assertRaises(TypeError, self.channel.add_trace_hook, None)
+        self.channel.gethostbyname('localhost', socket.AF_INET, cb)
+        self.wait()
+        self.assertNoError(self.errorno)
+        self.assertEqual([e[0] for e in events], ['submit', 'parse_start', 'parse_end', 'callback_start', 'callback_end'])
+
+    @unittest.skipIf(sys.platform == 'win32', 'skipped on Windows')
+    def test_add_trace_hook_socket_events(self):
+        # hooks added after the channel was created get socket events if it has a monitor or a sock_state_cb
+        sock_states = []
+        for kwargs in ({'stats': pycares.stats.ChannelStats()}, {'sock_state_cb': lambda *args: sock_states.append(args)}):
+            events = []
+            self.channel = pycares.Channel(timeout=1.0, tries=1, servers=['127.0.0.1'], udp_port=1, tcp_port=1, **kwargs)
+            self.channel.add_trace_hook(lambda *args: events.append(args[0]))
+            self.channel.query('google.com', pycares.QUERY_TYPE_A, lambda result, errorno: None)
+            self.wait()
+            self.assertIn('socket_open', events)
+        self.assertEqual(sock_states[0][1:], (True, False))
+
+
+class StubServerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        zone = Zone([
+            ('example.com', dns.TYPE_A, '192.0.2.1'),
+            ('example.com', dns.TYPE_A, '192.0.2.2', 60),
+            ('example.com', dns.TYPE_AAAA, '2001:db8::1'),
+            ('example.com', dns.TYPE_MX, (10, 'mx.example.com')),
+            ('example.com', dns.TYPE_NS, 'ns1.example.com'),
+            ('example.com', dns.TYPE_SOA, ('ns1.example.com', 'hostmaster.example.com', 2020, 3600, 600, 86400, 60)),
+            ('example.com', dns.TYPE_TXT, ('v=spf1 ', 'a ~all')),
+            ('example.com', dns.TYPE_NAPTR, (10, 20, 'S', 'SIP+D2U', '', '_sip._udp.example.com')),
+            ('_sip._udp.example.com', dns.TYPE_SRV, (1, 2, 5060, 'sip.example.com')),
+            ('www.example.com', dns.TYPE_CNAME, 'example.com'),
+            ('1.2.0.192.in-addr.arpa', dns.TYPE_PTR, 'example.com'),
+            ('long.example.com', dns.TYPE_TXT, 'x' * 600),
+        ])
+        for i in range(100):
+            zone.add('large.example.com', dns.TYPE_A, '10.0.0.%d' % i)
+        zone.add('slow.example.com', dns.TYPE_A, '192.0.2.3')
+        zone.configure('slow.example.com', delay=0.2)
+        zone.configure('drop.example.com', drop=True)
+        zone.configure('servfail.example.com', rcode=dns.RCODE_SERVFAIL)
+        zone.add('tc.example.com', dns.TYPE_A, '192.0.2.4')
+        zone.configure('tc.example.com', truncate=True)
+        cls.server = StubServer(zone).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.channel = self.server.channel(timeout=1.0, tries=1)
+        del self.server.queries[:]
+
+    def tearDown(self):
+        self.channel = None
+
+    def query(self, name, query_type, channel=None):
+        self.result, self.errorno = None, None
+        def cb(result, errorno):
+            self.result, self.errorno = result, errorno
+        channel = channel or self.channel
+        channel.query(name, query_type, cb)
+        wait_channel(channel)
+        return self.result, self.errorno
+
+    def test_query_a(self):
+        result, errorno = self.query('example.com', pycares.QUERY_TYPE_A)
+        self.assertEqual(errorno, None)
+        self.assertEqual([(r.host, r.ttl) for r in result], [('192.0.2.1', 300), ('192.0.2.2', 60)])
+
+    def test_query_types(self):
+        result, errorno = self.query('example.com', pycares.QUERY_TYPE_AAAA)
+        self.assertEqual(result[0].host, '2001:db8::1')
+        result, errorno = self.query('www.example.com', pycares.QUERY_TYPE_CNAME)
+        self.assertEqual(result.cname, 'example.com')
+        result, errorno = self.query('example.com', pycares.QUERY_TYPE_MX)
+        self.assertEqual((result[0].priority, result[0].host), (10, 'mx.example.com'))
+        result, errorno = self.query('example.com', pycares.QUERY_TYPE_NS)
+        self.assertEqual(result[0].host, 'ns1.example.com')
+        result, errorno = self.query('example.com', pycares.QUERY_TYPE_SOA)
+        self.assertEqual((result.nsname, result.hostmaster, result.serial, result.minttl), ('ns1.example.com', 'hostmaster.example.com', 2020, 60))
+        result, errorno = self.query('example.com', pycares.QUERY_TYPE_TXT)
+        self.assertEqual([r.text for r in result], ['v=spf1 a ~all'])
+        result, errorno = self.query('example.com', pycares.QUERY_TYPE_NAPTR)
+        self.assertEqual((result[0].order, result[0].service, result[0].replacement), (10, 'SIP+D2U', '_sip._udp.example.com'))
+        result, errorno = self.query('_sip._udp.example.com', pycares.QUERY_TYPE_SRV)
+        self.assertEqual((result[0].port, result[0].host), (5060, 'sip.example.com'))
+        result, errorno = self.query(ipaddress.ip_address('192.0.2.1').reverse_pointer, pycares.QUERY_TYPE_PTR)
+        self.assertEqual(result.name, 'example.com')
+        result, errorno = self.query('example.com', pycares.QUERY_TYPE_ANY)
+        self.assertTrue(len(result) > 5)
+
+    def test_cname_chase(self):
+        result, errorno = self.query('www.example.com', pycares.QUERY_TYPE_A)
+        self.assertEqual([r.host for r in result], ['192.0.2.1', '192.0.2.2'])
+
+    def test_gethostbyname(self):
+        self.result, self.errorno = None, None
+        def cb(result, errorno):
+            self.result, self.errorno = result, errorno
+        self.channel = self.server.channel(timeout=1.0, tries=1, lookups='b')
+        self.channel.gethostbyname('www.example.com', socket.AF_INET, cb)
+        wait_channel(self.channel)
+        self.assertEqual(self.errorno, None)
+        self.assertEqual(self.result.name, 'example.com')
+        self.assertEqual(self.result.aliases, ['www.example.com'])
+        self.assertEqual(self.result.addresses, ['192.0.2.1', '192.0.2.2'])
+
+    def test_hosts_file(self):
+        results = []
+        def cb(result, errorno):
+            results.append((result, errorno))
+        with tempfile.NamedTemporaryFile('w', suffix='.hosts') as f:
+            f.write('192.0.2.10 local.example.com\n')
+            f.flush()
+            self.channel = self.server.channel(timeout=1.0, tries=1, lookups='b', hosts=f.name)
+            self.channel.gethostbyname('local.example.com', socket.AF_INET, cb)
+            self.assertEqual(results[0][0].addresses, ['192.0.2.10'])
+            self.channel.gethostbyaddr('192.0.2.10', cb)
+            self.assertEqual(results[1][0].name, 'local.example.com')
+            self.assertEqual(self.server.queries, [])
+            self.channel.gethostbyname('example.com', socket.AF_INET, cb)
+            wait_channel(self.channel)
+            self.assertEqual(results[2][0].addresses, ['192.0.2.1', '192.0.2.2'])
+            self.assertEqual(len(self.server.queries), 1)
+
+    def test_hosts_file_monitor(self):
+        events = []
+        stats = pycares.stats.ChannelStats()
+        def cb(result, errorno):
+            events.append('user_callback')
+        with tempfile.NamedTemporaryFile('w', suffix='.hosts') as f:
+            f.write('192.0.2.10 local.example.com\n')
+            f.flush()
+            self.channel = self.server.channel(timeout=1.0, tries=1, hosts=f.name, stats=stats,
+                                               trace_hooks=[lambda *args: events.append(args[0])])
+            self.channel.gethostbyname('local.example.com', socket.AF_INET, cb)
+            self.channel.gethostbyaddr('192.0.2.10', cb)
+        # answers from the hosts file are counted and traced like the others
+        self.assertEqual(events, ['submit', 'parse_start', 'parse_end', 'callback_start', 'user_callback', 'callback_end'] * 2)
+        self.assertEqual((stats.submitted, stats.completed, stats.errors), (2, 2, {}))
+        self.assertEqual(sorted(stats.latency), [('hosts', 'gethostbyaddr'), ('hosts', 'gethostbyname')])
+        self.assertEqual(self.server.queries, [])
+
+    def test_router(self):
+        corp = Zone([('www.corp.example', dns.TYPE_A, '10.0.0.1'), ('1.0.0.10.in-addr.arpa', dns.TYPE_PTR, 'www.corp.example')])
+        with StubServer(corp) as corp_server:
+            router = pycares.router.Router({'corp.example': corp_server.channel(timeout=1.0, tries=1),
+                                            '10.in-addr.arpa.': corp_server.channel(timeout=1.0, tries=1)},
+                                           default=self.channel)
+            self.assertEqual(len(router.channels), 3)
+            results = []
+            def cb(result, errorno):
+                results.append((result, errorno))
+            router.query('www.corp.example', pycares.QUERY_TYPE_A, cb)
+            router.query('example.com', pycares.QUERY_TYPE_A, cb)
+            router.gethostbyname('WWW.Corp.Example.', socket.AF_INET, cb)
+            router.gethostbyaddr('10.0.0.1', cb)
+            router.gethostbyaddr('192.0.2.1', cb)
+            self.assertEqual(router.pending, 5)
+            wait_channel(router)
+            self.assertEqual(router.pending, 0)
+            self.assertEqual([e for _, e in results], [None] * 5)
+            self.assertEqual(results[0][0][0].host, '10.0.0.1')
+            self.assertEqual(len(corp_server.queries), 3)
+            self.assertEqual(len(self.server.queries), 2)
+
+            # sockets reported through sock_state_cb are dispatched to their channel
+            fds = set()
+            def sock_state_cb(fd, readable, writable):
+                (fds.add if readable or writable else fds.discard)(fd)
+            router = pycares.router.Router({'corp.example': [corp_server.host]}, default=[self.server.host],
+                                           sock_state_cb=sock_state_cb, udp_port=corp_server.port,
+                                           tcp_port=corp_server.port, timeout=1.0, tries=1)
+            router.query('www.corp.example', pycares.QUERY_TYPE_A, cb)
+            self.assertEqual(len(fds), 1)
+            while router.pending:
+                rlist, _, _ = select.select(list(fds), [], [], router.timeout())
+                for fd in rlist:
+                    router.process_fd(fd, pycares.ARES_SOCKET_BAD)
+            self.assertEqual(results[-1][0][0].host, '10.0.0.1')
+
+    def test_router_rate_limit(self):
+        stats = pycares.stats.ChannelStats()
+        router = pycares.router.Router({}, default=self.server.channel(timeout=1.0, tries=1, stats=stats),
+                                       rate_limit=20, burst=1, max_queue=2)
+        results = []
+        def cb(result, errorno):
+            results.append(errorno)
+        start = time.monotonic()
+        for _ in range(4):
+            router.query('example.com', pycares.QUERY_TYPE_A, cb)
+        # one query sent, two queued and one rejected
+        self.assertEqual(results, [pycares.errno.ARES_EREFUSED])
+        self.assertEqual(router.pending, 3)
+        self.assertEqual((stats.submitted, stats.throttled, stats.rejected), (1, 2, 1))
+        wait_channel(router)
+        self.assertEqual(router.pending, 0)
+        self.assertEqual(results, [pycares.errno.ARES_EREFUSED, None, None, None])
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        self.assertEqual(len(self.server.queries), 3)
+
+    def test_errors(self):
+        self.assertEqual(self.query('nx.example.com', pycares.QUERY_TYPE_A), (None, pycares.errno.ARES_ENOTFOUND))
+        self.assertEqual(self.query('_sip._udp.example.com', pycares.QUERY_TYPE_MX), (None, pycares.errno.ARES_ENODATA))
+        self.assertEqual(self.query('drop.example.com', pycares.QUERY_TYPE_A), (None, pycares.errno.ARES_ETIMEOUT))
+        channel = self.server.channel(timeout=1.0, tries=1, flags=pycares.ARES_FLAG_NOCHECKRESP)
+        self.assertEqual(self.query('servfail.example.com', pycares.QUERY_TYPE_A, channel), (None, pycares.errno.ARES_ESERVFAIL))
+
+    def test_truncation(self):
+        result, errorno = self.query('large.example.com', pycares.QUERY_TYPE_A)
+        self.assertEqual(len(result), 100)
+        result, errorno = self.query('tc.example.com', pycares.QUERY_TYPE_A)
+        self.assertEqual(result[0].host, '192.0.2.4')
+        result, errorno = self.query('long.example.com', pycares.QUERY_TYPE_TXT)
+        self.assertEqual(result[0].text, 'x' * 600)
+        self.assertEqual([q[2] for q in self.server.queries], ['udp', 'tcp', 'udp', 'tcp', 'udp', 'tcp'])
+
+    def test_delay(self):
+        channel = self.server.channel(timeout=0.1, tries=1)
+        self.assertEqual(self.query('slow.example.com', pycares.QUERY_TYPE_A, channel), (None, pycares.errno.ARES_ETIMEOUT))
+        start = time.monotonic()
+        result, errorno = self.query('slow.example.com', pycares.QUERY_TYPE_A)
+        self.assertEqual(result[0].host, '192.0.2.3')
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_cli_bulk(self):
+        names = os.path.join(FIXTURES_PATH, 'names.txt')
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            pycares.__main__.main(['-f', names, '-t', 'a,mx', '-c', '2', '-q', '-s', '127.0.0.1', '-p', str(self.server.port)])
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(lines), 6)
+        by_query = {(l['name'], l['type']): l for l in lines}
+        self.assertEqual(by_query[('example.com', 'A')]['status'], 'NOERROR')
+        self.assertEqual(sorted(a['host'] for a in by_query[('example.com', 'A')]['answers']), ['192.0.2.1', '192.0.2.2'])
+        self.assertEqual(by_query[('www.example.com', 'MX')]['answers'], [{'type': 'MX', 'host': 'mx.example.com', 'priority': 10, 'ttl': 300}])
+        self.assertEqual(by_query[('nonexistent.example.com', 'A')]['status'], 'ARES_ENOTFOUND')
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            pycares.__main__.main(['-f', names, '--format', 'tsv', '-q', '-s', '127.0.0.1', '-p', str(self.server.port)])
+        lines = sorted(out.getvalue().splitlines())
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0].split('\t')[:3], ['example.com', 'A', 'NOERROR'])
+        self.assertEqual(lines[0].split('\t')[4:], ['A 300 192.0.2.1', 'A 60 192.0.2.2'])
+
+    def test_cli_bulk_summary(self):
+        resolver = pycares.__main__.BulkResolver(self.channel, ['example.com', 'nonexistent.example.com'], ['A'], 1,
+                                                 pycares.__main__.format_tsv, io.StringIO())
+        resolver.run()
+        self.assertEqual(resolver.completed, 2)
+        self.assertEqual(resolver.statuses, {'NOERROR': 1, 'ARES_ENOTFOUND': 1})
+        self.assertTrue(resolver.summary(0.5).startswith(';; 2 queries in 0.500 seconds (4.0 qps): 1 ARES_ENOTFOUND, 1 NOERROR'))
+
+    def test_cli_bulk_bad_name(self):
+        out = io.StringIO()
+        resolver = pycares.__main__.BulkResolver(self.channel, ['example.com', '-\xf1-.com', 'example.com'], ['A'], 10,
+                                                 pycares.__main__.format_tsv, out)
+        resolver.run()
+        self.assertEqual(resolver.completed, 3)
+        self.assertEqual(resolver.statuses, {'NOERROR': 2, 'ARES_EBADNAME': 1})
+        self.assertEqual(resolver.inflight, 0)
+        self.assertIn('-\xf1-.com\tA\tARES_EBADNAME', out.getvalue())
+
+    def test_capture_replay(self):
+        f = io.BytesIO()
+        recorder = pycares.capture.Recorder(f, responses=True)
+        channel = self.server.channel(timeout=1.0, tries=1, lookups='b', capture=recorder)
+        self.assertIs(channel.capture, recorder)
+        def cb(result, errorno):
+            pass
+        channel.query('example.com', pycares.QUERY_TYPE_A, cb)
+        channel.search('www.example.com', pycares.QUERY_TYPE_MX, cb)
+        channel.query('nonexistent.example.com', pycares.QUERY_TYPE_A, cb)
+        channel.gethostbyname('example.com', socket.AF_INET, cb)
+        wait_channel(channel)
+        recorder.close()
+        self.assertEqual(recorder.queries, 4)
+
+        capture = pycares.capture.load(io.BytesIO(f.getvalue()))
+        self.assertTrue(capture.responses)
+        self.assertEqual([(q.method, q.type, q.name) for q in capture.queries],
+                         [('query', pycares.QUERY_TYPE_A, 'example.com'),
+                          ('search', pycares.QUERY_TYPE_MX, 'www.example.com'),
+                          ('query', pycares.QUERY_TYPE_A, 'nonexistent.example.com'),
+                          ('gethostbyname', 0, 'example.com')])
+        self.assertEqual([q.status for q in capture.queries], [0, 0, pycares.errno.ARES_ENOTFOUND, 0])
+        self.assertEqual(capture.queries[3].arg, socket.AF_INET)
+        self.assertIsNone(capture.queries[3].response)
+        self.assertEqual(pycares.parse_result(pycares.QUERY_TYPE_A, capture.queries[0].response, len(capture.queries[0].response))[0][0].host, '192.0.2.1')
+
+        # replay against a server which only knows the captured responses
+        with StubServer(pycares.capture.build_zone(capture)) as server:
+            replayer = pycares.capture.Replayer(capture, server.channel(timeout=1.0, tries=1, lookups='b'), speed=None)
+            replayer.run()
+            self.assertEqual(replayer.completed, 4)
+            # gethostbyname is answered with the A response captured for the first query
+            self.assertEqual(replayer.statuses, {0: 3, pycares.errno.ARES_ENOTFOUND: 1})
+            self.assertEqual(replayer.histogram.count, 4)
+            self.assertEqual([(q[0], q[1]) for q in server.queries[:3]],
+                             [('example.com', dns.TYPE_A), ('www.example.com', dns.TYPE_MX), ('nonexistent.example.com', dns.TYPE_A)])
+
+    def test_capture_bad_file(self):
+        self.assertRaises(ValueError, pycares.capture.load, io.BytesIO(b'garbage garbage garbage'))
+        f = io.BytesIO()
+        recorder = pycares.capture.Recorder(f)
+        recorder.submit(1, 'query', pycares.QUERY_TYPE_A, 1, 'example.com')
+        self.assertRaises(ValueError, pycares.capture.load, io.BytesIO(f.getvalue()[:-3]))
+
+
+class FakeChannelTest(unittest.TestCase):
+
+    def setUp(self):
+        zone = Zone([
+            ('example.com', dns.TYPE_A, '192.0.2.1'),
+            ('example.com', dns.TYPE_AAAA, '2001:db8::1'),
+            ('example.com', dns.TYPE_MX, (10, 'mx.example.com')),
+            ('example.com', dns.TYPE_TXT, ('v=spf1 ', 'x' * 300)),
+            ('www.example.com', dns.TYPE_CNAME, 'example.com'),
+            ('1.2.0.192.in-addr.arpa', dns.TYPE_PTR, 'example.com'),
+            ('slow.example.com', dns.TYPE_A, '192.0.2.2'),
+        ])
+        zone.configure('slow.example.com', delay=0.5)
+        zone.configure('drop.example.com', drop=True)
+        zone.configure('servfail.example.com', rcode=dns.RCODE_SERVFAIL)
+        self.channel = FakeChannel(zone, timeout=1.0, tries=2, domains=['example.com'])
+        self.results = []
+
+    def cb(self, result, errorno):
+        self.results.append((self.channel.now, result, errorno))
+
+    def test_query(self):
+        self.channel.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.channel.query('www.example.com', pycares.QUERY_TYPE_MX, self.cb)
+        self.channel.query('example.com', pycares.QUERY_TYPE_TXT, self.cb)
+        self.assertEqual(self.results, [])
+        self.assertEqual(self.channel.getsock(), ([], []))
+        self.assertEqual(self.channel.timeout(), 0.0)
+        self.channel.process_fd(pycares.ARES_SOCKET_BAD, pycares.ARES_SOCKET_BAD)
+        self.assertEqual(len(self.results), 3)
+        (_, a, e1), (_, mx, e2), (_, txt, e3) = self.results
+        self.assertEqual((e1, e2, e3), (None, None, None))
+        self.assertEqual(type(a[0]), pycares.ares_query_a_result)
+        self.assertEqual((a[0].host, a[0].ttl), ('192.0.2.1', 300))
+        self.assertEqual((mx[0].host, mx[0].priority), ('mx.example.com', 10))
+        self.assertEqual(txt[0].text, 'v=spf1 ' + 'x' * 300)
+        self.assertEqual(self.channel.queries, [('example.com', dns.TYPE_A), ('www.example.com', dns.TYPE_MX), ('example.com', dns.TYPE_TXT)])
+
+    def test_query_errors(self):
+        self.channel.query('nonexistent.example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.channel.query('example.com', pycares.QUERY_TYPE_SRV, self.cb)
+        self.channel.query('servfail.example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.channel.run()
+        self.assertEqual([r[2] for r in self.results], [pycares.errno.ARES_ENOTFOUND, pycares.errno.ARES_ENODATA, pycares.errno.ARES_ECONNREFUSED])
+        self.assertRaises(ValueError, self.channel.query, 'example.com', 667, self.cb)
+        self.assertRaises(TypeError, self.channel.query, 'example.com', pycares.QUERY_TYPE_A, None)
+
+    def test_virtual_time(self):
+        self.channel.query('slow.example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.channel.query('drop.example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.assertEqual(self.channel.timeout(), 0.5)
+        self.channel.advance(0.4)
+        self.assertEqual(self.results, [])
+        self.channel.advance(0.1)
+        self.assertEqual(len(self.results), 1)
+        self.assertEqual(self.results[0][0], 0.5)
+        self.assertEqual(self.results[0][1][0].host, '192.0.2.2')
+        self.assertEqual(self.channel.timeout(0.2), 0.2)
+        self.channel.run()
+        self.assertEqual(self.results[1], (2.0, None, pycares.errno.ARES_ETIMEOUT))
+        self.assertEqual(self.channel.pending, 0)
+
+    def test_cancel(self):
+        self.channel.query('drop.example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.channel.cancel()
+        self.assertEqual(self.results, [(0.0, None, pycares.errno.ARES_ECANCELLED)])
+
+    def test_search(self):
+        self.channel.search('www', pycares.QUERY_TYPE_A, self.cb)
+        self.channel.run()
+        self.assertEqual(self.results[0][1][0].host, '192.0.2.1')
+        self.assertEqual(self.channel.queries, [('www.example.com', dns.TYPE_A)])
+
+    def test_host_functions(self):
+        self.channel.gethostbyname('www.example.com', socket.AF_INET, self.cb)
+        self.channel.gethostbyname('example.com', socket.AF_INET6, self.cb)
+        self.channel.gethostbyaddr('192.0.2.1', self.cb)
+        self.channel.getnameinfo(('192.0.2.1', 80), pycares.ARES_NI_LOOKUPHOST | pycares.ARES_NI_LOOKUPSERVICE | pycares.ARES_NI_NUMERICSERV, self.cb)
+        self.channel.run()
+        (_, h4, _), (_, h6, _), (_, ptr, _), (_, ni, _) = self.results
+        self.assertEqual(type(h4), pycares.ares_host_result)
+        self.assertEqual((h4.name, h4.aliases, h4.addresses), ('example.com', ['www.example.com'], ['192.0.2.1']))
+        self.assertEqual(h6.addresses, ['2001:db8::1'])
+        self.assertEqual((ptr.name, ptr.addresses), ('example.com', ['192.0.2.1']))
+        self.assertEqual((ni.node, ni.service), ('example.com', '80'))
+
+    def test_immediate(self):
+        channel = FakeChannel(self.channel.zone, immediate=True)
+        channel.query('example.com', pycares.QUERY_TYPE_AAAA, self.cb)
+        self.assertEqual(self.results[0][1][0].host, '2001:db8::1')
+
+
+class HostsFileTest(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.hosts')
+        os.close(fd)
+        self.write('# comment\n'
+                   '127.0.0.1   localhost\n'
+                   '192.0.2.1   Web.example.com web www  # trailing comment\n'
+                   '192.0.2.2   web.example.com\n'
+                   '2001:db8::1 web.example.com\n'
+                   'fe80::1%lo0 link.example.com\n'
+                   'garbage     bad.example.com\n')
+        self.hosts = pycares.hosts.HostsFile(self.path, check_interval=None)
+
+    def tearDown(self):
+        os.unlink(self.path)
+
+    def write(self, text):
+        with open(self.path, 'w') as f:
+            f.write(text)
+
+    def test_gethostbyname(self):
+        result = self.hosts.gethostbyname('web.example.com', socket.AF_INET)
+        self.assertEqual((result.name, result.aliases, result.addresses),
+                         ('Web.example.com', ['web', 'www'], ['192.0.2.1', '192.0.2.2']))
+        self.assertEqual(self.hosts.gethostbyname('WWW.', socket.AF_INET).addresses, ['192.0.2.1'])
+        self.assertEqual(self.hosts.gethostbyname('web.example.com', socket.AF_INET6).addresses, ['2001:db8::1'])
+        self.assertEqual(self.hosts.gethostbyname(b'web.example.com', socket.AF_UNSPEC).addresses, ['2001:db8::1'])
+        self.assertEqual(self.hosts.gethostbyname('www', socket.AF_UNSPEC).addresses, ['192.0.2.1'])
+        self.assertEqual(self.hosts.gethostbyname('link.example.com', socket.AF_INET6).addresses, ['fe80::1'])
+        self.assertIsNone(self.hosts.gethostbyname('localhost', socket.AF_INET6))
+        self.assertIsNone(self.hosts.gethostbyname('bad.example.com', socket.AF_UNSPEC))
+        self.assertIsNone(self.hosts.gethostbyname('nx.example.com', socket.AF_INET))
+
+    def test_gethostbyaddr(self):
+        result = self.hosts.gethostbyaddr('192.0.2.1')
+        self.assertEqual((result.name, result.aliases, result.addresses), ('Web.example.com', ['web', 'www'], ['192.0.2.1']))
+        self.assertEqual(self.hosts.gethostbyaddr('2001:db8:0::1').name, 'web.example.com')
+        self.assertIsNone(self.hosts.gethostbyaddr('192.0.2.3'))
+
+    def test_reload(self):
+        self.assertEqual(len(self.hosts), 5)
+        self.write('192.0.2.3 new.example.com\n')
+        self.assertEqual(self.hosts.gethostbyname('new.example.com', socket.AF_INET).addresses, ['192.0.2.3'])
+        self.assertIsNone(self.hosts.gethostbyname('web.example.com', socket.AF_INET))
+        os.unlink(self.path)
+        self.assertIsNone(self.hosts.gethostbyname('new.example.com', socket.AF_INET))
+        self.write('')
+
+
+class OverlayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.overlay = pycares.overlay.Overlay([
+            ('api.svc.local', pycares.QUERY_TYPE_A, '10.0.0.1'),
+            ('api.svc.local', pycares.QUERY_TYPE_A, '10.0.0.2', 30),
+            ('api.svc.local', pycares.QUERY_TYPE_AAAA, '2001:db8:0::1'),
+            ('*.svc.local', pycares.QUERY_TYPE_A, '10.0.0.100'),
+            ('*.db.svc.local', pycares.QUERY_TYPE_A, '10.0.1.100'),
+            ('www.svc.local', pycares.QUERY_TYPE_CNAME, 'api.svc.local'),
+            ('svc.local', pycares.QUERY_TYPE_MX, (10, 'mx.svc.local')),
+            ('svc.local', pycares.QUERY_TYPE_SOA, ('ns1.svc.local', 'hostmaster.svc.local', 1, 3600, 600, 86400, 60)),
+            ('svc.local', pycares.QUERY_TYPE_TXT, ('v=spf1 ', '-all')),
+            ('_http._tcp.svc.local', pycares.QUERY_TYPE_SRV, (10, 5, 8080, 'api.svc.local')),
+        ])
+
+    def test_lookup(self):
+        result, errorno = self.overlay.lookup('API.svc.local.', pycares.QUERY_TYPE_A)
+        self.assertEqual([(r.type, r.host, r.ttl) for r in result], [('A', '10.0.0.1', 300), ('A', '10.0.0.2', 30)])
+        result, errorno = self.overlay.lookup('api.svc.local', pycares.QUERY_TYPE_AAAA)
+        self.assertEqual(result[0].host, '2001:db8::1')
+        result, errorno = self.overlay.lookup('svc.local', pycares.QUERY_TYPE_SOA)
+        self.assertEqual((result.nsname, result.minttl), ('ns1.svc.local', 60))
+        result, errorno = self.overlay.lookup('svc.local', pycares.QUERY_TYPE_TXT)
+        self.assertEqual(result[0].text, 'v=spf1 -all')
+        result, errorno = self.overlay.lookup('_http._tcp.svc.local', pycares.QUERY_TYPE_SRV)
+        self.assertEqual((result[0].port, result[0].host), (8080, 'api.svc.local'))
+        result, errorno = self.overlay.lookup('svc.local', pycares.QUERY_TYPE_ANY)
+        self.assertEqual(sorted(r.type for r in result), ['MX', 'SOA', 'TXT'])
+        self.assertEqual(self.overlay.lookup('svc.local', pycares.QUERY_TYPE_A), (None, pycares.errno.ARES_ENODATA))
+        self.assertIsNone(self.overlay.lookup('example.com', pycares.QUERY_TYPE_A))
+
+    def test_wildcards(self):
+        self.assertEqual(self.overlay.lookup('x.svc.local', pycares.QUERY_TYPE_A)[0][0].host, '10.0.0.100')
+        self.assertEqual(self.overlay.lookup('a.b.svc.local', pycares.QUERY_TYPE_A)[0][0].host, '10.0.0.100')
+        self.assertEqual(self.overlay.lookup('x.db.svc.local', pycares.QUERY_TYPE_A)[0][0].host, '10.0.1.100')
+        self.assertEqual(self.overlay.lookup('db.svc.local', pycares.QUERY_TYPE_A)[0][0].host, '10.0.0.100')
+        self.assertEqual(self.overlay.lookup('x.svc.local', pycares.QUERY_TYPE_MX), (None, pycares.errno.ARES_ENODATA))
+        self.assertIsNone(self.overlay.lookup('svc.local.example', pycares.QUERY_TYPE_A))
+        self.overlay.remove('*.db.svc.local')
+        self.assertEqual(self.overlay.lookup('x.db.svc.local', pycares.QUERY_TYPE_A)[0][0].host, '10.0.0.100')
+        self.overlay.remove('*.svc.local', pycares.QUERY_TYPE_A)
+        self.assertIsNone(self.overlay.lookup('x.svc.local', pycares.QUERY_TYPE_A))
+        self.assertEqual(len(self.overlay), 4)
+
+    def test_cname(self):
+        result, errorno = self.overlay.lookup('www.svc.local', pycares.QUERY_TYPE_A)
+        self.assertEqual([r.host for r in result], ['10.0.0.1', '10.0.0.2'])
+        self.assertEqual(self.overlay.lookup('www.svc.local', pycares.QUERY_TYPE_CNAME)[0].cname, 'api.svc.local')
+        self.overlay.add('ext.svc.local', pycares.QUERY_TYPE_CNAME, 'example.com')
+        self.assertIsNone(self.overlay.lookup('ext.svc.local', pycares.QUERY_TYPE_A))
+
+    def test_copies(self):
+        # results can be modified without changing the overlay
+        result = self.overlay.lookup('api.svc.local', pycares.QUERY_TYPE_A)[0]
+        result.pop().ttl = -1
+        self.overlay.lookup('svc.local', pycares.QUERY_TYPE_SOA)[0].ttl = -1
+        for record in self.overlay.lookup('svc.local', pycares.QUERY_TYPE_ANY)[0]:
+            record.ttl = -1
+        self.overlay.add('1.0.0.10.in-addr.arpa', pycares.QUERY_TYPE_PTR, 'api.svc.local')
+        self.overlay.lookup('1.0.0.10.in-addr.arpa', pycares.QUERY_TYPE_PTR)[0].aliases.append('x')
+        self.assertEqual([r.ttl for r in self.overlay.lookup('api.svc.local', pycares.QUERY_TYPE_A)[0]], [300, 30])
+        self.assertEqual(self.overlay.lookup('svc.local', pycares.QUERY_TYPE_SOA)[0].ttl, 300)
+        self.assertEqual(sorted(r.ttl for r in self.overlay.lookup('svc.local', pycares.QUERY_TYPE_ANY)[0]), [300] * 3)
+        self.assertEqual(self.overlay.lookup('1.0.0.10.in-addr.arpa', pycares.QUERY_TYPE_PTR)[0].aliases, [])
+
+    def test_gethostbyname_cname(self):
+        # as with c-ares, the canonical name is the name of the result and the CNAMEs are its aliases
+        self.overlay.add('web.svc.local', pycares.QUERY_TYPE_CNAME, 'WWW.svc.local.')
+        result, errorno = self.overlay.gethostbyname('web.svc.local', socket.AF_INET)
+        self.assertEqual((result.name, result.aliases, result.addresses),
+                         ('api.svc.local', ['web.svc.local', 'www.svc.local'], ['10.0.0.1', '10.0.0.2']))
+        result, errorno = self.overlay.gethostbyname('api.svc.local', socket.AF_INET)
+        self.assertEqual((result.name, result.aliases), ('api.svc.local', []))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, self.overlay.add, 'x.svc.local', 999, 'x')
+        self.assertRaises(OSError, self.overlay.add, 'x.svc.local', pycares.QUERY_TYPE_A, 'not an address')
+
+    def test_channel(self):
+        results = []
+        def cb(result, errorno):
+            results.append((result, errorno))
+        channel = pycares.Channel(overlay=self.overlay, servers=['127.0.0.1'], udp_port=9, tcp_port=9, timeout=0.1, tries=1)
+        channel.query('api.svc.local', pycares.QUERY_TYPE_A, cb)
+        channel.search('x.svc.local', pycares.QUERY_TYPE_A, cb)
+        channel.gethostbyname('api.svc.local', socket.AF_UNSPEC, cb)
+        channel.gethostbyname('svc.local', socket.AF_INET, cb)
+        self.assertEqual(channel.getsock(), ([], []))
+        self.assertEqual(len(results[0][0]), 2)
+        self.assertEqual(results[1][0][0].host, '10.0.0.100')
+        self.assertEqual((results[2][0].name, results[2][0].addresses), ('api.svc.local', ['2001:db8::1']))
+        self.assertEqual(results[3], (None, pycares.errno.ARES_ENODATA))
+        channel.query('api.svc.local', pycares.QUERY_TYPE_A, cb, query_class=pycares.QUERY_CLASS_CHAOS)
+        self.assertEqual(len(results), 4)
+        channel.cancel()
+
+    def test_channel_monitor(self):
+        events = []
+        stats = pycares.stats.ChannelStats()
+        channel = pycares.Channel(overlay=self.overlay, servers=['127.0.0.1'], udp_port=9, tcp_port=9, timeout=0.1, tries=1,
+                                  stats=stats, trace_hooks=[lambda *args: events.append((args[0], args[3]))])
+        channel.query('api.svc.local', pycares.QUERY_TYPE_A, lambda result, errorno: None)
+        channel.gethostbyname('svc.local', socket.AF_INET, lambda result, errorno: None)
+        # answers from the overlay are counted and traced like the others
+        self.assertEqual([e for e, _ in events], ['submit', 'parse_start', 'parse_end', 'callback_start', 'callback_end'] * 2)
+        self.assertEqual([info['status'] for e, info in events if e == 'parse_end'], [None, pycares.errno.ARES_ENODATA])
+        self.assertEqual((stats.submitted, stats.completed, stats.errors), (2, 2, {pycares.errno.ARES_ENODATA: 1}))
+        self.assertEqual(sorted(stats.latency), [('overlay', 'A'), ('overlay', 'gethostbyname')])
+        channel.cancel()
+
+
+class UpstreamPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.servers = []
+        for delay, drop in ((0.0, True), (0.05, False), (0.0, False)):
+            zone = Zone([('example.com', dns.TYPE_A, '192.0.2.1')])
+            zone.configure('example.com', delay=delay, drop=drop)
+            self.servers.append(StubServer(zone).start())
+        self.results = []
+
+    def tearDown(self):
+        for server in self.servers:
+            server.stop()
+
+    def cb(self, result, errorno):
+        self.results.append((result, errorno))
+
+    def pool(self, **kwargs):
+        kwargs.setdefault('explore', 0)
+        return pycares.upstream.UpstreamPool([(s.host, s.port) for s in self.servers], timeout=0.2, **kwargs)
+
+    def test_failover_and_ranking(self):
+        pool = self.pool()
+        dead, slow, fast = pool.upstreams
+        self.assertEqual(dead.server, '%s:%d' % (self.servers[0].host, self.servers[0].port))
+        pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(pool)
+        # the dead server times out, the query is retried on the next one
+        self.assertEqual(self.results[0][0][0].host, '192.0.2.1')
+        self.assertEqual((dead.failures, slow.queries), (1, 1))
+        for _ in range(5):
+            pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+            wait_channel(pool)
+        self.assertEqual([e for _, e in self.results], [None] * 6)
+        self.assertEqual(pool.servers[0], fast.server)
+        self.assertEqual(pool.servers[-1], dead.server)
+        self.assertGreaterEqual(fast.queries, 4)
+        self.assertEqual(dead.queries, 1)
+        self.assertLess(fast.rtt, slow.rtt)
+        self.assertEqual(pool.pending, 0)
+
+    def test_attempts(self):
+        pool = self.pool(attempts=1)
+        pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(pool)
+        self.assertEqual(self.results, [(None, pycares.errno.ARES_ETIMEOUT)])
+        pool.query('nx.example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(pool)
+        self.assertEqual(self.results[1], (None, pycares.errno.ARES_ENOTFOUND))
+        self.assertEqual([u.queries for u in pool.upstreams], [1, 1, 0])
+
+    def test_circuit_breaker(self):
+        servers = [self.servers[0], self.servers[2]]
+        pool = pycares.upstream.UpstreamPool([(s.host, s.port) for s in servers], timeout=0.1, explore=0,
+                                             failure_threshold=1, recovery_interval=0.2)
+        dead, fast = pool.upstreams
+        for _ in range(3):
+            pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+            wait_channel(pool)
+        self.assertEqual([e for _, e in self.results], [None] * 3)
+        self.assertEqual((dead.state, dead.queries, dead.ejections), (pycares.upstream.OPEN, 1, 1))
+        self.assertEqual(pool.active, [fast.server])
+        # the server recovers, the next query after recovery_interval sends a probe
+        servers[0].zone.configure('example.com')
+        time.sleep(0.2)
+        pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.assertEqual(dead.state, pycares.upstream.HALF_OPEN)
+        wait_channel(pool)
+        self.assertEqual(dead.state, pycares.upstream.CLOSED)
+        self.assertEqual(dead.probes, 1)
+        self.assertEqual(servers[0].queries[-1][:2], ('', dns.TYPE_NS))
+        self.assertEqual(sorted(pool.active), sorted([dead.server, fast.server]))
+        self.assertEqual(pool.snapshot()[0]['state'], 'closed')
+
+    def test_all_ejected(self):
+        pool = pycares.upstream.UpstreamPool([(self.servers[0].host, self.servers[0].port)], timeout=0.1,
+                                             failure_threshold=1, recovery_interval=60)
+        for _ in range(2):
+            pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+            wait_channel(pool)
+        self.assertEqual(self.results, [(None, pycares.errno.ARES_ETIMEOUT)] * 2)
+        self.assertEqual(pool.upstreams[0].queries, 2)
+
+    def test_explore(self):
+        pool = self.pool(explore=1.0, attempts=1)
+        dead, slow, fast = pool.upstreams
+        dead.record(0.2, True)
+        slow.record(0.05, False)
+        fast.record(0.001, False)
+        for _ in range(4):
+            pool.query('nx.example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(pool)
+        self.assertEqual((dead.queries + slow.queries, fast.queries), (6, 1))
+
+    def test_rto(self):
+        upstream = pycares.upstream.Upstream('192.0.2.53', None, 1.0, 0.2)
+        self.assertIsNone(upstream.rto)
+        upstream.record(0.1, False)
+        self.assertAlmostEqual(upstream.rto, 0.3)
+        upstream.record(0.1, False)
+        self.assertAlmostEqual(upstream.rto, 0.25)
+        upstream.record(1.0, True)
+        self.assertAlmostEqual(upstream.rto, 0.25)
+
+    def test_adaptive_timeout(self):
+        server = self.servers[2]
+        pool = pycares.upstream.UpstreamPool([(server.host, server.port)], timeout=1.0, adaptive_timeout=True,
+                                             min_timeout=0.05)
+        upstream = pool.upstreams[0]
+        channel = upstream.channel
+        pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(pool)
+        # the server answered quickly, its channel was replaced by one with the minimum timeout,
+        # the old one was dropped once both queries completed
+        self.assertEqual([e for _, e in self.results], [None] * 2)
+        self.assertEqual(upstream.timeout, 0.05)
+        self.assertIsNot(upstream.channel, channel)
+        self.assertEqual(pool.channels, [upstream.channel])
+        # timeouts double the timeout
+        server.zone.configure('example.com', drop=True)
+        pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(pool)
+        self.assertEqual(self.results[2], (None, pycares.errno.ARES_ETIMEOUT))
+        self.assertEqual(upstream.timeout, 0.1)
+        self.assertEqual(pool.snapshot()[0]['timeout'], 0.1)
+        self.assertEqual(len(pool.channels), 1)
+
+    def test_adaptive_max_timeout(self):
+        server = self.servers[0]
+        pool = pycares.upstream.UpstreamPool([(server.host, server.port)], adaptive_timeout=True, max_timeout=0.2)
+        upstream = pool.upstreams[0]
+        channel = upstream.channel
+        # without a timeout option the server starts at max_timeout, and so does its channel
+        self.assertEqual(upstream.timeout, 0.2)
+        start = time.monotonic()
+        pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(pool)
+        self.assertEqual(self.results, [(None, pycares.errno.ARES_ETIMEOUT)])
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertIs(upstream.channel, channel)
+
+    def test_rate_limit(self):
+        slow, fast = self.servers[1:]
+        pool = pycares.upstream.UpstreamPool([(s.host, s.port) for s in (fast, slow)], timeout=1.0, explore=0,
+                                             rate_limit=1, burst=1, max_queue=0)
+        for _ in range(3):
+            pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        # the first server is out of tokens and has no queue, the second query goes to the
+        # next server, the third one is rejected
+        self.assertEqual(self.results, [(None, pycares.errno.ARES_EREFUSED)])
+        wait_channel(pool)
+        self.assertEqual([e for _, e in self.results], [pycares.errno.ARES_EREFUSED, None, None])
+        self.assertEqual([u.queries for u in pool.upstreams], [1, 1])
+        self.assertEqual([(s['throttled'], s['rejected'], s['queued']) for s in pool.snapshot()], [(0, 2, 0), (0, 1, 0)])
+
+    def test_hedge(self):
+        slow, fast = self.servers[1:]
+        pool = pycares.upstream.UpstreamPool([(s.host, s.port) for s in (slow, fast)], timeout=1.0, explore=0,
+                                             hedge_delay=0.01, hedge_budget=1.0)
+        pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.assertEqual(pool.pending, 1)
+        wait_channel(pool)
+        # the slow server did not answer within hedge_delay, the fast one won
+        self.assertEqual(self.results[0][0][0].host, '192.0.2.1')
+        self.assertEqual(len(self.results), 1)
+        self.assertEqual((pool.hedged, pool.hedge_wins), (1, 1))
+        self.assertEqual([u.queries for u in pool.upstreams], [1, 1])
+        self.assertEqual(pool.pending, 0)
+        self.assertEqual(pool.timeout(), 0.0)
+
+    def test_hedge_budget(self):
+        slow, fast = self.servers[1:]
+        pool = pycares.upstream.UpstreamPool([(s.host, s.port) for s in (slow, fast)], timeout=1.0, explore=0,
+                                             hedge_delay=0.01, hedge_budget=0.5)
+        pool.upstreams[1].record(0.1, False)
+        for _ in range(4):
+            pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+            wait_channel(pool)
+        self.assertEqual([e for _, e in self.results], [None] * 4)
+        self.assertEqual(pool.hedged, 2)
+        self.assertEqual(pool.upstreams[1].queries, 3)
+
+    def test_hedge_burst(self):
+        slow, fast = self.servers[1:]
+        fast.zone.configure('example.com', delay=0.05)
+        pool = pycares.upstream.UpstreamPool([(s.host, s.port) for s in (slow, fast)], timeout=1.0, explore=0,
+                                             hedge_delay=0.01, hedge_budget=0.05)
+        pool._hedge_tokens = 0.9
+        for _ in range(60):
+            pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(pool)
+        # the budget is taken when the hedge is scheduled, not when it is sent
+        self.assertEqual([e for _, e in self.results], [None] * 60)
+        self.assertEqual(pool.hedged, 3)
+        self.assertGreaterEqual(pool._hedge_tokens, 0.0)
+
+    def test_hedge_refund(self):
+        slow, fast = self.servers[1:]
+        pool = pycares.upstream.UpstreamPool([(s.host, s.port) for s in (fast, slow)], timeout=1.0, explore=0,
+                                             hedge_delay=0.5, hedge_budget=1.0)
+        pool.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.assertEqual(pool._hedge_tokens, 0.0)
+        wait_channel(pool)
+        # the primary answered before the hedge delay, the token was given back
+        self.assertEqual((pool.hedged, pool._hedge_tokens), (0, 1.0))
+        self.assertEqual(pool.timeout(), 0.0)
+
+    def test_hedge_auto(self):
+        pool = self.pool(hedge_delay='auto', hedge_budget=1.0)
+        self.assertIsNone(pool._hedge_delay())
+        pool._rtts.extend(i / 1000.0 for i in range(1, 101))
+        self.assertEqual(pool._hedge_delay(), 0.096)
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.zone = Zone([('example.com', dns.TYPE_A, '192.0.2.1', 60), ('www.example.com', dns.TYPE_CNAME, 'example.com')])
+        self.server = StubServer(self.zone).start()
+        self.results = []
+
+    def tearDown(self):
+        self.server.stop()
+
+    def cb(self, result, errorno):
+        self.results.append((result, errorno))
+
+    def cache(self, **kwargs):
+        return pycares.cache.ResponseCache(self.server.channel(timeout=0.2, tries=1), **kwargs)
+
+    def test_cache(self):
+        cache = self.cache()
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        cache.query('Example.COM.', pycares.QUERY_TYPE_A, self.cb)
+        self.assertEqual(cache.pending, 1)
+        wait_channel(cache)
+        # answered from the cache right away
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        cache.query('nx.example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        cache.query('nx.example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.assertEqual([e for _, e in self.results], [None] * 3 + [pycares.errno.ARES_ENOTFOUND] * 2)
+        self.assertEqual([r[0].host for r, _ in self.results[:3]], ['192.0.2.1'] * 3)
+        self.assertEqual(len(self.server.queries), 2)
+        self.assertEqual(cache.snapshot(), {'entries': 2, 'hits': 2, 'misses': 3, 'stale': 0, 'evictions': 0,
+                                            'prefetches': 0, 'prefetch_throttled': 0, 'rejected': 0})
+        self.assertFalse(pycares.cache.is_stale(self.results[0][0]))
+        # answers without TTLs are cached for default_ttl
+        cache.query('www.example.com', pycares.QUERY_TYPE_CNAME, self.cb)
+        wait_channel(cache)
+        self.assertEqual(self.results[-1][0].cname, 'example.com')
+        self.assertEqual(len(cache), 3)
+
+    def test_result_copies(self):
+        cache = self.cache()
+        def clear(result, errorno):
+            result.clear()
+            self.cb(result, errorno)
+        # a waiter or a hit modifying its result changes neither the others nor the cached answer
+        cache.query('example.com', pycares.QUERY_TYPE_A, clear)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        cache.query('example.com', pycares.QUERY_TYPE_A, clear)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.assertEqual([len(r) for r, _ in self.results], [0, 1, 0, 1])
+        self.assertEqual(len(self.server.queries), 1)
+
+    def test_expiry_and_eviction(self):
+        cache = self.cache(max_ttl=0.05, max_entries=1)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        time.sleep(0.06)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        self.assertEqual(len(self.server.queries), 2)
+        cache.query('example.com', pycares.QUERY_TYPE_AAAA, self.cb)
+        wait_channel(cache)
+        self.assertEqual((len(cache), cache.evictions), (1, 1))
+
+    def test_serve_stale(self):
+        cache = self.cache(max_ttl=0.05, stale_ttl=60)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        time.sleep(0.06)
+        # the upstream fails, the expired answer is served
+        self.zone.configure('example.com', drop=True)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        result, errorno = self.results[1]
+        self.assertIsNone(errorno)
+        self.assertIsInstance(result, pycares.cache.StaleResult)
+        self.assertTrue(pycares.cache.is_stale(result))
+        self.assertEqual((result[0].host, result[0].ttl), ('192.0.2.1', 30))
+        self.assertIsInstance(result[0], pycares.ares_query_a_result)
+        self.assertEqual(self.results[0][0][0].ttl, 60)
+        self.assertEqual(cache.stale, 1)
+
+    def test_stale_timeout(self):
+        cache = self.cache(max_ttl=0.05, stale_ttl=60, stale_timeout=0.02)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        time.sleep(0.06)
+        # the upstream is slow, the expired answer is served after stale_timeout and the cache
+        # is refreshed when the answer arrives
+        self.zone.configure('example.com', delay=0.1)
+        start = time.monotonic()
+        elapsed = []
+        def cb(result, errorno):
+            elapsed.append(time.monotonic() - start)
+            self.cb(result, errorno)
+        cache.query('example.com', pycares.QUERY_TYPE_A, cb)
+        wait_channel(cache)
+        self.assertEqual(len(self.results), 2)
+        self.assertTrue(pycares.cache.is_stale(self.results[1][0]))
+        self.assertLess(elapsed[0], 0.1)
+        self.zone.configure('example.com')
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.assertFalse(pycares.cache.is_stale(self.results[2][0]))
+        self.assertEqual(len(self.server.queries), 2)
+
+    def test_stale_window(self):
+        cache = self.cache(max_ttl=0.02, stale_ttl=0.02)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        time.sleep(0.05)
+        self.zone.configure('example.com', drop=True)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        self.assertEqual(self.results[1], (None, pycares.errno.ARES_ETIMEOUT))
+        self.assertEqual(len(cache), 0)
+
+
+    def test_prefetch(self):
+        cache = self.cache(max_ttl=0.1, prefetch=0.5)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        time.sleep(0.06)
+        # hit twice and in the last half of its TTL: answered from the cache and refreshed
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.assertEqual(len(self.results), 3)
+        self.assertEqual((cache.pending, cache.prefetches), (1, 1))
+        wait_channel(cache)
+        time.sleep(0.05)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.assertEqual([e for _, e in self.results], [None] * 4)
+        self.assertEqual(len(self.server.queries), 2)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+    def test_prefetch_rate(self):
+        cache = self.cache(max_ttl=0.05, prefetch=1.0, prefetch_hits=1, prefetch_rate=0.01)
+        for name in ('example.com', 'www.example.com'):
+            cache.query(name, pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        for name in ('example.com', 'www.example.com'):
+            cache.query(name, pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        self.assertEqual((cache.prefetches, cache.prefetch_throttled), (1, 1))
+        self.assertEqual(len(self.server.queries), 3)
+
+    def test_prefetch_failure(self):
+        cache = self.cache(max_ttl=0.05, prefetch=1.0, prefetch_hits=1)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        # the prefetch fails after the entry expired, without stale_ttl the waiting query
+        # gets the error
+        self.zone.configure('example.com', drop=True)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        self.assertEqual(cache.prefetches, 1)
+        time.sleep(0.06)
+        cache.query('example.com', pycares.QUERY_TYPE_A, self.cb)
+        wait_channel(cache)
+        self.assertEqual(self.results[2], (None, pycares.errno.ARES_ETIMEOUT))
+        self.assertEqual((cache.stale, len(cache)), (0, 0))
+
+
+    def scan(self, cache):
+        # two popular names, then names queried once
+        for _ in range(3):
+            for name in ('example.com', 'www.example.com'):
+                cache.query(name, pycares.QUERY_TYPE_A, self.cb)
+                wait_channel(cache)
+        for i in range(5):
+            cache.query('scan%d.example.com' % i, pycares.QUERY_TYPE_A, self.cb)
+            wait_channel(cache)
+        queries = len(self.server.queries)
+        for name in ('example.com', 'www.example.com'):
+            cache.query(name, pycares.QUERY_TYPE_A, self.cb)
+            wait_channel(cache)
+        return len(self.server.queries) - queries
+
+    def test_lru_scan(self):
+        cache = self.cache(max_entries=2)
+        self.assertEqual(self.scan(cache), 2)
+        self.assertEqual(cache.evictions, 7)
+
+    def test_tinylfu(self):
+        cache = self.cache(max_entries=2, eviction='tinylfu')
+        self.assertEqual(self.scan(cache), 0)
+        self.assertEqual((cache.rejected, cache.evictions, len(cache)), (5, 0, 2))
+        self.assertRaises(ValueError, self.cache, eviction='lfu')
+
+
+class FrequencySketchTest(unittest.TestCase):
+
+    def test_sketch(self):
+        sketch = pycares.cache.FrequencySketch(100)
+        self.assertEqual(sketch.width, 128)
+        for i in range(20):
+            sketch.increment('hot')
+        sketch.increment('cold')
+        self.assertEqual(sketch.estimate('hot'), 15)
+        self.assertGreaterEqual(sketch.estimate('cold'), 1)
+        self.assertLess(sketch.estimate('cold'), 15)
+        self.assertEqual(sketch.estimate(('example.com', 1, 1)), 0)
+        sketch.age()
+        self.assertEqual(sketch.estimate('hot'), 7)
+        sketch.reset()
+        self.assertEqual((sketch.estimate('hot'), sketch.additions), (0, 0))
+
+    def test_aging(self):
+        sketch = pycares.cache.FrequencySketch(16, sample_size=10)
+        for i in range(9):
+            sketch.increment('a')
+        self.assertEqual(sketch.estimate('a'), 9)
+        sketch.increment('a')
+        self.assertEqual((sketch.estimate('a'), sketch.additions), (5, 5))
+
+
+class RouterTest(unittest.TestCase):
+
+    def test_route(self):
+        router = pycares.router.Router({'corp': ['10.0.0.1'], 'dev.corp': '10.0.0.2', 'lab.corp': ['10.0.0.2'],
+                                        'example.com': ['10.0.0.1']}, default=['192.0.2.53'])
+        self.assertEqual(len(router.channels), 3)
+        self.assertEqual(router.route('www.corp').servers, ['10.0.0.1'])
+        self.assertEqual(router.route('a.b.dev.corp').servers, ['10.0.0.2'])
+        self.assertIs(router.route('lab.corp'), router.route('dev.corp'))
+        self.assertIs(router.route('example.com'), router.route('corp'))
+        self.assertIs(router.route('notcorp'), router.default)
+        self.assertIs(router.route('www.example.org'), router.default)
+        self.assertEqual(router.default.servers, ['192.0.2.53'])
+        self.assertEqual(router.timeout(), 0.0)
+        self.assertEqual(router.getsock(), ([], []))
+        self.assertRaises(ValueError, router.gethostbyaddr, 'not an address', lambda r, e: None)
+        self.assertRaises(TypeError, router.query, 'www.corp', pycares.QUERY_TYPE_A, None)
+        self.assertEqual(router.pending, 0)
+        self.assertRaises(ValueError, pycares.router.Router, {'.': ['10.0.0.1']})
+
+
+class NameEncodingTest(unittest.TestCase):
+
+    def test_parse_name(self):
+        self.assertEqual(pycares.utils.parse_name('www.example.com'), b'www.example.com')
+        self.assertEqual(pycares.utils.parse_name(b'www.example.com'), b'www.example.com')
+        self.assertEqual(pycares.utils.parse_name('españa.icom.museum'), b'xn--espaa-rta.icom.museum')
+        self.assertRaises(TypeError, pycares.utils.parse_name, 42)
+
+    def test_parse_name_cache(self):
+        pycares.utils._encode_idna.cache_clear()
+        pycares.utils.parse_name('españa.icom.museum')
+        pycares.utils.parse_name('españa.icom.museum')
+        pycares.utils.parse_name('www.example.com')
+        info = pycares.utils._encode_idna.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_parse_names(self):
+        names = pycares.utils.parse_names(['www.example.com', 'españa.icom.museum', b'raw.example'])
+        self.assertEqual(names, [b'www.example.com', b'xn--espaa-rta.icom.museum', b'raw.example'])
+        self.assertEqual(pycares.utils.parse_names(names), names)
+
+
+class ImportTest(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        code = 'import pycares, sys; print(",".join(m for m in ("idna", "pycares.stats") if m in sys.modules))'
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(pycares.__file__)))
+        output = subprocess.check_output([sys.executable, '-c', code], env=env, universal_newlines=True)
+        self.assertEqual(output.strip(), '')
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'module __getattr__ needs Python 3.7')
+    def test_lazy_submodules(self):
+        self.assertIs(pycares.stats, sys.modules['pycares.stats'])
+        self.assertRaises(AttributeError, getattr, pycares, 'nonexistent')
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def test_bucket(self):
+        bucket = pycares.ratelimit.TokenBucket(10, burst=2)
+        self.assertTrue(bucket.take())
+        self.assertTrue(bucket.take())
+        self.assertFalse(bucket.take())
+        self.assertGreater(bucket.delay(), 0.05)
+        self.assertLessEqual(bucket.delay(), 0.1)
+        bucket.tokens = 1.0
+        self.assertEqual(bucket.delay(), 0.0)
+        self.assertEqual(pycares.ratelimit.TokenBucket(5).burst, 5.0)
+        self.assertRaises(ValueError, pycares.ratelimit.TokenBucket, 0)
+        self.assertRaises(ValueError, pycares.ratelimit.TokenBucket, 10, 0.5)
+
+
+class LatencyHistogramTest(unittest.TestCase):
+
+    def test_percentiles(self):
+        h = pycares.stats.LatencyHistogram()
+        for i in range(1, 1001):
+            h.record(i / 1000.0)
+        self.assertEqual(h.count, 1000)
+        self.assertAlmostEqual(h.mean, 0.5005, places=3)
+        for p in (50, 90, 99):
+            self.assertAlmostEqual(h.percentile(p), p / 100.0, delta=p / 100.0 * 0.07)
+        self.assertEqual(h.percentile(100), 1.0)
+        self.assertRaises(ValueError, h.percentile, 101)
+
+    def test_small_and_huge_values(self):
+        h = pycares.stats.LatencyHistogram()
+        h.record(0)
+        h.record(0.000005)
+        h.record(10 ** 6)
+        self.assertEqual(h.percentile(1), 0.0)
+        self.assertEqual(h.count_at_or_below(0.00001), 2)
+        self.assertEqual(len(list(h.buckets())), 3)
+
+    def test_merge(self):
+        a = pycares.stats.LatencyHistogram()
+        b = pycares.stats.LatencyHistogram()
+        a.record(0.001)
+        b.record(0.002)
+        b.record(0.003)
+        a.merge(b)
+        self.assertEqual(a.count, 3)
+        self.assertAlmostEqual(a.sum, 0.006)
+        self.assertEqual(a.min, 1000)
+        self.assertEqual(a.max, 3000)
+        a.reset()
+        self.assertEqual(a.count, 0)
+        self.assertEqual(a.percentile(50), 0.0)
+
+
+class OpenMetricsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stats = pycares.stats.ChannelStats()
+        self.stats.submitted = 3
+        self.stats.record('8.8.8.8', 'A', 0.003, None)
+        self.stats.record('8.8.8.8', 'A', 0.2, pycares.errno.ARES_ETIMEOUT, 2)
+
+    def test_render(self):
+        text = pycares.openmetrics.render(self.stats)
+        lines = text.splitlines()
+        self.assertEqual(lines[-1], '# EOF')
+        self.assertIn('pycares_queries_total 3', lines)
+        self.assertIn('pycares_queries_inflight 1', lines)
+        self.assertIn('pycares_query_timeouts_total 2', lines)
+        self.assertIn('pycares_queries_throttled_total 0', lines)
+        self.assertIn('pycares_query_errors_total{error="ARES_ETIMEOUT"} 1', lines)
+        self.assertIn('pycares_query_duration_seconds_bucket{server="8.8.8.8",type="A",le="0.005"} 1', lines)
+        self.assertIn('pycares_query_duration_seconds_bucket{server="8.8.8.8",type="A",le="0.25"} 2', lines)
+        self.assertIn('pycares_query_duration_seconds_bucket{server="8.8.8.8",type="A",le="+Inf"} 2', lines)
+        self.assertIn('pycares_query_duration_seconds_count{server="8.8.8.8",type="A"} 2', lines)
+
+    def test_render_named(self):
+        text = pycares.openmetrics.render({'ext"ernal': self.stats}, prefix='dns')
+        self.assertIn('dns_queries_total{channel="ext\\"ernal"} 3', text.splitlines())
+
+    def test_http_server(self):
+        server = pycares.openmetrics.start_http_server(self.stats)
+        try:
+            url = 'http://127.0.0.1:%d/metrics' % server.server_address[1]
+            with urllib.request.urlopen(url) as r:
+                self.assertEqual(r.headers['Content-Type'], pycares.openmetrics.CONTENT_TYPE)
+                self.assertEqual(r.read().decode('utf-8'), pycares.openmetrics.render(self.stats))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def traced_allocations(func, n):
+    # Bytes allocated through the Python allocators, and still alive, per item
+    # for func(n). Memory c-ares allocates with malloc is not traced.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        keep = func(n)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / n
+
+
+class _Record:
+    __slots__ = ('name', 'ttl')
+
+
+def reference_records(n):
+    # Records shaped like the query results, whose size the memory budgets
+    # are scaled by.
+    records = []
+    for i in range(n):
+        record = _Record()
+        record.name = 'host%06d.example.com' % i
+        record.ttl = 300 + i * 1000
+        records.append(record)
+    return records
+
+
+class MemoryTest(unittest.TestCase):
+    # Budgets are ~1.5x what CPython 3.11 uses on 64 bit Linux, in bytes, where
+    # a reference record takes REFERENCE bytes. They are scaled by what the
+    # reference record takes in the running interpreter.
+    REFERENCE = 160
+    INFLIGHT_BUDGET = 512
+    INFLIGHT_STATS_BUDGET = 768
+    RECORD_BUDGETS = {
+        'A': (pycares.QUERY_TYPE_A, '192.0.2.1', 224),
+        'AAAA': (pycares.QUERY_TYPE_AAAA, '2001:db8::1', 224),
+        'CNAME': (pycares.QUERY_TYPE_CNAME, 'target.example.com', 192),
+        'MX': (pycares.QUERY_TYPE_MX, (10, 'mx.example.com'), 240),
+        'NAPTR': (pycares.QUERY_TYPE_NAPTR, (10, 20, 'S', 'SIP+D2U', '', '_sip._udp.example.com'), 384),
+        'NS': (pycares.QUERY_TYPE_NS, 'ns1.example.com', 192),
+        'PTR': (pycares.QUERY_TYPE_PTR, 'host.example.com', 128),
+        'SOA': (pycares.QUERY_TYPE_SOA, ('ns1.example.com', 'hostmaster.example.com', 1, 2, 3, 4, 5), 416),
+        'SRV': (pycares.QUERY_TYPE_SRV, (1, 2, 5060, 'sip.example.com'), 256),
+        'TXT': (pycares.QUERY_TYPE_TXT, 'v=spf1 -all', 224),
+    }
+    HOST_BUDGET = 480
+    NAMEINFO_BUDGET = 192
+
+    def setUp(self):
+        # A server which never answers, so queries stay in flight.
+        self.sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sink.bind(('127.0.0.1', 0))
+        self.port = self.sink.getsockname()[1]
+        self.scale = traced_allocations(reference_records, 1000) / self.REFERENCE
+
+    def tearDown(self):
+        self.sink.close()
+
+    def assertWithinBudget(self, used, budget, what):
+        self.assertLess(used, budget * self.scale, '%s uses %d bytes' % (what, used))
+
+    def inflight(self, **kwargs):
+        channel = pycares.Channel(servers=['127.0.0.1'], udp_port=self.port, tcp_port=self.port, timeout=60.0, tries=1, **kwargs)
+        errors = []
+        def cb(result, errorno):
+            errors.append(errorno)
+        # the first query allocates the socket and the channel's internal state
+        channel.query('warmup.example.com', pycares.QUERY_TYPE_A, cb)
+        global_set = len(pycares._global_set)
+        def submit(n):
+            for i in range(n):
+                channel.query('q%d.example.com' % i, pycares.QUERY_TYPE_A, cb)
+        used = traced_allocations(submit, 2000)
+        self.assertEqual(len(pycares._global_set), global_set + 2000)
+        channel.cancel()
+        self.assertEqual(len(pycares._global_set), global_set - 1)
+        self.assertEqual(errors, [pycares.errno.ARES_ECANCELLED] * 2001)
+        return used
+
+    def test_inflight_query(self):
+        used = self.inflight()
+        self.assertWithinBudget(used, self.INFLIGHT_BUDGET, 'in-flight query')
+
+    def test_inflight_query_stats(self):
+        used = self.inflight(stats=pycares.stats.ChannelStats())
+        self.assertWithinBudget(used, self.INFLIGHT_STATS_BUDGET, 'in-flight query with stats')
+
+    def test_query_results(self):
+        for name, (query_type, value, budget) in sorted(self.RECORD_BUDGETS.items()):
+            if query_type in (pycares.QUERY_TYPE_CNAME, pycares.QUERY_TYPE_SOA):
+                values = [value]
+            elif query_type == pycares.QUERY_TYPE_PTR:
+                # one result, the names of the other records are its aliases
+                values = ['%d.%s' % (i, value) for i in range(100)]
+            else:
+                values = [value] * 100
+            question = dns.Question(0, 0x0100, 'example.com', query_type, dns.CLASS_IN)
+            reply = dns.build_response(question, [('example.com', query_type, 300, v) for v in values])
+            result = pycares.parse_result(query_type, reply, len(reply))[0]
+            if query_type == pycares.QUERY_TYPE_PTR:
+                self.assertEqual(len(result.aliases), 100)
+            def parse(n):
+                return [pycares.parse_result(query_type, reply, len(reply))[0] for _ in range(n)]
+            used = traced_allocations(parse, 100) / len(values)
+            self.assertWithinBudget(used, budget, '%s record' % name)
+
+    def test_host_result(self):
+        channel = pycares.Channel(lookups='f')
+        def gethostbyname(n):
+            results = []
+            for _ in range(n):
+                channel.gethostbyname('localhost', socket.AF_INET, lambda result, errorno: results.append(result))
+            self.assertIsInstance(results[-1], pycares.ares_host_result)
+            return results
+        used = traced_allocations(gethostbyname, 100)
+        self.assertWithinBudget(used, self.HOST_BUDGET, 'host result')
+
+    def test_nameinfo_result(self):
+        channel = pycares.Channel()
+        def getnameinfo(n):
+            results = []
+            for _ in range(n):
+                channel.getnameinfo(('127.0.0.1', 80), pycares.ARES_NI_NUMERICHOST, lambda result, errorno: results.append(result))
+            self.assertIsInstance(results[-1], pycares.ares_nameinfo_result)
+            return results
+        used = traced_allocations(getnameinfo, 100)
+        self.assertWithinBudget(used, self.NAMEINFO_BUDGET, 'nameinfo result')
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)